@@ -43,6 +43,20 @@ connection_args = OrderedDict(
         'label': 'Hub ID',
         'required': False,
     },
+    properties_cache_ttl={
+        'type': ARG_TYPE.INT,
+        'description': 'Seconds to cache HubSpot property definitions (default: 172800, i.e. 48 hours)',
+        'label': 'Properties Cache TTL',
+        'required': False,
+    },
+    row_cache_ttl={
+        'type': ARG_TYPE.INT,
+        'description': 'Seconds to reuse complete table reads, refreshing them with only the records modified '
+                       'since, filtered search results and the associations of each object (default: 0, disabled). '
+                       'Records deleted in HubSpot can be returned until the next full read.',
+        'label': 'Row Cache TTL',
+        'required': False,
+    },
 
     # OAuth2 Code Flow Parameters (for future use)
     code={
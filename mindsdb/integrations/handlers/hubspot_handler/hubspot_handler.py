@@ -1,16 +1,22 @@
 import base64
+import sys
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Callable, FrozenSet, Iterable, Optional, Tuple
 
+import pandas as pd
 import requests
 import time
 from hubspot import HubSpot
+from hubspot.discovery.discovery_base import DiscoveryBase
 
 from mindsdb.integrations.handlers.hubspot_handler.utils.rate_limiter import (
     with_retry,
-    handle_hubspot_error
+    handle_hubspot_error,
+    TokenBucket
 )
+from mindsdb.integrations.handlers.hubspot_handler.utils.properties_cache import PropertiesCacheEntry, PropertyInfo
 from mindsdb.integrations.handlers.hubspot_handler.tables.crm.companies_table import CompaniesTable
 from mindsdb.integrations.handlers.hubspot_handler.tables.crm.contacts_table import ContactsTable
 from mindsdb.integrations.handlers.hubspot_handler.tables.crm.deals_table import DealsTable
@@ -51,6 +57,26 @@ class HubspotHandler(APIHandler):
     name = 'hubspot'
     _refresh_lock = threading.Lock()
 
+    # Object types whose property definitions are used by the registered tables
+    PROPERTIES_OBJECT_TYPES = (
+        'companies', 'contacts', 'deals', 'tickets', 'line_items', 'quotes', 'products',
+        'calls', 'emails', 'meetings', 'notes', 'tasks', 'leads',
+    )
+    # Threads fetching property definitions in the background (warm-up and refresh-ahead)
+    PROPERTIES_MAX_WORKERS = 8
+    # Threads refreshing stale search results in the background
+    SEARCH_REFRESH_MAX_WORKERS = 2
+    # Threads sending batch write requests, shared by all the statements run on this handler;
+    # kept low to stay under the 100 requests / 10 seconds limit
+    BATCH_MAX_WORKERS = 4
+    # Search results kept in the search cache; the least recently refreshed are dropped first
+    SEARCH_CACHE_MAX_ENTRIES = 128
+    # Objects whose associations to one object type are kept in the association cache
+    ASSOCIATION_CACHE_MAX_ENTRIES = 1024
+    # Connections kept open per API instance; an instance is shared by every thread using that API,
+    # and the SDK default (5 per CPU) is below the number of workers on small machines
+    CONNECTION_POOL_MAXSIZE = 16
+
     def __init__(self, name: str, **kwargs):
         """
         Initialize the handler.
@@ -78,11 +104,63 @@ class HubspotHandler(APIHandler):
 
         self.connection = None
         self.is_connected = False
+        # Expiry of the access token the client was built with, if the token can be refreshed
+        self._token_expires_at = None
+
+        # API instances built for the client, reused so every request goes through the same
+        # connection pool instead of opening a new one (and a new TLS session) per call
+        # Format: {(api package name, api name): api instance}
+        self._apis: Dict[Tuple[str, str], Any] = {}
+        self._apis_lock = threading.Lock()
 
         # Properties cache (shared across all tables)
-        # Format: {object_type: {'properties': [...], 'timestamp': float}}
-        self._properties_cache = {}
-        self._properties_cache_ttl = 3600  # 1 hour in seconds
+        # Format: {object_type: PropertiesCacheEntry}
+        self._properties_cache: Dict[str, PropertiesCacheEntry] = {}
+        # Property definitions change rarely (schema edits in the HubSpot UI), so they are kept for
+        # 48 hours by default; INSERTs referencing unknown columns invalidate the entry early
+        self._properties_cache_ttl = int(connection_data.get('properties_cache_ttl', 48 * 3600))
+        # Entries older than this fraction of the TTL are refreshed in the background
+        # while the current entry keeps being served (refresh-ahead)
+        self._properties_refresh_ahead_ratio = 0.8
+        # Entries are served stale (while refreshing) up to this fraction of the TTL
+        self._properties_stale_ratio = 1.2
+        self._properties_cache_lock = threading.Lock()
+        self._properties_refresh_futures: Dict[str, Future] = {}
+        self._properties_executor = None
+
+        # Complete reads of object tables kept for incremental refresh, disabled unless `row_cache_ttl` is set
+        # Format: {(object_type, frozenset of properties): (DataFrame, time of the full read)}
+        self.row_cache: Dict[Tuple[str, FrozenSet[str]], Tuple[pd.DataFrame, float]] = {}
+        self.row_cache_ttl = int(connection_data.get('row_cache_ttl', 0))
+        # Search results, also cached only when `row_cache_ttl` is set: served fresh for `row_cache_ttl`
+        # seconds, then served stale for as long again while they are refreshed in the background
+        # Format: {(object_type, filters, properties, limit, sorts): (DataFrame, time of the search)}
+        self.search_cache: Dict[Tuple, Tuple[pd.DataFrame, float]] = {}
+        self._search_cache_lock = threading.Lock()
+        self._search_refresh_futures: Dict[Tuple, Future] = {}
+        # Uncached searches currently running, shared with identical searches started meanwhile
+        self._shared_searches: Dict[Tuple, Future] = {}
+        self._search_executor = None
+        # Created on the first multi-batch write and reused by the following ones
+        self._batch_executor = None
+        self._batch_executor_lock = threading.Lock()
+        # Bumped by every invalidation of an object type, so a refresh that started before a write
+        # does not store results that predate it
+        self._row_cache_generations: Dict[str, int] = {}
+        # Associations of single objects, also cached only when `row_cache_ttl` is set
+        # Format: {(from_object_type, from_object_id, to_object_type): ((to_object_id, type id, label), ...), time)}
+        self.association_cache: Dict[Tuple[str, str, str], Tuple[Tuple[Tuple, ...], float]] = {}
+        self._association_cache_lock = threading.Lock()
+        # Bumped by every invalidation, so a read that started before a write does not store associations
+        # that predate it
+        self._association_cache_generation = 0
+
+        # Client-side rate limits shared by all tables: HubSpot allows 100 requests per 10 seconds
+        # on the CRM APIs and only a few requests per second on the search endpoints
+        self.rate_limiters = {
+            'core': TokenBucket(100, 10),
+            'search': TokenBucket(4, 1),
+        }
 
         # Core CRM Objects
         companies_data = CompaniesTable(self)
@@ -159,7 +237,10 @@ class HubspotHandler(APIHandler):
             Exception: If connection fails (invalid token, network issues, etc.)
         """
         if self.is_connected is True:
-            return self.connection
+            if not (self._token_expires_at and self._is_token_expired({"expires_at": self._token_expires_at})):
+                return self.connection
+            # The client is reused across queries, so it is rebuilt once its token is about to expire
+            logger.info("HubSpot access token is about to expire, reconnecting with a refreshed token")
 
         try:
             # Get valid access token (with refresh if needed)
@@ -170,15 +251,46 @@ class HubspotHandler(APIHandler):
                 self.hub_id = token_data["hub_id"]
 
             # Create HubSpot API client with access token
-            self.connection = HubSpot(access_token=token_data["access_token"])
+            with self._apis_lock:
+                self._apis = {}
+            self.connection = HubSpot(
+                access_token=token_data["access_token"],
+                api_factory=self._get_api,
+                connection_pool_maxsize=self.CONNECTION_POOL_MAXSIZE,
+            )
             self.is_connected = True
+            can_refresh = token_data.get("refresh_token") and self.client_id and self.client_secret
+            self._token_expires_at = token_data.get("expires_at") if can_refresh else None
 
         except Exception as e:
             logger.error(f'Error connecting to HubSpot: {e}')
             raise
 
+        self.warm_properties_cache()
         return self.connection
 
+    def _get_api(self, api_client_package: Any, api_name: str, config: Dict[str, Any]) -> Any:
+        """API factory of the HubSpot client, reusing one API instance per API class.
+
+        The SDK builds a new API instance, with its own connection pool, every time an API
+        such as `crm.companies.basic_api` is accessed.
+
+        Args:
+            api_client_package: SDK package of the API (e.g. hubspot.crm.companies)
+            api_name: Name of the API class in the package (e.g. 'BasicApi')
+            config: Client configuration (access token, retries, ...)
+
+        Returns:
+            The API instance
+        """
+        key = (api_client_package.__name__, api_name)
+        with self._apis_lock:
+            api = self._apis.get(key)
+            if api is None:
+                api = DiscoveryBase._default_api_factory(api_client_package, api_name, config)
+                self._apis[key] = api
+        return api
+
     def _get_valid_token(self) -> Dict[str, Any]:
         """
         Get a valid access token, refreshing if necessary.
@@ -500,31 +612,91 @@ class HubspotHandler(APIHandler):
         ast = parse_sql(query)
         return self.query(ast)
 
-    def get_properties_cache(self, object_type: str) -> dict:
+    def get_properties_cache(self, object_type: str) -> PropertiesCacheEntry:
         """
         Get cached property definitions for a specific HubSpot object type.
-        Caches for 1 hour to avoid repeated API calls.
+        Caches for `properties_cache_ttl` seconds (48 hours by default) to avoid repeated API calls.
+
+        Entries close to expiry are refreshed in a background thread while the cached entry
+        keeps being served, so callers only block on the API when there is no usable entry.
+        Concurrent callers without a usable entry share a single in-flight request.
 
         Args:
             object_type (str): The HubSpot object type ('contacts', 'companies', 'deals')
 
         Returns:
-            dict: {
-                'properties': list of property definitions with name, label, type, etc.,
-                'property_names': set of property names for quick lookup,
-                'timestamp': cache timestamp
-            }
+            PropertiesCacheEntry: Property definitions (`properties`), frozenset of property names
+                for quick lookup (`property_names`) and cache timestamp (`timestamp`)
         """
-        # Check if cache is valid
-        current_time = time.time()
-        if object_type in self._properties_cache:
-            cache_entry = self._properties_cache[object_type]
-            cache_age = current_time - cache_entry['timestamp']
-            if cache_age < self._properties_cache_ttl:
-                logger.info(f"Using cached properties for {object_type} (age: {cache_age:.0f}s)")
+        cache_entry = self._properties_cache.get(object_type)
+        if cache_entry is not None:
+            cache_age = time.time() - cache_entry.timestamp
+            if cache_age < self._properties_cache_ttl * self._properties_refresh_ahead_ratio:
+                logger.debug(f"Using cached properties for {object_type} (age: {cache_age:.0f}s)")
                 return cache_entry
 
-        # Fetch fresh metadata from API
+            if cache_age < self._properties_cache_ttl * self._properties_stale_ratio:
+                logger.debug(f"Refreshing properties for {object_type} in background (age: {cache_age:.0f}s)")
+                self._schedule_properties_refresh(object_type)
+                return cache_entry
+
+        # No usable entry: wait for the fetch already in flight (warm-up, refresh or another
+        # caller's miss) instead of issuing a duplicate request
+        return self._schedule_properties_refresh(object_type).result()
+
+    def warm_properties_cache(self, object_types: Optional[Iterable[str]] = None) -> None:
+        """
+        Fetch the property definitions of object types that are not cached yet, concurrently
+        and in the background, so the first query on each table does not wait for them.
+
+        Args:
+            object_types (Iterable[str], optional): Object types to warm. Defaults to PROPERTIES_OBJECT_TYPES.
+        """
+        for object_type in object_types or self.PROPERTIES_OBJECT_TYPES:
+            if object_type not in self._properties_cache:
+                self._schedule_properties_refresh(object_type)
+
+    def _schedule_properties_refresh(self, object_type: str) -> Future:
+        """
+        Refresh the property definitions of an object type in a background thread.
+        At most one refresh per object type is in flight at any time.
+
+        Args:
+            object_type (str): The HubSpot object type to refresh
+
+        Returns:
+            Future: The in-flight refresh, resolving to the new cache entry
+        """
+        with self._properties_cache_lock:
+            if object_type in self._properties_refresh_futures:
+                return self._properties_refresh_futures[object_type]
+            if self._properties_executor is None:
+                self._properties_executor = ThreadPoolExecutor(
+                    max_workers=self.PROPERTIES_MAX_WORKERS,
+                    thread_name_prefix='hubspot-properties'
+                )
+            future = self._properties_executor.submit(self._fetch_properties, object_type)
+            self._properties_refresh_futures[object_type] = future
+
+        def on_done(_):
+            with self._properties_cache_lock:
+                self._properties_refresh_futures.pop(object_type, None)
+
+        future.add_done_callback(on_done)
+        return future
+
+    def _fetch_properties(self, object_type: str) -> dict:
+        """
+        Fetch property definitions from the HubSpot API and store them in the cache.
+
+        Args:
+            object_type (str): The HubSpot object type
+
+        Returns:
+            PropertiesCacheEntry: The new cache entry; if the API call fails, the current (stale)
+                entry if any, otherwise an empty entry
+        """
+        current_time = time.time()
         logger.info(f"Fetching properties for {object_type} from HubSpot API")
         try:
             hubspot = self.connect()
@@ -535,43 +707,237 @@ class HubspotHandler(APIHandler):
                 object_type=object_type
             )
 
-            # Extract property information
-            properties = []
-            property_names = set()
-
-            for prop in properties_response.results:
-                property_info = {
-                    'name': prop.name,
-                    'label': prop.label,
-                    'type': prop.type,
-                    'fieldType': prop.field_type,
-                    'description': getattr(prop, 'description', ''),
-                    'groupName': prop.group_name,
-                    'hidden': getattr(prop, 'hidden', False),
-                    'hubspotDefined': getattr(prop, 'hubspot_defined', True),
-                }
-                properties.append(property_info)
-                property_names.add(prop.name)
-
-            # Cache the results
-            cache_entry = {
-                'properties': properties,
-                'property_names': property_names,
-                'timestamp': current_time
-            }
-            self._properties_cache[object_type] = cache_entry
+            # Extract property information. Names are interned so the copies held by the cache
+            # entry and by the column lists built from it are a single string object
+            properties = tuple(
+                PropertyInfo(
+                    name=sys.intern(prop.name),
+                    label=prop.label,
+                    type=prop.type,
+                    field_type=prop.field_type,
+                    description=getattr(prop, 'description', ''),
+                    group_name=prop.group_name,
+                    hidden=getattr(prop, 'hidden', False),
+                    hubspot_defined=getattr(prop, 'hubspot_defined', True),
+                )
+                for prop in properties_response.results
+            )
+
+            # Cache the results; the entry is replaced as a whole so readers never see a partial update,
+            # and the names are frozen so the entry can be shared between threads without copying
+            cache_entry = PropertiesCacheEntry(
+                properties=properties,
+                property_names=frozenset(property_info.name for property_info in properties),
+                timestamp=current_time
+            )
+            with self._properties_cache_lock:
+                self._properties_cache[object_type] = cache_entry
 
             logger.info(f"Cached {len(properties)} properties for {object_type}")
             return cache_entry
 
         except Exception as e:
             logger.error(f"Error fetching properties for {object_type}: {e}")
+            stale_entry = self._properties_cache.get(object_type)
+            if stale_entry is not None:
+                return stale_entry
             # Return empty cache on error
-            return {
-                'properties': [],
-                'property_names': set(),
-                'timestamp': current_time
-            }
+            return PropertiesCacheEntry(properties=(), property_names=frozenset(), timestamp=current_time)
+
+    def invalidate_row_cache(self, object_type: str) -> None:
+        """
+        Drop the cached reads of an object type, e.g. after rows have been written.
+
+        Args:
+            object_type (str): The object type to invalidate
+        """
+        for key in [key for key in self.row_cache if key[0] == object_type]:
+            self.row_cache.pop(key, None)
+        with self._search_cache_lock:
+            self._row_cache_generations[object_type] = self._row_cache_generations.get(object_type, 0) + 1
+            for key in [key for key in self.search_cache if key[0] == object_type]:
+                self.search_cache.pop(key, None)
+
+    def schedule_search_refresh(self, key: Tuple, search: Callable[[], pd.DataFrame]) -> Future:
+        """
+        Run a search in a background thread and store its results in the search cache.
+        At most one refresh per cache entry is in flight at any time.
+
+        Args:
+            key (tuple): Search cache key; its first item is the object type
+            search (Callable): Runs the search and returns its results
+
+        Returns:
+            Future: The in-flight refresh, resolving to the search results
+        """
+        with self._search_cache_lock:
+            if key in self._search_refresh_futures:
+                return self._search_refresh_futures[key]
+            if self._search_executor is None:
+                self._search_executor = ThreadPoolExecutor(
+                    max_workers=self.SEARCH_REFRESH_MAX_WORKERS,
+                    thread_name_prefix='hubspot-search'
+                )
+            generation = self._row_cache_generations.get(key[0], 0)
+            future = self._search_executor.submit(self._refresh_search, key, search, generation)
+            self._search_refresh_futures[key] = future
+
+        def on_done(_):
+            with self._search_cache_lock:
+                self._search_refresh_futures.pop(key, None)
+
+        future.add_done_callback(on_done)
+        return future
+
+    def submit_batch(self, fn: Callable, *args) -> Future:
+        """
+        Run a batch request on the handler's batch thread pool.
+
+        The pool is created once per handler rather than once per statement, and its size bounds
+        the batch requests in flight across all the statements running on the handler.
+
+        Args:
+            fn (Callable): Sends one batch request
+            *args: Arguments of `fn`
+
+        Returns:
+            Future: The pending request, resolving to the result of `fn`
+        """
+        with self._batch_executor_lock:
+            if self._batch_executor is None:
+                self._batch_executor = ThreadPoolExecutor(
+                    max_workers=self.BATCH_MAX_WORKERS,
+                    thread_name_prefix='hubspot-batch'
+                )
+        return self._batch_executor.submit(fn, *args)
+
+    def _refresh_search(self, key: Tuple, search: Callable[[], pd.DataFrame], generation: int) -> pd.DataFrame:
+        """
+        Run a search and store its results in the search cache, unless the object type was
+        invalidated since the refresh was scheduled.
+
+        Args:
+            key (tuple): Search cache key; its first item is the object type
+            search (Callable): Runs the search and returns its results
+            generation (int): Invalidation generation of the object type when the refresh was scheduled
+
+        Returns:
+            pd.DataFrame: The search results
+        """
+        df = search()
+        with self._search_cache_lock:
+            if self._row_cache_generations.get(key[0], 0) == generation:
+                # Re-inserted so the dict stays ordered from the least to the most recently refreshed
+                self.search_cache.pop(key, None)
+                self.search_cache[key] = (df, time.time())
+                while len(self.search_cache) > self.SEARCH_CACHE_MAX_ENTRIES:
+                    self.search_cache.pop(next(iter(self.search_cache)))
+        return df
+
+    def run_shared_search(self, key: Tuple, search: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        """
+        Run a search in the calling thread, unless an identical search is already running, in which
+        case its results are awaited instead. The results are not cached.
+
+        Args:
+            key (tuple): Search cache key; its first item is the object type
+            search (Callable): Runs the search and returns its results
+
+        Returns:
+            pd.DataFrame: The search results, shared by every caller of the same search
+        """
+        with self._search_cache_lock:
+            future = self._shared_searches.get(key)
+            if future is None:
+                future = self._shared_searches[key] = Future()
+                owner = True
+            else:
+                owner = False
+        if not owner:
+            return future.result()
+
+        try:
+            df = search()
+            future.set_result(df)
+            return df
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._search_cache_lock:
+                self._shared_searches.pop(key, None)
+
+    def get_cached_associations(
+        self, from_object_type: str, to_object_type: str, from_object_ids: Iterable[str]
+    ) -> Tuple[Dict[str, Tuple[Tuple, ...]], int]:
+        """
+        Look up the cached associations of objects to an object type.
+
+        Args:
+            from_object_type (str): Source object type
+            to_object_type (str): Destination object type
+            from_object_ids (Iterable[str]): Source object IDs
+
+        Returns:
+            Tuple[Dict[str, tuple], int]: The cached (to_object_id, type id, label) rows of each source
+                object that has fresh ones, and the invalidation generation to pass to `cache_associations`
+        """
+        with self._association_cache_lock:
+            generation = self._association_cache_generation
+            if not self.row_cache_ttl:
+                return {}, generation
+
+            current_time = time.time()
+            cached = {}
+            for from_object_id in from_object_ids:
+                entry = self.association_cache.get((from_object_type, from_object_id, to_object_type))
+                if entry is not None and current_time - entry[1] < self.row_cache_ttl:
+                    cached[from_object_id] = entry[0]
+            return cached, generation
+
+    def cache_associations(
+        self,
+        from_object_type: str,
+        to_object_type: str,
+        rows_by_id: Dict[str, Tuple[Tuple, ...]],
+        generation: int
+    ) -> None:
+        """
+        Store the associations read for objects, unless the cache was invalidated since the read started.
+
+        Args:
+            from_object_type (str): Source object type
+            to_object_type (str): Destination object type
+            rows_by_id (Dict[str, tuple]): (to_object_id, type id, label) rows of each source object
+            generation (int): Invalidation generation returned by `get_cached_associations` before the read
+        """
+        if not self.row_cache_ttl:
+            return
+
+        current_time = time.time()
+        with self._association_cache_lock:
+            if generation != self._association_cache_generation:
+                return
+            for from_object_id, rows in rows_by_id.items():
+                key = (from_object_type, from_object_id, to_object_type)
+                # Re-inserted so the dict stays ordered from the least to the most recently read
+                self.association_cache.pop(key, None)
+                self.association_cache[key] = (rows, current_time)
+            while len(self.association_cache) > self.ASSOCIATION_CACHE_MAX_ENTRIES:
+                self.association_cache.pop(next(iter(self.association_cache)))
+
+    def invalidate_association_cache(self, objects: Iterable[Tuple[str, str]]) -> None:
+        """
+        Drop the cached associations of objects, in either direction, e.g. after associations were written.
+
+        Args:
+            objects (Iterable[Tuple[str, str]]): (object type, object ID) of every object whose associations changed
+        """
+        objects = set(objects)
+        with self._association_cache_lock:
+            self._association_cache_generation += 1
+            for key in [key for key in self.association_cache if (key[0], key[1]) in objects]:
+                self.association_cache.pop(key, None)
 
     def invalidate_properties_cache(self, object_type: str = None):
         """
@@ -580,10 +946,11 @@ class HubspotHandler(APIHandler):
         Args:
             object_type (str, optional): The object type to invalidate. If None, invalidates all.
         """
-        if object_type:
-            if object_type in self._properties_cache:
-                del self._properties_cache[object_type]
-                logger.info(f"Invalidated properties cache for {object_type}")
-        else:
-            self._properties_cache = {}
-            logger.info("Invalidated all properties cache")
+        with self._properties_cache_lock:
+            if object_type:
+                if object_type in self._properties_cache:
+                    del self._properties_cache[object_type]
+                    logger.info(f"Invalidated properties cache for {object_type}")
+            else:
+                self._properties_cache = {}
+                logger.info("Invalidated all properties cache")
@@ -5,6 +5,7 @@ from hubspot.crm.objects import (
     SimplePublicObjectBatchInput as HubSpotObjectBatchInput,
     SimplePublicObjectInputForCreate as HubSpotObjectInputCreate,
     BatchInputSimplePublicObjectId as HubSpotBatchObjectIdInput,
+    BatchReadInputSimplePublicObjectId as HubSpotBatchReadInput,
     BatchInputSimplePublicObjectBatchInput as HubSpotBatchObjectBatchInput,
     BatchInputSimplePublicObjectBatchInputForCreate as HubSpotBatchObjectInputCreate,
 )
@@ -12,13 +13,11 @@ from hubspot.crm.objects import (
 from mindsdb_sql_parser import ast
 from mindsdb.integrations.libs.api_handler import APITable
 from mindsdb.integrations.utilities.handlers.query_utilities import (
-    INSERTQueryParser,
     SELECTQueryParser,
     UPDATEQueryParser,
     DELETEQueryParser,
     SELECTQueryExecutor,
     UPDATEQueryExecutor,
-    DELETEQueryExecutor,
 )
 from mindsdb.utilities import log
 from mindsdb.integrations.handlers.hubspot_handler.tables.crm.base_hubspot_table import HubSpotSearchMixin
@@ -30,11 +29,23 @@ class AppointmentsTable(HubSpotSearchMixin, APITable):
     """Hubspot Appointments table."""
 
     # Default essential properties to fetch
-    DEFAULT_PROPERTIES = [
+    DEFAULT_PROPERTIES = (
         'hs_timestamp', 'hs_meeting_title', 'hs_meeting_body', 'hs_meeting_start_time',
         'hs_meeting_end_time', 'hs_meeting_outcome', 'hubspot_owner_id',
         'createdate', 'hs_lastmodifieddate'
-    ]
+    )
+
+    # Columns accepted by INSERT when the property definitions cannot be loaded
+    INSERT_FALLBACK_COLUMNS = frozenset(
+        {'hs_timestamp', 'hs_meeting_title', 'hs_meeting_start_time', 'hs_meeting_end_time'}
+    )
+
+    # HubSpot types of the default properties that are returned as typed columns instead of strings
+    PROPERTY_TYPES = {
+        'hs_timestamp': 'datetime',
+        'createdate': 'datetime',
+        'hs_lastmodifieddate': 'datetime',
+    }
 
     def select(self, query: ast.Select) -> pd.DataFrame:
         """Pulls Hubspot Appointments data"""
@@ -49,26 +60,42 @@ class AppointmentsTable(HubSpotSearchMixin, APITable):
         if selected_columns and len(selected_columns) > 0:
             requested_properties = [col for col in selected_columns if col != 'id']
 
-        if where_conditions and len(where_conditions) > 0:
-            hubspot_filters = self._build_search_filters(where_conditions)
-            if hubspot_filters:
-                logger.info(f"Using HubSpot search API with {len(hubspot_filters)} filter(s)")
-                df = pd.json_normalize(
-                    self.search_objects(
-                        filters=hubspot_filters,
-                        properties=requested_properties,
-                        limit=result_limit
-                    )
-                )
-                where_conditions = []
-            else:
-                logger.info("No valid HubSpot filters, using get_all")
-                df = pd.json_normalize(
-                    self.get_objects(limit=result_limit, properties=requested_properties)
-                )
+        if self._is_unsatisfiable(where_conditions):
+            logger.info("WHERE conditions can never be met, skipping the HubSpot API")
+            properties = [column for column in selected_columns if column != 'id']
+            return self._objects_to_dataframe([], properties, self.PROPERTY_TYPES)[selected_columns]
+
+        object_ids = self._get_id_values(where_conditions)
+        hubspot_filters = self._build_search_filters(where_conditions) if where_conditions else []
+
+        if object_ids is not None:
+            logger.info(f"Reading {len(object_ids)} appointment(s) by ID")
+            df = self.read_objects(object_ids[:result_limit], properties=requested_properties)
+            where_conditions = []
+        elif hubspot_filters:
+            logger.info(f"Using HubSpot search API with {len(hubspot_filters)} filter(s)")
+            hubspot_sorts = self._build_search_sorts(order_by_conditions)
+            df = self._search_with_cache(
+                'appointments',
+                self.search_objects,
+                filters=hubspot_filters,
+                properties=requested_properties,
+                limit=result_limit,
+                sorts=hubspot_sorts,
+            )
+            where_conditions = []
+            if hubspot_sorts:
+                # HubSpot already returned the rows in order, sorted by the property's type
+                order_by_conditions = []
         else:
-            df = pd.json_normalize(
-                self.get_objects(limit=result_limit, properties=requested_properties)
+            if where_conditions:
+                logger.info("No valid HubSpot filters, using get_all")
+            df = self._get_rows_incrementally(
+                'appointments',
+                self._resolve_properties('appointments', requested_properties),
+                result_limit,
+                self.get_objects,
+                self.search_objects,
             )
 
         select_statement_executor = SELECTQueryExecutor(
@@ -81,20 +108,12 @@ class AppointmentsTable(HubSpotSearchMixin, APITable):
 
     def insert(self, query: ast.Insert) -> None:
         """Inserts data into HubSpot Appointments"""
-        try:
-            properties_cache = self.handler.get_properties_cache('appointments')
-            supported_columns = list(properties_cache['property_names'])
-        except Exception as e:
-            logger.warning(f"Failed to get dynamic columns for insert: {e}")
-            supported_columns = ['hs_timestamp', 'hs_meeting_title', 'hs_meeting_start_time', 'hs_meeting_end_time']
-
-        insert_statement_parser = INSERTQueryParser(
+        data = self._parse_insert_query(
             query,
-            supported_columns=supported_columns,
+            'appointments',
+            fallback_columns=self.INSERT_FALLBACK_COLUMNS,
             mandatory_columns=[],
-            all_mandatory=False,
         )
-        data = insert_statement_parser.parse_query()
         self.create_objects(data)
 
     def update(self, query: ast.Update) -> None:
@@ -102,10 +121,7 @@ class AppointmentsTable(HubSpotSearchMixin, APITable):
         update_statement_parser = UPDATEQueryParser(query)
         values_to_update, where_conditions = update_statement_parser.parse_query()
 
-        df = pd.json_normalize(self.get_objects())
-        update_query_executor = UPDATEQueryExecutor(df, where_conditions)
-        df = update_query_executor.execute_query()
-        ids = df['id'].tolist()
+        ids = self._resolve_ids(where_conditions)
         self.update_objects(ids, values_to_update)
 
     def delete(self, query: ast.Delete) -> None:
@@ -113,136 +129,168 @@ class AppointmentsTable(HubSpotSearchMixin, APITable):
         delete_statement_parser = DELETEQueryParser(query)
         where_conditions = delete_statement_parser.parse_query()
 
-        df = pd.json_normalize(self.get_objects())
-        delete_query_executor = DELETEQueryExecutor(df, where_conditions)
-        df = delete_query_executor.execute_query()
-        ids = df['id'].tolist()
+        ids = self._resolve_ids(where_conditions)
         self.delete_objects(ids)
 
+    def _resolve_ids(self, where_conditions: List[List]) -> List[Text]:
+        """Get the IDs of the appointments matching the WHERE conditions of an UPDATE or DELETE"""
+        object_ids = self._get_id_values(where_conditions)
+        if object_ids is not None:
+            # Exact id lookup: the batch read returns just the existing ids, nothing is left to filter locally
+            return self.read_objects(object_ids, properties=['hs_object_id'])['id'].tolist()
+
+        df = self._get_rows_to_modify(where_conditions, self.get_objects, self.search_objects)
+        df = UPDATEQueryExecutor(df, where_conditions).execute_query()
+        return df['id'].tolist()
+
     def get_columns(self) -> List[Text]:
         """Get column names for the table"""
-        return ['id'] + self.DEFAULT_PROPERTIES
+        return ['id', *self.DEFAULT_PROPERTIES]
 
-    def get_objects(self, properties: List[Text] = None, **kwargs) -> List[Dict]:
-        """Fetch appointments with specified properties"""
+    def get_objects(self, properties: List[Text] = None, limit: int = None, **kwargs) -> pd.DataFrame:
+        """Fetch appointments with specified properties, page by page until `limit` is reached"""
         hubspot = self.handler.connect()
 
-        if properties is None:
-            properties_to_fetch = self.DEFAULT_PROPERTIES
-        elif len(properties) == 0:
-            properties_cache = self.handler.get_properties_cache('appointments')
-            properties_to_fetch = list(properties_cache['property_names'])
-        else:
-            properties_to_fetch = properties
+        properties_to_fetch = self._resolve_properties('appointments', properties)
 
-        kwargs['properties'] = properties_to_fetch
-        objects = hubspot.crm.objects.basic_api.get_page(
-            object_type="appointments",
-            **kwargs
-        )
-
-        objects_dict = []
-        for obj in objects.results:
-            obj_dict = {"id": obj.id}
-            if hasattr(obj, 'properties') and obj.properties:
-                for prop_name, prop_value in obj.properties.items():
-                    obj_dict[prop_name] = prop_value
-            objects_dict.append(obj_dict)
+        def fetch_page(after, page_size):
+            return self._execute_with_retry(
+                lambda: self._decode_page(hubspot.crm.objects.basic_api.get_page(
+                    object_type="appointments",
+                    limit=page_size,
+                    after=after,
+                    properties=properties_to_fetch,
+                    _preload_content=False,
+                    **kwargs
+                )),
+                "get_appointments"
+            )
 
-        return objects_dict
+        return self._objects_to_dataframe(
+            self._iter_pages(fetch_page, limit), properties_to_fetch, self.PROPERTY_TYPES
+        )
 
-    def search_objects(self, filters: List[Dict], properties: List[Text] = None, limit: int = None) -> List[Dict]:
-        """Search appointments using HubSpot search API"""
+    def read_objects(self, object_ids: List[Text], properties: List[Text] = None) -> pd.DataFrame:
+        """Read appointments by ID with the batch read API, 100 IDs per call"""
         hubspot = self.handler.connect()
 
-        if properties is None:
-            properties_to_fetch = self.DEFAULT_PROPERTIES
-        elif len(properties) == 0:
-            properties_cache = self.handler.get_properties_cache('appointments')
-            properties_to_fetch = list(properties_cache['property_names'])
-        else:
-            properties_to_fetch = properties
-
-        search_request = {
-            "filterGroups": [{"filters": filters}],
-            "properties": properties_to_fetch,
-            "limit": min(limit or 100, 100),
-        }
-
-        all_objects = []
-        after = 0
+        properties_to_fetch = self._resolve_properties('appointments', properties)
 
-        try:
-            while True:
-                if after > 0:
-                    search_request["after"] = after
-
-                response = hubspot.crm.objects.search_api.do_search(
-                    object_type="appointments",
-                    public_object_search_request=search_request
+        def read_batch(batch: List[Text]):
+            return hubspot.crm.objects.batch_api.read(
+                object_type="appointments",
+                batch_read_input_simple_public_object_id=HubSpotBatchReadInput(
+                    properties=properties_to_fetch,
+                    inputs=[HubSpotObjectId(id=obj_id) for obj_id in batch]
                 )
+            )
 
-                for obj in response.results:
-                    obj_dict = {"id": obj.id}
-                    if hasattr(obj, 'properties') and obj.properties:
-                        for prop_name, prop_value in obj.properties.items():
-                            obj_dict[prop_name] = prop_value
-                    all_objects.append(obj_dict)
-
-                if limit and len(all_objects) >= limit:
-                    all_objects = all_objects[:limit]
-                    break
+        responses = self._run_batches(object_ids, read_batch, "read_appointments")
+        return self._objects_to_dataframe(
+            (obj for response in responses for obj in response.results), properties_to_fetch, self.PROPERTY_TYPES
+        )
 
-                if not hasattr(response, 'paging') or not response.paging:
-                    break
+    def search_objects(
+        self,
+        filters: List[Dict],
+        properties: List[Text] = None,
+        limit: int = None,
+        sorts: List[Dict] = None
+    ) -> pd.DataFrame:
+        """Search appointments using HubSpot search API"""
+        hubspot = self.handler.connect()
 
-                if hasattr(response.paging, 'next') and response.paging.next:
-                    after = response.paging.next.after
-                else:
-                    break
+        properties_to_fetch = self._resolve_properties('appointments', properties)
+
+        def fetch_page(after, page_size):
+            search_request = {
+                "filterGroups": [{"filters": filters}],
+                "properties": properties_to_fetch,
+                "limit": page_size,
+            }
+            if sorts:
+                search_request["sorts"] = sorts
+            if after:
+                search_request["after"] = after
+            return self._execute_with_retry(
+                lambda: self._decode_page(hubspot.crm.objects.search_api.do_search(
+                    object_type="appointments",
+                    public_object_search_request=search_request,
+                    _preload_content=False
+                )),
+                "search_appointments",
+                endpoint="search"
+            )
 
+        try:
+            df = self._objects_to_dataframe(
+                self._iter_search_pages(fetch_page, limit), properties_to_fetch, self.PROPERTY_TYPES
+            )
         except Exception as e:
             logger.error(f"Error searching appointments: {e}")
             raise Exception(f"Appointment search failed: {e}")
 
-        logger.info(f"Found {len(all_objects)} appointments matching filters")
-        return all_objects
+        logger.info(f"Found {len(df)} appointments matching filters")
+        return df
 
     def create_objects(self, objects_data: List[Dict[Text, Any]]) -> None:
         """Create appointments"""
         hubspot = self.handler.connect()
-        objects_to_create = [HubSpotObjectInputCreate(properties=obj) for obj in objects_data]
-        try:
-            created = hubspot.crm.objects.batch_api.create(
+
+        def create_batch(batch: List[Dict[Text, Any]]):
+            return hubspot.crm.objects.batch_api.create(
                 object_type="appointments",
-                batch_input_simple_public_object_input_for_create=HubSpotBatchObjectInputCreate(inputs=objects_to_create)
+                batch_input_simple_public_object_input_for_create=HubSpotBatchObjectInputCreate(
+                    inputs=[HubSpotObjectInputCreate(properties=obj) for obj in batch]
+                )
             )
-            logger.info(f"Appointments created with IDs {[obj.id for obj in created.results]}")
+
+        try:
+            responses = self._run_batches(objects_data, create_batch, "create_appointments")
+            created_ids = [obj.id for response in responses for obj in response.results]
+            logger.info(f"Appointments created with IDs {created_ids}")
         except Exception as e:
             raise Exception(f"Appointments creation failed: {e}")
+        finally:
+            self.handler.invalidate_row_cache('appointments')
 
     def update_objects(self, object_ids: List[Text], values_to_update: Dict[Text, Any]) -> None:
         """Update appointments"""
         hubspot = self.handler.connect()
-        objects_to_update = [HubSpotObjectBatchInput(id=obj_id, properties=values_to_update) for obj_id in object_ids]
-        try:
-            updated = hubspot.crm.objects.batch_api.update(
+
+        def update_batch(batch: List[Text]):
+            return hubspot.crm.objects.batch_api.update(
                 object_type="appointments",
-                batch_input_simple_public_object_batch_input=HubSpotBatchObjectBatchInput(inputs=objects_to_update)
+                batch_input_simple_public_object_batch_input=HubSpotBatchObjectBatchInput(
+                    inputs=[HubSpotObjectBatchInput(id=obj_id, properties=values_to_update) for obj_id in batch]
+                )
             )
-            logger.info(f"Appointments with IDs {[obj.id for obj in updated.results]} updated")
+
+        try:
+            responses = self._run_batches(object_ids, update_batch, "update_appointments")
+            updated_ids = [obj.id for response in responses for obj in response.results]
+            logger.info(f"Appointments with IDs {updated_ids} updated")
         except Exception as e:
             raise Exception(f"Appointments update failed: {e}")
+        finally:
+            self.handler.invalidate_row_cache('appointments')
 
     def delete_objects(self, object_ids: List[Text]) -> None:
         """Delete appointments"""
         hubspot = self.handler.connect()
-        objects_to_delete = [HubSpotObjectId(id=obj_id) for obj_id in object_ids]
-        try:
-            hubspot.crm.objects.batch_api.archive(
+
+        def delete_batch(batch: List[Text]):
+            return hubspot.crm.objects.batch_api.archive(
                 object_type="appointments",
-                batch_input_simple_public_object_id=HubSpotBatchObjectIdInput(inputs=objects_to_delete)
+                batch_input_simple_public_object_id=HubSpotBatchObjectIdInput(
+                    inputs=[HubSpotObjectId(id=obj_id) for obj_id in batch]
+                )
             )
+
+        try:
+            self._run_batches(object_ids, delete_batch, "delete_appointments")
             logger.info("Appointments deleted")
         except Exception as e:
             raise Exception(f"Appointments deletion failed: {e}")
+        finally:
+            self.handler.invalidate_row_cache('appointments')
@@ -10,7 +10,11 @@ Documentation: https://developers.hubspot.com/docs/api/crm/associations
 Supports full CRUD operations for managing associations between CRM objects.
 """
 
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count, islice, product
 from typing import List, Dict, Text, Any, Tuple, Optional
+import numpy as np
 import pandas as pd
 from mindsdb_sql_parser import ast
 from mindsdb.integrations.libs.api_handler import APITable
@@ -24,6 +28,11 @@ from hubspot.crm.associations.v4 import (
 
 logger = log.getLogger(__name__)
 
+# Destination object types whose associations are fetched at the same time
+ASSOCIATIONS_MAX_WORKERS = 5
+# Association pairs built at a time when deleting the cross product of from and to ids
+DELETE_WINDOW_SIZE = 1000
+
 
 class AssociationsTable(HubSpotSearchMixin, APITable):
     """
@@ -76,6 +85,18 @@ class AssociationsTable(HubSpotSearchMixin, APITable):
         ('tickets', 'companies'): {'default': 25, 'primary': 25},
         ('tickets', 'deals'): {'default': 27, 'primary': 27},
     }
+    # Default association type ID of each object pair, flattened for lookups
+    DEFAULT_ASSOCIATION_TYPE_IDS = {pair: types['default'] for pair, types in ASSOCIATION_TYPES.items()}
+
+    # Columns of the table, shared by every query
+    COLUMNS = (
+        'from_object_type',      # Source object type (e.g., 'contacts')
+        'from_object_id',        # Source object ID
+        'to_object_type',        # Destination object type (e.g., 'companies')
+        'to_object_id',          # Destination object ID
+        'association_type_id',   # Association type ID (integer)
+        'association_label',     # Association label (e.g., 'Contact to Company')
+    )
 
     def select(self, query: ast.Select) -> pd.DataFrame:
         """
@@ -102,31 +123,7 @@ class AssociationsTable(HubSpotSearchMixin, APITable):
         selected_columns, where_conditions, order_by_conditions, result_limit = select_statement_parser.parse_query()
 
         # Extract required parameters from WHERE clause
-        from_object_type = None
-        from_object_ids = []
-        to_object_type = None
-        to_object_ids = []
-
-        for condition in where_conditions:
-            if len(condition) < 3:
-                continue
-
-            op, column, value = condition[0], condition[1], condition[2]
-
-            if column == 'from_object_type' and op == '=':
-                from_object_type = value
-            elif column == 'from_object_id':
-                if op == '=':
-                    from_object_ids = [value]
-                elif op == 'in':
-                    from_object_ids = value if isinstance(value, list) else [value]
-            elif column == 'to_object_type' and op == '=':
-                to_object_type = value
-            elif column == 'to_object_id':
-                if op == '=':
-                    to_object_ids = [value]
-                elif op == 'in':
-                    to_object_ids = value if isinstance(value, list) else [value]
+        from_object_type, from_object_ids, to_object_type, _ = self._extract_object_predicates(where_conditions)
 
         # Check if this is a validation/schema discovery query
         # These queries typically have LIMIT 1 and missing required params (during view creation)
@@ -134,7 +131,11 @@ class AssociationsTable(HubSpotSearchMixin, APITable):
 
         if is_validation_query:
             logger.debug("Schema validation mode detected, returning empty DataFrame with schema")
-            return pd.DataFrame(columns=self.get_columns())
+            return pd.DataFrame(columns=self.COLUMNS)
+
+        # LIMIT 0 only asks for the schema, so nothing is fetched
+        if result_limit == 0:
+            return pd.DataFrame(columns=self.COLUMNS)
 
         # Validate required parameters
         if not from_object_type:
@@ -149,58 +150,55 @@ class AssociationsTable(HubSpotSearchMixin, APITable):
                 "Example: WHERE from_object_type='contacts' AND from_object_id='12345'"
             )
 
-        # Fetch associations
-        associations = self.get_associations(
-            from_object_type=from_object_type,
-            from_object_ids=from_object_ids,
-            to_object_type=to_object_type
-        )
-
-        # Convert to DataFrame
-        if not associations:
-            logger.info("No associations found")
-            # Return empty DataFrame with correct column schema
-            return pd.DataFrame(columns=self.get_columns())
-
-        associations_df = pd.DataFrame(associations)
-
-        # Apply additional WHERE conditions that weren't used in the API query
+        # Additional WHERE conditions that can't be used in the API query are applied locally
         # We need to exclude conditions already applied at the API level:
         # - from_object_type (always used)
         # - from_object_id (always used)
         # - to_object_type (used if specified)
-        if where_conditions and not associations_df.empty:
-            # Filter out conditions already applied at API level
-            conditions_to_apply = []
-            for condition in where_conditions:
-                if len(condition) < 3:
-                    continue
+        conditions_to_apply = []
+        for condition in where_conditions:
+            if len(condition) < 3:
+                continue
 
-                op, column, value = condition[0], condition[1], condition[2]
+            column = condition[1]
 
-                # Skip conditions already used for API filtering
-                if column == 'from_object_type' or column == 'from_object_id':
-                    continue  # Already filtered by API
-                if column == 'to_object_type' and to_object_type:
-                    continue  # Already filtered by API
+            # Skip conditions already used for API filtering
+            if column == 'from_object_type' or column == 'from_object_id':
+                continue  # Already filtered by API
+            if column == 'to_object_type' and to_object_type:
+                continue  # Already filtered by API
 
-                # Keep other conditions for local filtering (e.g., to_object_id, association_type_id)
-                conditions_to_apply.append(condition)
+            # Keep other conditions for local filtering (e.g., to_object_id, association_type_id)
+            conditions_to_apply.append(condition)
 
-            if conditions_to_apply:
-                associations_df = self._apply_conditions(associations_df, conditions_to_apply)
+        # Fetch associations; the limit can only bound the fetch when no rows are filtered or reordered afterwards
+        associations_df = self.get_associations(
+            from_object_type=from_object_type,
+            from_object_ids=from_object_ids,
+            to_object_type=to_object_type,
+            limit=None if conditions_to_apply or order_by_conditions else result_limit
+        )
+
+        if associations_df.empty:
+            logger.info("No associations found")
+            # Return empty DataFrame with correct column schema
+            return pd.DataFrame(columns=self.COLUMNS)
+
+        if conditions_to_apply:
+            associations_df = self._apply_conditions(associations_df, conditions_to_apply)
 
         # Apply column selection
         if selected_columns and not associations_df.empty:
             # Filter to only available columns
-            available_columns = [col for col in selected_columns if col in associations_df.columns]
+            df_columns = set(associations_df.columns)
+            available_columns = [col for col in selected_columns if col in df_columns]
             if len(available_columns) < len(selected_columns):
-                missing = set(selected_columns) - set(available_columns)
+                missing = set(selected_columns).difference(df_columns)
                 logger.warning(f"Some requested columns not available in associations data: {missing}")
             if available_columns:
                 associations_df = associations_df[available_columns]
 
-        # Apply limit
+        # Apply limit; get_associations may return more rows than asked for
         if result_limit and not associations_df.empty:
             associations_df = associations_df.head(result_limit)
 
@@ -211,8 +209,9 @@ class AssociationsTable(HubSpotSearchMixin, APITable):
         self,
         from_object_type: str,
         from_object_ids: List[str],
-        to_object_type: Optional[str] = None
-    ) -> List[Dict]:
+        to_object_type: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> pd.DataFrame:
         """
         Get associations for specified objects.
 
@@ -224,17 +223,18 @@ class AssociationsTable(HubSpotSearchMixin, APITable):
             List of source object IDs
         to_object_type : str, optional
             Filter by destination object type
+        limit : int, optional
+            Number of associations needed; destination types are no longer parsed once it is reached
 
         Returns
         -------
-        List[Dict]
-            List of association dictionaries
+        pd.DataFrame
+            One row per association, with the columns of the table
         """
         if not from_object_ids:
-            return []
+            return pd.DataFrame(columns=self.COLUMNS)
 
         hubspot = self.handler.connect()
-        all_associations = []
 
         try:
             # Determine which object types to fetch associations for
@@ -243,64 +243,108 @@ class AssociationsTable(HubSpotSearchMixin, APITable):
             else:
                 # Fetch all possible associations
                 to_object_types = ['contacts', 'companies', 'deals', 'tickets', 'line_items']
+                # For source types with known association types, pairs without one cannot hold
+                # associations and are not requested; other source types keep the full fan-out
+                known_to_types = {
+                    to_type for from_type, to_type in self.ASSOCIATION_TYPES if from_type == from_object_type
+                }
+                if known_to_types:
+                    to_object_types = [to_type for to_type in to_object_types if to_type in known_to_types]
+            # Skip if trying to associate with self
+            to_object_types = [to_type for to_type in to_object_types if to_type != from_object_type]
+            if not to_object_types:
+                return pd.DataFrame(columns=self.COLUMNS)
+
+            # Batch read associations using get_page
+            # Note: HubSpot v4 associations API uses get_page method for batch reads
+            # Create proper batch request with PublicFetchAssociationsBatchRequest objects
+            # The request is the same for every destination type without cached associations, so it is built once
+            from_object_ids = [str(obj_id) for obj_id in from_object_ids]
+            batch_read_input = BatchInputPublicFetchAssociationsBatchRequest(
+                inputs=[PublicFetchAssociationsBatchRequest(id=obj_id) for obj_id in from_object_ids]
+            )
 
-            for to_type in to_object_types:
-                # Skip if trying to associate with self
-                if to_type == from_object_type:
-                    continue
+            def fetch_associations(to_type):
+                # Objects whose associations were read recently are served from the handler's cache
+                cached, generation = self.handler.get_cached_associations(from_object_type, to_type, from_object_ids)
+                missing_ids = [obj_id for obj_id in from_object_ids if obj_id not in cached]
+                if not missing_ids:
+                    return cached, missing_ids, None, generation
 
+                request = batch_read_input if not cached else BatchInputPublicFetchAssociationsBatchRequest(
+                    inputs=[PublicFetchAssociationsBatchRequest(id=obj_id) for obj_id in missing_ids]
+                )
                 try:
-                    # Batch read associations using get_page
-                    # Note: HubSpot v4 associations API uses get_page method for batch reads
-                    # Create proper batch request with PublicFetchAssociationsBatchRequest objects
-                    inputs = [
-                        PublicFetchAssociationsBatchRequest(id=str(obj_id))
-                        for obj_id in from_object_ids
-                    ]
-                    batch_read_input = BatchInputPublicFetchAssociationsBatchRequest(inputs=inputs)
-
                     response = self._execute_with_retry(
                         lambda: hubspot.crm.associations.v4.batch_api.get_page(
                             from_object_type=from_object_type,
                             to_object_type=to_type,
-                            batch_input_public_fetch_associations_batch_request=batch_read_input
+                            batch_input_public_fetch_associations_batch_request=request
                         ),
                         f"get_associations_{from_object_type}_to_{to_type}"
                     )
-
-                    # Process results
-                    if hasattr(response, 'results'):
-                        for result in response.results:
-                            from_id = result.from_.id if hasattr(result, 'from_') else None
-
-                            if hasattr(result, 'to') and result.to:
-                                for to_obj in result.to:
-                                    association_dict = {
-                                        'from_object_type': from_object_type,
-                                        'from_object_id': str(from_id),
-                                        'to_object_type': to_type,
-                                        'to_object_id': str(to_obj.to_object_id) if hasattr(to_obj, 'to_object_id') else str(to_obj.id),
-                                    }
-
-                                    # Add association type information
-                                    if hasattr(to_obj, 'association_types') and to_obj.association_types:
-                                        # Get first association type (there can be multiple)
-                                        assoc_type = to_obj.association_types[0]
-                                        association_dict['association_type_id'] = assoc_type.type_id if hasattr(assoc_type, 'type_id') else None
-                                        association_dict['association_label'] = assoc_type.label if hasattr(assoc_type, 'label') else None
-                                    else:
-                                        association_dict['association_type_id'] = None
-                                        association_dict['association_label'] = None
-
-                                    all_associations.append(association_dict)
-
                 except Exception as e:
                     # Log but continue - some object type combinations may not be valid
                     logger.debug(f"No associations found from {from_object_type} to {to_type}: {e}")
-                    continue
-
-            logger.info(f"Retrieved {len(all_associations)} associations")
-            return all_associations
+                    response = None
+                return cached, missing_ids, response, generation
+
+            # The destination types are independent requests, so they are fetched concurrently
+            with ThreadPoolExecutor(max_workers=min(ASSOCIATIONS_MAX_WORKERS, len(to_object_types))) as executor:
+                fetched = list(executor.map(fetch_associations, to_object_types))
+
+            # The frame is built column-wise from parallel lists rather than from one dict per association
+            from_ids, to_types, to_ids, type_ids, labels = [], [], [], [], []
+            for to_type, (cached, missing_ids, response, generation) in zip(to_object_types, fetched):
+                rows_by_id = dict(cached)
+                if response is not None:
+                    # Process results; objects without associations are absent from them but cached as well
+                    read_rows = {obj_id: [] for obj_id in missing_ids}
+                    for result in getattr(response, 'results', None) or ():
+                        from_id = str(getattr(getattr(result, 'from_', None), 'id', None))
+                        rows = read_rows.setdefault(from_id, [])
+
+                        for to_obj in getattr(result, 'to', None) or ():
+                            to_id = getattr(to_obj, 'to_object_id', None)
+                            if to_id is None:
+                                to_id = getattr(to_obj, 'id', None)
+
+                            # Add association type information; take the first one (there can be multiple)
+                            association_types = getattr(to_obj, 'association_types', None)
+                            assoc_type = association_types[0] if association_types else None
+                            rows.append((
+                                str(to_id), getattr(assoc_type, 'type_id', None), getattr(assoc_type, 'label', None)
+                            ))
+
+                    read_rows = {obj_id: tuple(rows) for obj_id, rows in read_rows.items()}
+                    self.handler.cache_associations(from_object_type, to_type, read_rows, generation)
+                    rows_by_id.update(read_rows)
+
+                for from_id, rows in rows_by_id.items():
+                    for to_id, type_id, label in rows:
+                        from_ids.append(from_id)
+                        to_types.append(to_type)
+                        to_ids.append(to_id)
+                        type_ids.append(type_id)
+                        labels.append(label)
+
+                # The batch read API has no limit parameter, so the remaining responses are just not parsed
+                if limit and len(to_ids) >= limit:
+                    break
+
+            logger.info(f"Retrieved {len(to_ids)} associations")
+            # Object types and labels take a handful of distinct values, so they are stored as categoricals
+            # rather than one Python string per row
+            return pd.DataFrame({
+                'from_object_type': pd.Categorical.from_codes(
+                    np.zeros(len(from_ids), dtype=np.int8), categories=[from_object_type]
+                ),
+                'from_object_id': pd.Series(from_ids, dtype=object),
+                'to_object_type': pd.Categorical(to_types),
+                'to_object_id': pd.Series(to_ids, dtype=object),
+                'association_type_id': pd.array(type_ids, dtype='Int64'),
+                'association_label': pd.Categorical(labels),
+            })
 
         except Exception as e:
             logger.error(f"Error fetching associations: {e}")
@@ -325,7 +369,7 @@ class AssociationsTable(HubSpotSearchMixin, APITable):
             SQL INSERT query
         """
         # Extract column names and values
-        columns = [col.parts[-1] for col in query.columns] if query.columns else []
+        columns = [col.name for col in query.columns] if query.columns else []
 
         associations_to_create = []
 
@@ -367,58 +411,87 @@ class AssociationsTable(HubSpotSearchMixin, APITable):
         hubspot = self.handler.connect()
 
         # Group associations by (from_type, to_type) pair for batch operations
-        grouped_associations = {}
+        grouped_associations = defaultdict(list)
         for assoc in associations_data:
-            key = (assoc['from_object_type'], assoc['to_object_type'])
-            if key not in grouped_associations:
-                grouped_associations[key] = []
-            grouped_associations[key].append(assoc)
+            grouped_associations[(assoc['from_object_type'], assoc['to_object_type'])].append(assoc)
 
-        # Create associations for each group
-        for (from_type, to_type), group in grouped_associations.items():
-            try:
-                # Prepare batch create input
-                inputs = []
-                for assoc in group:
-                    # Determine association type ID
-                    association_type_id = assoc.get('association_type_id')
-                    if not association_type_id:
-                        # Use default for this object pair
-                        type_key = (from_type, to_type)
-                        if type_key in self.ASSOCIATION_TYPES:
-                            association_type_id = self.ASSOCIATION_TYPES[type_key]['default']
-                        else:
-                            raise ValueError(
-                                f"No default association type for {from_type} -> {to_type}. "
-                                f"Please specify association_type_id."
-                            )
-
-                    inputs.append({
-                        'from': {'id': str(assoc['from_object_id'])},
-                        'to': {'id': str(assoc['to_object_id'])},
-                        'types': [{'associationTypeId': int(association_type_id)}]
-                    })
-
-                # Create associations with retry and chunking
-                def create_batch(batch):
-                    batch_input = {'inputs': batch}
-                    return hubspot.crm.associations.v4.batch_api.create(
-                        from_object_type=from_type,
-                        to_object_type=to_type,
-                        batch_input_public_association=batch_input
+        # Create associations for each group; the groups are independent batches, so they run concurrently
+        try:
+            with ThreadPoolExecutor(max_workers=min(ASSOCIATIONS_MAX_WORKERS, len(grouped_associations))) as executor:
+                futures = [
+                    executor.submit(self._create_group, hubspot, from_type, to_type, group)
+                    for (from_type, to_type), group in grouped_associations.items()
+                ]
+            for future in futures:
+                future.result()
+        finally:
+            # Both ends of every association have new associations, including groups that failed partway
+            self.handler.invalidate_association_cache(
+                [(assoc['from_object_type'], str(assoc['from_object_id'])) for assoc in associations_data]
+                + [(assoc['to_object_type'], str(assoc['to_object_id'])) for assoc in associations_data]
+            )
+
+    def _create_group(self, hubspot: Any, from_type: str, to_type: str, group: List[Dict[Text, Any]]) -> None:
+        """
+        Create the associations of one (from_type, to_type) pair.
+
+        Parameters
+        ----------
+        hubspot : Any
+            Connected HubSpot client
+        from_type : str
+            Source object type
+        to_type : str
+            Destination object type
+        group : List[Dict]
+            Association data dictionaries of the pair
+        """
+        try:
+            # Prepare batch create input
+            # The default type only depends on the object pair, so it is looked up once per group
+            default_type_id = self.DEFAULT_ASSOCIATION_TYPE_IDS.get((from_type, to_type))
+            # Rows with the same type share one types payload
+            types_by_id = {}
+            inputs = []
+            for assoc in group:
+                # Determine association type ID
+                association_type_id = assoc.get('association_type_id') or default_type_id
+                if not association_type_id:
+                    raise ValueError(
+                        f"No default association type for {from_type} -> {to_type}. "
+                        f"Please specify association_type_id."
                     )
 
-                self._batch_create_with_chunking(
-                    inputs,
-                    create_batch,
-                    f"associations_{from_type}_to_{to_type}"
+                types = types_by_id.get(association_type_id)
+                if types is None:
+                    types = types_by_id[association_type_id] = [{'associationTypeId': int(association_type_id)}]
+
+                inputs.append({
+                    'from': {'id': str(assoc['from_object_id'])},
+                    'to': {'id': str(assoc['to_object_id'])},
+                    'types': types
+                })
+
+            # Create associations with retry and chunking
+            def create_batch(batch):
+                batch_input = {'inputs': batch}
+                return hubspot.crm.associations.v4.batch_api.create(
+                    from_object_type=from_type,
+                    to_object_type=to_type,
+                    batch_input_public_association=batch_input
                 )
 
-                logger.info(f"Created {len(group)} associations from {from_type} to {to_type}")
+            self._batch_create_with_chunking(
+                inputs,
+                create_batch,
+                f"associations_{from_type}_to_{to_type}"
+            )
 
-            except Exception as e:
-                logger.error(f"Error creating associations from {from_type} to {to_type}: {e}")
-                raise Exception(f"Failed to create associations from {from_type} to {to_type}: {e}")
+            logger.info(f"Created {len(group)} associations from {from_type} to {to_type}")
+
+        except Exception as e:
+            logger.error(f"Error creating associations from {from_type} to {to_type}: {e}")
+            raise Exception(f"Failed to create associations from {from_type} to {to_type}: {e}")
 
     def update(self, query: ast.Update) -> None:
         """
@@ -455,31 +528,9 @@ class AssociationsTable(HubSpotSearchMixin, APITable):
         where_conditions = delete_statement_parser.parse_query()
 
         # Extract parameters
-        from_object_type = None
-        from_object_ids = []
-        to_object_type = None
-        to_object_ids = []
-
-        for condition in where_conditions:
-            if len(condition) < 3:
-                continue
-
-            op, column, value = condition[0], condition[1], condition[2]
-
-            if column == 'from_object_type' and op == '=':
-                from_object_type = value
-            elif column == 'from_object_id':
-                if op == '=':
-                    from_object_ids = [value]
-                elif op == 'in':
-                    from_object_ids = value if isinstance(value, list) else [value]
-            elif column == 'to_object_type' and op == '=':
-                to_object_type = value
-            elif column == 'to_object_id':
-                if op == '=':
-                    to_object_ids = [value]
-                elif op == 'in':
-                    to_object_ids = value if isinstance(value, list) else [value]
+        from_object_type, from_object_ids, to_object_type, to_object_ids = self._extract_object_predicates(
+            where_conditions
+        )
 
         # Validate required parameters
         if not all([from_object_type, from_object_ids, to_object_type, to_object_ids]):
@@ -521,15 +572,6 @@ class AssociationsTable(HubSpotSearchMixin, APITable):
 
         hubspot = self.handler.connect()
 
-        # Prepare batch delete input (pairs of from/to IDs)
-        inputs = []
-        for from_id in from_object_ids:
-            for to_id in to_object_ids:
-                inputs.append({
-                    'from': {'id': str(from_id)},
-                    'to': {'id': str(to_id)}
-                })
-
         # Delete associations with retry and chunking
         def delete_batch(batch):
             batch_input = {'inputs': batch}
@@ -539,20 +581,94 @@ class AssociationsTable(HubSpotSearchMixin, APITable):
                 batch_input_public_association=batch_input
             )
 
-        self._batch_delete_with_chunking(
-            inputs,
-            delete_batch,
-            f"associations_{from_object_type}_to_{to_object_type}"
+        # Every from/to pair is deleted; the pairs are generated lazily and deleted a window at a time,
+        # so large IN lists on both sides don't materialize the whole cross product
+        pairs = product([str(from_id) for from_id in from_object_ids], [str(to_id) for to_id in to_object_ids])
+        failed_windows = []
+        for i in count(1):
+            inputs = [
+                {'from': {'id': from_id}, 'to': {'id': to_id}}
+                for from_id, to_id in islice(pairs, DELETE_WINDOW_SIZE)
+            ]
+            if not inputs:
+                break
+            try:
+                self._batch_delete_with_chunking(
+                    inputs,
+                    delete_batch,
+                    f"associations_{from_object_type}_to_{to_object_type}"
+                )
+            except Exception as e:
+                logger.error(f"Failed to delete window {i} of associations: {e}")
+                failed_windows.append(i)
+
+        # Both ends of every pair may have lost associations, including windows that failed partway
+        self.handler.invalidate_association_cache(
+            [(from_object_type, str(from_id)) for from_id in from_object_ids]
+            + [(to_object_type, str(to_id)) for to_id in to_object_ids]
         )
 
+        if failed_windows:
+            raise Exception(
+                f"Deletion of associations from {from_object_type} to {to_object_type} partially failed: "
+                f"{len(failed_windows)} window(s) of {DELETE_WINDOW_SIZE} pairs failed (windows: {failed_windows})"
+            )
+
         logger.info(f"Deleted associations from {from_object_type} to {to_object_type}")
 
+    @staticmethod
+    def _extract_object_predicates(
+        where_conditions: List[List]
+    ) -> Tuple[Optional[str], List[str], Optional[str], List[str]]:
+        """
+        Extract the object types and ids a query filters on from its WHERE conditions.
+
+        Parameters
+        ----------
+        where_conditions : List[List]
+            Parsed WHERE conditions as [operator, column, value]
+
+        Returns
+        -------
+        Tuple[Optional[str], List[str], Optional[str], List[str]]
+            from_object_type, from_object_ids, to_object_type and to_object_ids
+        """
+        from_object_type = None
+        from_object_ids = []
+        to_object_type = None
+        to_object_ids = []
+
+        for condition in where_conditions:
+            if len(condition) < 3:
+                continue
+
+            op, column, value = condition[0], condition[1], condition[2]
+
+            if column == 'from_object_type' and op == '=':
+                from_object_type = value
+            elif column == 'from_object_id':
+                if op == '=':
+                    from_object_ids = [value]
+                elif op == 'in':
+                    from_object_ids = value if isinstance(value, list) else [value]
+            elif column == 'to_object_type' and op == '=':
+                to_object_type = value
+            elif column == 'to_object_id':
+                if op == '=':
+                    to_object_ids = [value]
+                elif op == 'in':
+                    to_object_ids = value if isinstance(value, list) else [value]
+
+        return from_object_type, from_object_ids, to_object_type, to_object_ids
+
     @staticmethod
     def _apply_conditions(df: pd.DataFrame, conditions: List[List]) -> pd.DataFrame:
         """Apply WHERE conditions to DataFrame (local filtering)"""
         if df.empty:
             return df
 
+        # The conditions are combined into a single mask, so the frame is sliced once
+        mask = np.ones(len(df), dtype=bool)
         for condition in conditions:
             if len(condition) < 3:
                 continue
@@ -565,32 +681,29 @@ class AssociationsTable(HubSpotSearchMixin, APITable):
 
             # Apply filter based on operator
             if op == '=':
-                df = df[df[column] == value]
+                condition_mask = df[column] == value
             elif op == '!=':
-                df = df[df[column] != value]
-            elif op == 'in':
+                condition_mask = df[column] != value
+            elif op in ('in', 'not in'):
                 values = value if isinstance(value, list) else [value]
-                df = df[df[column].isin(values)]
-            elif op == 'not in':
-                values = value if isinstance(value, list) else [value]
-                df = df[~df[column].isin(values)]
+                condition_mask = df[column].isin(values)
+                if op == 'not in':
+                    condition_mask = ~condition_mask
+            else:
+                continue
+
+            # Nullable columns yield NA for missing values, which never match
+            mask &= condition_mask.to_numpy(dtype=bool, na_value=False)
 
-        return df
+        return df[mask]
 
-    def get_columns(self) -> List[Text]:
+    def get_columns(self) -> Tuple[Text, ...]:
         """
-        Get list of columns for the associations table.
+        Get the columns of the associations table.
 
         Returns
         -------
-        List[str]
-            Column names
+        Tuple[str, ...]
+            Column names, shared across calls
         """
-        return [
-            'from_object_type',      # Source object type (e.g., 'contacts')
-            'from_object_id',        # Source object ID
-            'to_object_type',        # Destination object type (e.g., 'companies')
-            'to_object_id',          # Destination object ID
-            'association_type_id',   # Association type ID (integer)
-            'association_label',     # Association label (e.g., 'Contact to Company')
-        ]
+        return self.COLUMNS
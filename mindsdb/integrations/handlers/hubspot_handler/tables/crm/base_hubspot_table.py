@@ -1,7 +1,21 @@
 """
 Base class for HubSpot tables with shared search functionality and rate limiting.
 """
-from typing import List, Dict, Any, Callable
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+from types import SimpleNamespace
+from typing import List, Dict, Any, Callable, Collection, Iterable, Iterator, Optional, Sequence, Text
+
+import orjson
+import pandas as pd
+import pyarrow as pa
+from mindsdb_sql_parser import ast
+
+from mindsdb.integrations.utilities.handlers.query_utilities import INSERTQueryParser
+from mindsdb.integrations.utilities.handlers.query_utilities.exceptions import UnsupportedColumnException
 from mindsdb.utilities import log
 from mindsdb.integrations.handlers.hubspot_handler.utils.rate_limiter import (
     with_retry,
@@ -12,6 +26,143 @@ from mindsdb.integrations.handlers.hubspot_handler.utils.rate_limiter import (
 
 logger = log.getLogger(__name__)
 
+# Maximum page size accepted by the HubSpot list and search endpoints
+PAGE_SIZE = 100
+# Maximum number of inputs accepted by a HubSpot batch endpoint
+BATCH_SIZE = 100
+# HubSpot search returns at most this many results for a query, however it is paged
+SEARCH_MAX_RESULTS = 10000
+# Concurrent search page requests; the search endpoints allow only a few requests per second
+SEARCH_MAX_WORKERS = 4
+# Objects converted to Arrow at a time when building a DataFrame, bounding the Python objects held
+DATAFRAME_BATCH_SIZE = 10000
+
+# HubSpot returns every property value as a string; these convert columns of the given
+# HubSpot property types into typed pandas columns. Enumerations take a handful of distinct
+# values, so they are stored as categoricals rather than one Python string per row
+PROPERTY_TYPE_CONVERTERS = {
+    'number': lambda values: pd.to_numeric(values, errors='coerce'),
+    'datetime': lambda values: pd.to_datetime(values, utc=True, errors='coerce', format='ISO8601'),
+    'enumeration': lambda values: values.astype('category'),
+}
+
+# SQL operators supported by the HubSpot search API, keyed by both their lower and upper case forms
+HUBSPOT_OPERATORS = {
+    "=": "EQ",
+    "!=": "NEQ",
+    "<": "LT",
+    "<=": "LTE",
+    ">": "GT",
+    ">=": "GTE",
+    "in": "IN",
+    "not in": "NOT_IN",
+    "is null": "NOT_HAS_PROPERTY",
+    "is not null": "HAS_PROPERTY",
+    "between": "BETWEEN",
+    "like": "CONTAINS_TOKEN",
+    "not like": "NOT_CONTAINS_TOKEN",
+}
+HUBSPOT_OPERATORS.update({sql_op.upper(): hubspot_op for sql_op, hubspot_op in HUBSPOT_OPERATORS.items()})
+
+
+def _build_range_filter(column: Text, hubspot_op: Text, value: Any) -> Optional[Dict]:
+    # BETWEEN: needs value and highValue
+    if isinstance(value, (list, tuple)) and len(value) == 2:
+        return {"propertyName": column, "operator": hubspot_op, "value": str(value[0]), "highValue": str(value[1])}
+    logger.warning(f"Invalid BETWEEN value format: {value}")
+    return None
+
+
+def _build_values_filter(column: Text, hubspot_op: Text, value: Any) -> Dict:
+    # IN/NOT IN: needs values array
+    values_list = value if isinstance(value, list) else [value]
+    return {"propertyName": column, "operator": hubspot_op, "values": [str(v) for v in values_list]}
+
+
+def _build_null_filter(column: Text, hubspot_op: Text, value: Any) -> Dict:
+    # NULL checks: no value needed
+    return {"propertyName": column, "operator": hubspot_op}
+
+
+# Translation table deleting the SQL wildcards of a LIKE pattern
+LIKE_WILDCARDS = str.maketrans('', '', '%_')
+
+
+def _build_token_filter(column: Text, hubspot_op: Text, value: Any) -> Dict:
+    # LIKE: extract search term by removing SQL wildcards
+    search_term = str(value).translate(LIKE_WILDCARDS)
+    return {"propertyName": column, "operator": hubspot_op, "value": search_term}
+
+
+def _build_comparison_filter(column: Text, hubspot_op: Text, value: Any) -> Dict:
+    # Standard comparison operators (=, !=, >, <, >=, <=)
+    return {"propertyName": column, "operator": hubspot_op, "value": str(value)}
+
+
+# Builders of the HubSpot search filter for each supported (lower case) SQL operator
+FILTER_BUILDERS = {
+    "=": _build_comparison_filter,
+    "!=": _build_comparison_filter,
+    "<": _build_comparison_filter,
+    "<=": _build_comparison_filter,
+    ">": _build_comparison_filter,
+    ">=": _build_comparison_filter,
+    "in": _build_values_filter,
+    "not in": _build_values_filter,
+    "is null": _build_null_filter,
+    "is not null": _build_null_filter,
+    "between": _build_range_filter,
+    "like": _build_token_filter,
+    "not like": _build_token_filter,
+}
+
+# HubSpot operators excluding values, and whether they take a list of values
+EXCLUSION_OPERATORS = {"NEQ": False, "NOT_IN": True}
+
+
+def _merge_exclusion_filters(hubspot_filters: List[Dict]) -> List[Dict]:
+    # Filters of a group are ANDed, so the NEQ and NOT_IN filters of a property combine into one
+    # NOT_IN filter, placed where the first of them was. EQ filters cannot be merged into IN that way
+    exclusions = defaultdict(list)
+    for hubspot_filter in hubspot_filters:
+        if hubspot_filter["operator"] in EXCLUSION_OPERATORS:
+            exclusions[hubspot_filter["propertyName"]].append(hubspot_filter)
+
+    merged_filters = []
+    for hubspot_filter in hubspot_filters:
+        group = None
+        if hubspot_filter["operator"] in EXCLUSION_OPERATORS:
+            group = exclusions[hubspot_filter["propertyName"]]
+        if not group or len(group) == 1:
+            merged_filters.append(hubspot_filter)
+        elif hubspot_filter is group[0]:
+            values = [
+                value
+                for excluded in group
+                for value in (excluded["values"] if EXCLUSION_OPERATORS[excluded["operator"]] else [excluded["value"]])
+            ]
+            merged_filters.append({
+                "propertyName": hubspot_filter["propertyName"],
+                "operator": "NOT_IN",
+                "values": list(dict.fromkeys(values)),
+            })
+    return merged_filters
+
+
+# Comparison operators giving a lower or upper bound to a column, with whether the bound is inclusive
+LOWER_BOUND_OPERATORS = {">": False, ">=": True}
+UPPER_BOUND_OPERATORS = {"<": False, "<=": True}
+
+
+def _are_comparable(first: Any, second: Any) -> bool:
+    # Bounds are only compared when both are numbers or both are strings
+    if isinstance(first, bool) or isinstance(second, bool):
+        return False
+    numeric = (int, float)
+    return (isinstance(first, numeric) and isinstance(second, numeric)) or (
+        isinstance(first, str) and isinstance(second, str)
+    )
+
 
 class HubSpotSearchMixin:
     """
@@ -22,7 +173,8 @@ class HubSpotSearchMixin:
     - SQL operator mapping to HubSpot search API
     - WHERE clause to HubSpot filters conversion
     - Automatic retry with exponential backoff
-    - Batch operation chunking for large datasets
+    - Batch operation chunking for large datasets, with concurrent dispatch
+    - Cursor pagination and columnar DataFrame construction for results
     """
 
     @staticmethod
@@ -40,28 +192,16 @@ class HubSpotSearchMixin:
         str
             HubSpot operator (EQ, NEQ, GT, LT, etc.) or None if not supported
         """
-        mapping = {
-            "=": "EQ",
-            "!=": "NEQ",
-            "<": "LT",
-            "<=": "LTE",
-            ">": "GT",
-            ">=": "GTE",
-            "in": "IN",
-            "not in": "NOT_IN",
-            "is null": "NOT_HAS_PROPERTY",
-            "is not null": "HAS_PROPERTY",
-            "between": "BETWEEN",
-            "like": "CONTAINS_TOKEN",
-            "not like": "NOT_CONTAINS_TOKEN",
-        }
-        return mapping.get(sql_op.lower())
+        return HUBSPOT_OPERATORS.get(sql_op) or HUBSPOT_OPERATORS.get(sql_op.lower())
 
     @staticmethod
     def _build_search_filters(where_conditions: List[List]) -> List[Dict]:
         """
         Convert WHERE conditions to HubSpot search API filters.
 
+        Conditions that translate to the same filter, e.g. repeated by the planner, are sent once, and
+        the `!=` / `NOT IN` conditions on a column are sent as a single NOT_IN filter.
+
         Parameters
         ----------
         where_conditions : List[List]
@@ -73,6 +213,7 @@ class HubSpotSearchMixin:
             List of HubSpot filter dictionaries
         """
         hubspot_filters = []
+        seen_filters = set()
 
         for condition in where_conditions:
             if len(condition) < 3:
@@ -80,77 +221,694 @@ class HubSpotSearchMixin:
                 continue
 
             op, column, value = condition[0], condition[1], condition[2]
-            hubspot_op = HubSpotSearchMixin._map_operator_to_hubspot(op)
+            op = op.lower()
+            if column == 'id':
+                # The object id is searchable as the hs_object_id property
+                column = 'hs_object_id'
+            hubspot_op = HUBSPOT_OPERATORS.get(op)
 
             if not hubspot_op:
                 logger.warning(f"Unsupported operator '{op}' for HubSpot search, skipping condition")
                 continue
 
-            # Handle different operator types
-            if op.lower() == "between":
-                # BETWEEN: needs value and highValue
-                if isinstance(value, (list, tuple)) and len(value) == 2:
-                    hubspot_filters.append({
-                        "propertyName": column,
-                        "operator": "BETWEEN",
-                        "value": str(value[0]),
-                        "highValue": str(value[1])
-                    })
-                else:
-                    logger.warning(f"Invalid BETWEEN value format: {value}")
-
-            elif op.lower() == "not between":
-                # NOT BETWEEN: HubSpot filters in same group are AND, so NOT BETWEEN needs special handling
-                if isinstance(value, (list, tuple)) and len(value) == 2:
-                    logger.warning("NOT BETWEEN not fully supported by HubSpot search API, skipping")
-                else:
-                    logger.warning(f"Invalid NOT BETWEEN value format: {value}")
-
-            elif op.lower() in ["in", "not in"]:
-                # IN/NOT IN: needs values array
-                values_list = value if isinstance(value, list) else [value]
-                hubspot_filters.append({
-                    "propertyName": column,
-                    "operator": hubspot_op,
-                    "values": [str(v) for v in values_list]
-                })
-
-            elif op.lower() in ["is null", "is not null"]:
-                # NULL checks: no value needed
-                hubspot_filters.append({
-                    "propertyName": column,
-                    "operator": hubspot_op
-                })
-
-            elif op.lower() in ["like", "not like"]:
-                # LIKE: extract search term by removing SQL wildcards
-                search_term = str(value).replace('%', '').replace('_', '')
-                hubspot_filters.append({
-                    "propertyName": column,
-                    "operator": hubspot_op,
-                    "value": search_term
-                })
+            hubspot_filter = FILTER_BUILDERS[op](column, hubspot_op, value)
+            if not hubspot_filter:
+                continue
 
-            else:
-                # Standard comparison operators (=, !=, >, <, >=, <=)
-                hubspot_filters.append({
-                    "propertyName": column,
-                    "operator": hubspot_op,
-                    "value": str(value)
-                })
+            # Filter values are strings or lists of strings
+            filter_key = tuple(
+                (key, tuple(item) if isinstance(item, list) else item) for key, item in hubspot_filter.items()
+            )
+            if filter_key not in seen_filters:
+                seen_filters.add(filter_key)
+                hubspot_filters.append(hubspot_filter)
 
-        return hubspot_filters
+        return _merge_exclusion_filters(hubspot_filters)
 
-    def _execute_with_retry(self, operation: Callable[[], Any], operation_name: str = "") -> Any:
+    @staticmethod
+    def _build_search_sorts(order_by_conditions: List) -> Optional[List[Dict]]:
+        """
+        Convert ORDER BY clauses to HubSpot search API sorts.
+
+        The search API sorts by a single property, so only an ORDER BY on one column can be pushed down.
+
+        Parameters
+        ----------
+        order_by_conditions : List
+            ORDER BY clauses of the query
+
+        Returns
+        -------
+        Optional[List[Dict]]
+            List of HubSpot sort dictionaries, or None if the clauses cannot be pushed down
+        """
+        if not order_by_conditions or len(order_by_conditions) != 1:
+            return None
+
+        order_by = order_by_conditions[0]
+        field = getattr(order_by, 'field', None)
+        if not hasattr(field, 'parts'):
+            return None
+
+        column = field.parts[-1]
+        direction = 'DESCENDING' if str(order_by.direction).lower() == 'desc' else 'ASCENDING'
+        return [{'propertyName': 'hs_object_id' if column == 'id' else column, 'direction': direction}]
+
+    @staticmethod
+    def _get_id_values(where_conditions: List[List]) -> Optional[List[Text]]:
+        """
+        Get the ids looked up by a WHERE clause made of a single `id = value` or `id IN (...)` condition.
+
+        Such lookups can be served by a batch read instead of the more strictly rate limited search API.
+
+        Parameters
+        ----------
+        where_conditions : List[List]
+            WHERE conditions in format [[operator, column, value], ...]
+
+        Returns
+        -------
+        Optional[List[Text]]
+            Distinct ids in query order, or None if the conditions are not an id lookup
+        """
+        if not where_conditions or len(where_conditions) != 1 or len(where_conditions[0]) < 3:
+            return None
+
+        op, column, value = where_conditions[0][:3]
+        if column != 'id' or op.lower() not in ('=', 'in'):
+            return None
+
+        values = value if isinstance(value, (list, tuple)) else [value]
+        return list(dict.fromkeys(str(v) for v in values))
+
+    @staticmethod
+    def _is_unsatisfiable(where_conditions: List[List]) -> bool:
+        """
+        Check whether WHERE conditions, which are combined with AND, can never be met.
+
+        Only contradictions evident from the conditions themselves are detected: different values
+        required of a column by `=` or `IN`, an empty range between the bounds of a column, or a value
+        required of a column that must be NULL. False does not mean that any object matches.
+
+        Parameters
+        ----------
+        where_conditions : List[List]
+            WHERE conditions in format [[operator, column, value], ...]
+
+        Returns
+        -------
+        bool
+            True if no object can match the conditions
+        """
+        allowed_values = {}
+        lower_bounds = {}
+        upper_bounds = {}
+        null_columns = set()
+        constrained_columns = set()
+
+        for condition in where_conditions or []:
+            if len(condition) < 3:
+                continue
+            op, column, value = condition[0].lower(), condition[1], condition[2]
+
+            if op in ('=', 'in'):
+                # HubSpot compares the string forms of the values
+                values = {str(v) for v in (value if isinstance(value, (list, tuple)) else [value])}
+                allowed_values[column] = allowed_values.get(column, values) & values
+                if not allowed_values[column]:
+                    return True
+            elif op in LOWER_BOUND_OPERATORS:
+                lower_bounds.setdefault(column, []).append((value, LOWER_BOUND_OPERATORS[op]))
+            elif op in UPPER_BOUND_OPERATORS:
+                upper_bounds.setdefault(column, []).append((value, UPPER_BOUND_OPERATORS[op]))
+            elif op == 'between' and isinstance(value, (list, tuple)) and len(value) == 2:
+                lower_bounds.setdefault(column, []).append((value[0], True))
+                upper_bounds.setdefault(column, []).append((value[1], True))
+            elif op == 'is null':
+                null_columns.add(column)
+                continue
+            elif op != 'is not null':
+                continue
+            constrained_columns.add(column)
+
+        if null_columns & constrained_columns:
+            return True
+
+        for column, lower in lower_bounds.items():
+            for low, low_inclusive in lower:
+                for high, high_inclusive in upper_bounds.get(column, []):
+                    if _are_comparable(low, high) and (
+                        low > high or (low == high and not (low_inclusive and high_inclusive))
+                    ):
+                        return True
+        return False
+
+    @staticmethod
+    def _get_requested_properties(
+        selected_columns: List[Text],
+        where_conditions: List[List] = None,
+        order_by_conditions: List = None
+    ) -> Optional[List[Text]]:
+        """
+        Determine which properties to request from HubSpot for a SELECT query.
+
+        Only the selected columns are requested, plus any column referenced by WHERE conditions
+        or ORDER BY clauses that are still evaluated locally, so they are present in the result.
+        When only `id` is needed, the single `hs_object_id` property is requested: HubSpot returns
+        the id with every object, and an empty property list would mean all properties.
+
+        Parameters
+        ----------
+        selected_columns : List[Text]
+            Columns selected by the query
+        where_conditions : List[List], optional
+            WHERE conditions that will be applied locally, in format [[operator, column, value], ...]
+        order_by_conditions : List, optional
+            ORDER BY clauses of the query
+
+        Returns
+        -------
+        Optional[List[Text]]
+            Property names to request, or None to use the table defaults
+        """
+        if not selected_columns:
+            return None
+
+        columns = list(selected_columns)
+        for condition in where_conditions or []:
+            if len(condition) >= 3:
+                columns.append(condition[1])
+        for order_by in order_by_conditions or []:
+            field = getattr(order_by, 'field', None)
+            if hasattr(field, 'parts'):
+                columns.append(field.parts[-1])
+
+        # Deduplicate while preserving order; `id` is always returned by HubSpot
+        return [column for column in dict.fromkeys(columns) if column != 'id'] or ['hs_object_id']
+
+    @staticmethod
+    def _get_filter_properties(where_conditions: List[List]) -> List[Text]:
+        """
+        Determine which properties to request from HubSpot to filter rows locally for UPDATE or DELETE.
+
+        Only the columns referenced by the WHERE conditions are needed besides the `id`, so the
+        frame the conditions are evaluated over is no wider than necessary.
+
+        Parameters
+        ----------
+        where_conditions : List[List]
+            WHERE conditions in format [[operator, column, value], ...]
+
+        Returns
+        -------
+        List[Text]
+            Property names to request; `hs_object_id` if the conditions only reference `id`
+        """
+        return HubSpotSearchMixin._get_requested_properties(['id'], where_conditions)
+
+    @staticmethod
+    def _iter_pages(
+        fetch_page: Callable[[Optional[Text], int], Any],
+        limit: Optional[int] = None,
+        after: Optional[Text] = None
+    ) -> Iterator[Any]:
+        """
+        Iterate over the objects of a cursor-paginated HubSpot endpoint.
+
+        Pages are requested lazily, so callers consuming the iterator never hold more than
+        one page of SDK objects at a time, and pagination stops as soon as `limit` is reached.
+
+        Parameters
+        ----------
+        fetch_page : Callable
+            Function taking the `after` cursor (None for the first page) and the page size,
+            and returning a HubSpot paged response
+        limit : int, optional
+            Maximum number of objects to return. If None, all pages are fetched.
+        after : Text, optional
+            Cursor to start from. If None, starts from the first page.
+
+        Returns
+        -------
+        Iterator[Any]
+            HubSpot SDK objects
+        """
+        fetched = 0
+
+        while True:
+            page_size = PAGE_SIZE if limit is None else min(PAGE_SIZE, limit - fetched)
+            if page_size <= 0:
+                return
+
+            response = fetch_page(after, page_size)
+            results = response.results or []
+            yield from results
+            fetched += len(results)
+
+            paging = getattr(response, 'paging', None)
+            next_page = getattr(paging, 'next', None) if paging else None
+            if not results or not next_page:
+                return
+            after = next_page.after
+
+    @staticmethod
+    def _iter_search_pages(
+        fetch_page: Callable[[Optional[Text], int], Any],
+        limit: Optional[int] = None
+    ) -> Iterator[Any]:
+        """
+        Iterate over the objects returned by a HubSpot search request.
+
+        Unlike list endpoints, search pages by numeric offset and reports the total number of
+        matches with the first page. Once the first page is in, the offsets of all remaining pages
+        are known, so they are requested concurrently (on up to `SEARCH_MAX_WORKERS` threads) and
+        yielded in order. If the response does not allow this, the remaining pages are read one
+        after another.
+
+        Parameters
+        ----------
+        fetch_page : Callable
+            Function taking the `after` cursor (None for the first page) and the page size,
+            and returning a HubSpot search response
+        limit : int, optional
+            Maximum number of objects to return. If None, all matches are fetched.
+
+        Returns
+        -------
+        Iterator[Any]
+            HubSpot SDK objects
+        """
+        page_size = PAGE_SIZE if limit is None else min(PAGE_SIZE, limit)
+        if page_size <= 0:
+            return
+
+        response = fetch_page(None, page_size)
+        results = response.results or []
+        yield from results
+
+        paging = getattr(response, 'paging', None)
+        next_page = getattr(paging, 'next', None) if paging else None
+        if not results or not next_page:
+            return
+
+        total = getattr(response, 'total', None)
+        if total is None or not str(next_page.after).isdigit():
+            remaining = None if limit is None else limit - len(results)
+            yield from HubSpotSearchMixin._iter_pages(fetch_page, remaining, after=next_page.after)
+            return
+
+        end = min(total, SEARCH_MAX_RESULTS) if limit is None else min(total, SEARCH_MAX_RESULTS, limit)
+        offsets = range(int(next_page.after), end, PAGE_SIZE)
+        if not offsets:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(SEARCH_MAX_WORKERS, len(offsets))) as executor:
+            responses = executor.map(lambda offset: fetch_page(str(offset), min(PAGE_SIZE, end - offset)), offsets)
+            for response in responses:
+                yield from response.results or []
+
+    @staticmethod
+    def _decode_page(response: Any) -> SimpleNamespace:
+        """
+        Decode a raw list or search page, as returned by the SDK when called with `_preload_content=False`.
+
+        Building the SDK's response models takes far longer than the request itself for large
+        pages, while only the ids, properties and paging of the objects are used; the body is
+        parsed with orjson into lightweight namespaces with just those attributes instead.
+
+        Parameters
+        ----------
+        response : Any
+            Raw HTTP response whose `data` holds the JSON body
+
+        Returns
+        -------
+        SimpleNamespace
+            Page with `results` (objects with `id` and `properties`), `paging` and `total`
+        """
+        data = orjson.loads(response.data)
+        next_page = (data.get('paging') or {}).get('next')
+        return SimpleNamespace(
+            results=[
+                SimpleNamespace(id=obj['id'], properties=obj.get('properties')) for obj in data.get('results', [])
+            ],
+            paging=SimpleNamespace(next=SimpleNamespace(after=next_page['after'])) if next_page else None,
+            total=data.get('total'),
+        )
+
+    @staticmethod
+    def _objects_to_dataframe(
+        objects: Iterable[Any],
+        properties: List[Text],
+        property_types: Dict[Text, Text] = None
+    ) -> pd.DataFrame:
+        """
+        Build a DataFrame from HubSpot SDK objects column by column.
+
+        The objects are consumed in batches of DATAFRAME_BATCH_SIZE as they are fetched; each
+        column of a batch is extracted with a single comprehension over the property dicts and
+        converted to an Arrow array with a fixed string schema, so only one batch of objects is
+        alive at a time. This avoids building a dict per row and the schema inference pass of
+        `pd.json_normalize`.
+
+        Parameters
+        ----------
+        objects : Iterable[Any]
+            HubSpot SDK objects exposing `id` and `properties`
+        properties : List[Text]
+            Property names to extract; they become the columns after `id`
+        property_types : Dict[Text, Text], optional
+            HubSpot property types ('number', 'datetime') of columns to convert from strings
+
+        Returns
+        -------
+        pd.DataFrame
+            DataFrame with an `id` column followed by one column per property
+        """
+        columns = list(dict.fromkeys(properties))
+        schema = pa.schema([pa.field(name, pa.string()) for name in ['id', *columns]])
+
+        batches = []
+        objects = iter(objects)
+        while batch := list(islice(objects, DATAFRAME_BATCH_SIZE)):
+            objects_properties = [obj.properties or {} for obj in batch]
+            batches.append(pa.record_batch(
+                [pa.array([obj.id for obj in batch], type=pa.string())] + [
+                    pa.array([obj_properties.get(prop) for obj_properties in objects_properties], type=pa.string())
+                    for prop in columns
+                ],
+                schema=schema,
+            ))
+        df = pa.Table.from_batches(batches, schema=schema).to_pandas()
+
+        for column, property_type in (property_types or {}).items():
+            converter = PROPERTY_TYPE_CONVERTERS.get(property_type)
+            if converter is not None and column in df.columns:
+                df[column] = converter(df[column])
+        return df
+
+    def _get_rows_incrementally(
+        self,
+        object_type: Text,
+        properties: List[Text],
+        limit: Optional[int],
+        get_objects: Callable[..., pd.DataFrame],
+        search_objects: Callable[..., pd.DataFrame],
+    ) -> pd.DataFrame:
+        """
+        Read objects without filters, reusing an earlier complete read when the row cache is enabled.
+
+        A read that returned every object is kept on the handler for `row_cache_ttl` seconds. Later
+        reads of the same properties only search for the objects modified since the newest
+        `hs_lastmodifieddate` of the cached rows and merge them in, so a repeated SELECT costs about
+        one request instead of one per page. Objects archived in HubSpot are only dropped by the next
+        full read; local writes invalidate the cache.
+
+        Parameters
+        ----------
+        object_type : Text
+            HubSpot object type (e.g., 'companies', 'contacts')
+        properties : List[Text]
+            Property names to fetch
+        limit : int, optional
+            Maximum number of objects to return
+        get_objects : Callable
+            Function reading objects, called with `properties` and `limit`
+        search_objects : Callable
+            Function searching objects, called with `filters` and `properties`
+
+        Returns
+        -------
+        pd.DataFrame
+            Objects with an `id` column and one column per property
+        """
+        if not self.handler.row_cache_ttl:
+            return get_objects(properties=properties, limit=limit)
+
+        properties = list(dict.fromkeys([*properties, 'hs_lastmodifieddate']))
+        key = (object_type, frozenset(properties))
+        cached = self.handler.row_cache.get(key)
+
+        if cached is not None and time.time() - cached[1] < self.handler.row_cache_ttl:
+            df, loaded_at = cached
+            watermark = pd.to_datetime(df['hs_lastmodifieddate'], utc=True, errors='coerce', format='ISO8601').max()
+            if not pd.isna(watermark):
+                # GTE: objects modified within the same millisecond as the watermark must not be missed
+                changes_df = search_objects(
+                    filters=[{
+                        "propertyName": "hs_lastmodifieddate",
+                        "operator": "GTE",
+                        "value": str(int(watermark.timestamp() * 1000)),
+                    }],
+                    properties=properties,
+                )
+                if len(changes_df) < SEARCH_MAX_RESULTS:
+                    logger.debug(f"Merging {len(changes_df)} modified {object_type} into cached rows")
+                    df = pd.concat([df, changes_df], ignore_index=True).drop_duplicates('id', keep='last')
+                    df = df.sort_values(
+                        'id', key=lambda ids: pd.to_numeric(ids, errors='coerce'), kind='stable', ignore_index=True
+                    )
+                    self.handler.row_cache[key] = (df, loaded_at)
+                    return df if limit is None else df.head(limit)
+
+        df = get_objects(properties=properties, limit=limit)
+        if limit is None or len(df) < limit:
+            # Only complete reads can be refreshed incrementally
+            self.handler.row_cache[key] = (df, time.time())
+        return df
+
+    def _search_with_cache(
+        self,
+        object_type: Text,
+        search_objects: Callable[..., pd.DataFrame],
+        filters: List[Dict],
+        properties: Optional[List[Text]],
+        limit: Optional[int],
+        sorts: Optional[List[Dict]] = None,
+    ) -> pd.DataFrame:
+        """
+        Run a search, reusing the results of an identical recent search when `row_cache_ttl` is set.
+
+        Results younger than `row_cache_ttl` are served as is. Older results are served for as long
+        again while the search is repeated in the background (stale-while-revalidate); after that,
+        or without cached results, the search runs and the caller waits for it. Without the cache,
+        identical searches running at the same time still share a single set of requests.
+
+        Parameters
+        ----------
+        object_type : Text
+            HubSpot object type searched, e.g. 'companies'
+        search_objects : Callable[..., pd.DataFrame]
+            Searches objects, e.g. `search_companies`; called with `filters`, `properties` and `limit`
+        filters : List[Dict]
+            HubSpot search filters
+        properties : List[Text], optional
+            Properties to fetch, as accepted by `search_objects`
+        limit : int, optional
+            Maximum number of results
+        sorts : List[Dict], optional
+            HubSpot search sorts; only passed to `search_objects` when given
+
+        Returns
+        -------
+        pd.DataFrame
+            The search results
+        """
+        search = partial(search_objects, filters=filters, properties=properties, limit=limit)
+        if sorts:
+            search = partial(search, sorts=sorts)
+
+        key = (
+            object_type,
+            orjson.dumps(filters, option=orjson.OPT_SORT_KEYS),
+            None if properties is None else tuple(properties),
+            limit,
+            orjson.dumps(sorts) if sorts else None,
+        )
+        ttl = self.handler.row_cache_ttl
+        if not ttl:
+            return self.handler.run_shared_search(key, search).copy()
+
+        cached = self.handler.search_cache.get(key)
+        if cached is not None:
+            df, searched_at = cached
+            age = time.time() - searched_at
+            if age < 2 * ttl:
+                if age >= ttl:
+                    self.handler.schedule_search_refresh(key, search)
+                return df.copy()
+        return self.handler.schedule_search_refresh(key, search).result().copy()
+
+    def _get_rows_to_modify(
+        self,
+        where_conditions: List[List],
+        get_objects: Callable[..., pd.DataFrame],
+        search_objects: Callable[..., pd.DataFrame],
+    ) -> pd.DataFrame:
+        """
+        Fetch the candidate rows of an UPDATE or DELETE, with the columns its WHERE conditions reference.
+
+        The conditions are pushed down to the search API when possible so only matching objects are
+        downloaded, and all objects are listed otherwise. The candidates still have to be filtered
+        locally, as HubSpot operators such as CONTAINS_TOKEN do not have exactly the SQL semantics.
+
+        Parameters
+        ----------
+        where_conditions : List[List]
+            WHERE conditions in format [[operator, column, value], ...]
+        get_objects : Callable[..., pd.DataFrame]
+            Lists all objects, e.g. `get_companies`; called with `properties`
+        search_objects : Callable[..., pd.DataFrame]
+            Searches objects, e.g. `search_companies`; called with `filters` and `properties`
+
+        Returns
+        -------
+        pd.DataFrame
+            Candidate rows with an `id` column and the columns referenced by the conditions
+        """
+        properties = self._get_filter_properties(where_conditions)
+        hubspot_filters = self._build_search_filters(where_conditions) if where_conditions else []
+        if hubspot_filters:
+            df = search_objects(filters=hubspot_filters, properties=properties)
+            if len(df) < SEARCH_MAX_RESULTS:
+                return df
+            # Search results are capped, so the matches may be incomplete
+            logger.info("Too many objects match the search filters, listing all objects instead")
+        return get_objects(properties=properties)
+
+    def _resolve_properties(self, object_type: Text, properties: Optional[Sequence[Text]] = None) -> Sequence[Text]:
+        """
+        Resolve the list of properties to request from HubSpot.
+
+        All properties are read from the handler's properties cache, which insert also uses to
+        validate columns, so fetches and inserts share one set of property definitions. The
+        tuple of all property names is kept per cache entry, so repeated queries for all
+        properties do not rebuild it.
+
+        Parameters
+        ----------
+        object_type : Text
+            HubSpot object type, e.g. 'companies'
+        properties : Sequence[Text], optional
+            Requested property names. None means DEFAULT_PROPERTIES, an empty list means all properties.
+
+        Returns
+        -------
+        Sequence[Text]
+            Property names to fetch
+        """
+        if properties is None:
+            # Default: fetch only essential properties
+            return self.DEFAULT_PROPERTIES
+        if len(properties) == 0:
+            # Empty list means fetch ALL available properties
+            properties_cache = self.handler.get_properties_cache(object_type)
+            cached_entry, all_properties = getattr(self, '_all_properties', (None, ()))
+            if cached_entry is not properties_cache:
+                all_properties = tuple(properties_cache.property_names)
+                self._all_properties = (properties_cache, all_properties)
+            return all_properties
+        # Specific properties requested
+        return properties
+
+    def _get_insert_columns(self, object_type: Text, fallback_columns: Collection[Text]) -> Collection[Text]:
+        """
+        Get the columns accepted by INSERT for an object type from the properties cache.
+
+        The cached frozenset of property names is returned as is, so validating the INSERT
+        columns against it does not copy or rehash the (possibly hundreds of) property names.
+
+        Parameters
+        ----------
+        object_type : Text
+            HubSpot object type (e.g., 'companies', 'contacts')
+        fallback_columns : Collection[Text]
+            Minimal set of columns used when properties cannot be loaded
+
+        Returns
+        -------
+        Collection[Text]
+            Supported column names
+        """
+        try:
+            properties_cache = self.handler.get_properties_cache(object_type)
+            return properties_cache.property_names
+        except Exception as e:
+            logger.warning(f"Failed to get dynamic columns for insert, using minimal set: {e}")
+            return fallback_columns
+
+    def _parse_insert_query(
+        self,
+        query: ast.Insert,
+        object_type: Text,
+        fallback_columns: Collection[Text],
+        mandatory_columns: List[Text],
+    ) -> List[Dict[Text, Any]]:
+        """
+        Parse an INSERT query, validating its columns against the cached HubSpot properties.
+
+        Writing rows never changes property definitions, so the properties cache is not
+        invalidated on DML. The only local signal that the cache is out of date is an INSERT
+        naming a column we do not know about (e.g. a property just created in HubSpot); in that
+        case the cache entry is invalidated and the query is validated once more against fresh
+        property definitions.
+
+        Parameters
+        ----------
+        query : ast.Insert
+            SQL INSERT query
+        object_type : Text
+            HubSpot object type (e.g., 'companies', 'contacts')
+        fallback_columns : Collection[Text]
+            Minimal set of columns used when properties cannot be loaded
+        mandatory_columns : List[Text]
+            Columns that must be present in the query
+
+        Returns
+        -------
+        List[Dict[Text, Any]]
+            Rows to create
+
+        Raises
+        ------
+        UnsupportedColumnException
+            If the query uses columns that do not exist in HubSpot
+        """
+        def parse(supported_columns: Collection[Text]) -> List[Dict[Text, Any]]:
+            return INSERTQueryParser(
+                query,
+                supported_columns=supported_columns,
+                mandatory_columns=mandatory_columns,
+                all_mandatory=False,
+            ).parse_query()
+
+        try:
+            return parse(self._get_insert_columns(object_type, fallback_columns))
+        except UnsupportedColumnException:
+            logger.info(f"Unknown column in INSERT into {object_type}, refreshing property definitions")
+            self.handler.invalidate_properties_cache(object_type)
+            return parse(self._get_insert_columns(object_type, fallback_columns))
+
+    def _execute_with_retry(
+        self,
+        operation: Callable[[], Any],
+        operation_name: str = "",
+        endpoint: str = "core"
+    ) -> Any:
         """
         Execute a HubSpot API operation with automatic retry on rate limits.
 
+        Every attempt first takes a token from the handler's rate limiter for the endpoint, so
+        concurrent callers stay under HubSpot's limits instead of relying on 429 responses.
+
         Parameters
         ----------
         operation : Callable
             Function that performs the API call
         operation_name : str
             Name of the operation for logging purposes
+        endpoint : str
+            Rate limit budget the call counts against: 'core' or 'search'
 
         Returns
         -------
@@ -164,8 +922,11 @@ class HubSpotSearchMixin:
         HubSpotAPIError
             If API call fails after all retries
         """
+        rate_limiter = self.handler.rate_limiters[endpoint]
+
         @with_retry(max_retries=5)
         def execute():
+            rate_limiter.acquire()
             try:
                 return operation()
             except Exception as e:
@@ -175,6 +936,65 @@ class HubSpotSearchMixin:
 
         return execute()
 
+    def _run_batches(
+        self,
+        items: Sequence[Any],
+        operation: Callable[[List[Any]], Any],
+        operation_name: str = ""
+    ) -> List[Any]:
+        """
+        Run a batch operation over items in chunks of `BATCH_SIZE`, with retry.
+
+        Chunks are dispatched concurrently on the handler's batch thread pool (see
+        `HubspotHandler.submit_batch`). All chunks are attempted even if some of them fail.
+
+        Parameters
+        ----------
+        items : Sequence[Any]
+            Items to process; any sliceable sequence, e.g. a NumPy array of ids
+        operation : Callable
+            Function that performs the API call for one chunk of items
+        operation_name : str
+            Name of the operation for logging purposes
+
+        Returns
+        -------
+        List[Any]
+            Responses of the API calls, in chunk order
+
+        Raises
+        ------
+        Exception
+            If any chunk fails after retries
+        """
+        chunks = chunk_list(items, chunk_size=BATCH_SIZE)
+        if len(chunks) <= 1:
+            return [self._execute_with_retry(partial(operation, chunk), operation_name) for chunk in chunks]
+
+        logger.info(f"Running {operation_name} for {len(items)} items in {len(chunks)} batches")
+        futures = [
+            self.handler.submit_batch(
+                self._execute_with_retry, partial(operation, chunk), f"{operation_name}_batch_{i}"
+            )
+            for i, chunk in enumerate(chunks, 1)
+        ]
+
+        responses = []
+        failed_chunks = []
+        for i, future in enumerate(futures, 1):
+            try:
+                responses.append(future.result())
+            except Exception as e:
+                logger.error(f"Batch {i}/{len(chunks)} of {operation_name} failed: {e}")
+                failed_chunks.append(i)
+
+        if failed_chunks:
+            raise Exception(
+                f"{operation_name} partially failed: "
+                f"{len(failed_chunks)}/{len(chunks)} batch(es) failed (batches: {failed_chunks})"
+            )
+        return responses
+
     def _batch_create_with_chunking(
         self,
         items: List[Dict[str, Any]],
@@ -240,7 +1060,7 @@ class HubSpotSearchMixin:
         item_name: str = "items"
     ) -> None:
         """
-        Update items in batches with automatic chunking and retry.
+        Update items in batches with automatic chunking and retry, dispatching the batches concurrently.
 
         Parameters
         ----------
@@ -262,38 +1082,10 @@ class HubSpotSearchMixin:
             logger.info(f"No {item_name} to update")
             return
 
-        if len(item_ids) <= 100:
-            # Small batch, execute directly with retry
-            self._execute_with_retry(
-                lambda: update_func(item_ids, values_to_update),
-                f"update_{item_name}"
-            )
-            logger.info(f"Updated {len(item_ids)} {item_name}")
-        else:
-            # Large batch, use chunking
-            logger.info(f"Updating {len(item_ids)} {item_name} in multiple batches...")
-
-            chunks = chunk_list(item_ids, chunk_size=100)
-            failed_chunks = []
-
-            for i, chunk in enumerate(chunks, 1):
-                try:
-                    self._execute_with_retry(
-                        lambda: update_func(chunk, values_to_update),
-                        f"update_{item_name}_batch_{i}"
-                    )
-                    logger.debug(f"Updated batch {i}/{len(chunks)} ({len(chunk)} {item_name})")
-                except Exception as e:
-                    logger.error(f"Failed to update batch {i}/{len(chunks)}: {e}")
-                    failed_chunks.append(i)
-
-            if failed_chunks:
-                raise Exception(
-                    f"{item_name.capitalize()} update partially failed: "
-                    f"{len(failed_chunks)} batch(es) failed (batches: {failed_chunks})"
-                )
-            else:
-                logger.info(f"Successfully updated all {len(item_ids)} {item_name}")
+        # Chunks are dispatched concurrently; the chunk is an argument of the operation rather than
+        # captured from a loop variable, so every worker updates its own chunk
+        self._run_batches(item_ids, lambda chunk: update_func(chunk, values_to_update), f"update_{item_name}")
+        logger.info(f"Updated {len(item_ids)} {item_name}")
 
     def _batch_delete_with_chunking(
         self,
@@ -302,7 +1094,7 @@ class HubSpotSearchMixin:
         item_name: str = "items"
     ) -> None:
         """
-        Delete (archive) items in batches with automatic chunking and retry.
+        Delete (archive) items in batches with automatic chunking and retry, dispatching the batches concurrently.
 
         Parameters
         ----------
@@ -322,35 +1114,6 @@ class HubSpotSearchMixin:
             logger.info(f"No {item_name} to delete")
             return
 
-        if len(item_ids) <= 100:
-            # Small batch, execute directly with retry
-            self._execute_with_retry(
-                lambda: delete_func(item_ids),
-                f"delete_{item_name}"
-            )
-            logger.info(f"Deleted {len(item_ids)} {item_name}")
-        else:
-            # Large batch, use chunking
-            logger.info(f"Deleting {len(item_ids)} {item_name} in multiple batches...")
-
-            chunks = chunk_list(item_ids, chunk_size=100)
-            failed_chunks = []
-
-            for i, chunk in enumerate(chunks, 1):
-                try:
-                    self._execute_with_retry(
-                        lambda: delete_func(chunk),
-                        f"delete_{item_name}_batch_{i}"
-                    )
-                    logger.debug(f"Deleted batch {i}/{len(chunks)} ({len(chunk)} {item_name})")
-                except Exception as e:
-                    logger.error(f"Failed to delete batch {i}/{len(chunks)}: {e}")
-                    failed_chunks.append(i)
-
-            if failed_chunks:
-                raise Exception(
-                    f"{item_name.capitalize()} deletion partially failed: "
-                    f"{len(failed_chunks)} batch(es) failed (batches: {failed_chunks})"
-                )
-            else:
-                logger.info(f"Successfully deleted all {len(item_ids)} {item_name}")
+        # Chunks are dispatched concurrently
+        self._run_batches(item_ids, delete_func, f"delete_{item_name}")
+        logger.info(f"Deleted {len(item_ids)} {item_name}")
@@ -1,24 +1,18 @@
-from typing import List, Dict, Text, Any
+from typing import List, Dict, Text, Tuple, Any
 import pandas as pd
 from hubspot.crm.objects import (
-    SimplePublicObjectId as HubSpotObjectId,
-    SimplePublicObjectBatchInput as HubSpotObjectBatchInput,
     SimplePublicObjectInputForCreate as HubSpotObjectInputCreate,
-    BatchInputSimplePublicObjectId as HubSpotBatchObjectIdInput,
-    BatchInputSimplePublicObjectBatchInput as HubSpotBatchObjectBatchInput,
     BatchInputSimplePublicObjectBatchInputForCreate as HubSpotBatchObjectInputCreate,
 )
 
 from mindsdb_sql_parser import ast
 from mindsdb.integrations.libs.api_handler import APITable
 from mindsdb.integrations.utilities.handlers.query_utilities import (
-    INSERTQueryParser,
     SELECTQueryParser,
     UPDATEQueryParser,
     DELETEQueryParser,
     SELECTQueryExecutor,
     UPDATEQueryExecutor,
-    DELETEQueryExecutor,
 )
 from mindsdb.utilities import log
 from mindsdb.integrations.handlers.hubspot_handler.tables.crm.base_hubspot_table import HubSpotSearchMixin
@@ -29,12 +23,13 @@ logger = log.getLogger(__name__)
 class CallsTable(HubSpotSearchMixin, APITable):
     """Hubspot Calls table (Activity)."""
 
-    DEFAULT_PROPERTIES = [
+    DEFAULT_PROPERTIES = (
         'hs_timestamp', 'hs_call_title', 'hs_call_body', 'hs_call_duration',
         'hs_call_from_number', 'hs_call_to_number', 'hs_call_status',
         'hs_call_direction', 'hs_call_disposition', 'hubspot_owner_id',
         'createdate', 'hs_lastmodifieddate'
-    ]
+    )
+    COLUMNS = ('id', *DEFAULT_PROPERTIES)
 
     def select(self, query: ast.Select) -> pd.DataFrame:
         """Pulls Hubspot Calls data"""
@@ -53,23 +48,17 @@ class CallsTable(HubSpotSearchMixin, APITable):
             hubspot_filters = self._build_search_filters(where_conditions)
             if hubspot_filters:
                 logger.info(f"Using HubSpot search API with {len(hubspot_filters)} filter(s)")
-                calls_df = pd.json_normalize(
-                    self.search_calls(
-                        filters=hubspot_filters,
-                        properties=requested_properties,
-                        limit=result_limit
-                    )
+                calls_df = self.search_calls(
+                    filters=hubspot_filters,
+                    properties=requested_properties,
+                    limit=result_limit
                 )
                 where_conditions = []
             else:
                 logger.info("No valid HubSpot filters, using get_all")
-                calls_df = pd.json_normalize(
-                    self.get_calls(limit=result_limit, properties=requested_properties)
-                )
+                calls_df = self.get_calls(limit=result_limit, properties=requested_properties)
         else:
-            calls_df = pd.json_normalize(
-                self.get_calls(limit=result_limit, properties=requested_properties)
-            )
+            calls_df = self.get_calls(limit=result_limit, properties=requested_properties)
 
         # Filter selected_columns to only include columns that actually exist in the dataframe
         # This handles cases where requested properties don't exist in HubSpot
@@ -90,20 +79,12 @@ class CallsTable(HubSpotSearchMixin, APITable):
 
     def insert(self, query: ast.Insert) -> None:
         """Inserts data into HubSpot Calls"""
-        try:
-            properties_cache = self.handler.get_properties_cache('calls')
-            supported_columns = list(properties_cache['property_names'])
-        except Exception as e:
-            logger.warning(f"Failed to get dynamic columns for insert: {e}")
-            supported_columns = ['hs_timestamp', 'hs_call_title', 'hs_call_duration']
-
-        insert_statement_parser = INSERTQueryParser(
+        calls_data = self._parse_insert_query(
             query,
-            supported_columns=supported_columns,
+            'calls',
+            fallback_columns=['hs_timestamp', 'hs_call_title', 'hs_call_duration'],
             mandatory_columns=['hs_timestamp'],
-            all_mandatory=False,
         )
-        calls_data = insert_statement_parser.parse_query()
         self.create_calls(calls_data)
 
     def update(self, query: ast.Update) -> None:
@@ -111,10 +92,7 @@ class CallsTable(HubSpotSearchMixin, APITable):
         update_statement_parser = UPDATEQueryParser(query)
         values_to_update, where_conditions = update_statement_parser.parse_query()
 
-        calls_df = pd.json_normalize(self.get_calls())
-        update_query_executor = UPDATEQueryExecutor(calls_df, where_conditions)
-        calls_df = update_query_executor.execute_query()
-        call_ids = calls_df['id'].tolist()
+        call_ids = self._resolve_ids(where_conditions)
         self.update_calls(call_ids, values_to_update)
 
     def delete(self, query: ast.Delete) -> None:
@@ -122,138 +100,136 @@ class CallsTable(HubSpotSearchMixin, APITable):
         delete_statement_parser = DELETEQueryParser(query)
         where_conditions = delete_statement_parser.parse_query()
 
-        calls_df = pd.json_normalize(self.get_calls())
-        delete_query_executor = DELETEQueryExecutor(calls_df, where_conditions)
-        calls_df = delete_query_executor.execute_query()
-        call_ids = calls_df['id'].tolist()
+        call_ids = self._resolve_ids(where_conditions)
         self.delete_calls(call_ids)
 
-    def get_columns(self) -> List[Text]:
-        """Get column names for the table"""
-        return ['id'] + self.DEFAULT_PROPERTIES
+    def _resolve_ids(self, where_conditions: List[List]) -> List[Text]:
+        """Get the IDs of the calls matching the WHERE conditions of an UPDATE or DELETE"""
+        calls_df = self._get_rows_to_modify(where_conditions, self.get_calls, self.search_calls)
+        if where_conditions and self._get_id_values(where_conditions) is None:
+            # An id lookup is matched exactly by the search; other conditions are re-checked locally
+            calls_df = UPDATEQueryExecutor(calls_df, where_conditions).execute_query()
+        return calls_df['id'].tolist()
+
+    def get_columns(self) -> Tuple[Text, ...]:
+        """Get column names for the table; the tuple is built once per class"""
+        return self.COLUMNS
 
-    def get_calls(self, properties: List[Text] = None, **kwargs) -> List[Dict]:
-        """Fetch calls with specified properties"""
+    def get_calls(self, properties: List[Text] = None, limit: int = None, **kwargs) -> pd.DataFrame:
+        """Fetch calls with specified properties, page by page until `limit` is reached"""
         hubspot = self.handler.connect()
 
         if properties is None:
-            properties_to_fetch = self.DEFAULT_PROPERTIES
+            properties_to_fetch = list(self.DEFAULT_PROPERTIES)
         elif len(properties) == 0:
             properties_cache = self.handler.get_properties_cache('calls')
-            properties_to_fetch = list(properties_cache['property_names'])
+            properties_to_fetch = list(properties_cache.property_names)
         else:
             properties_to_fetch = properties
 
-        kwargs['properties'] = properties_to_fetch
-
-        # Use basic_api.get_page for activity objects
-        response = hubspot.crm.objects.basic_api.get_page(
-            object_type="calls",
-            **kwargs
-        )
-
-        calls_dict = []
-        for call in response.results:
-            call_dict = {"id": call.id}
-            if hasattr(call, 'properties') and call.properties:
-                for prop_name, prop_value in call.properties.items():
-                    call_dict[prop_name] = prop_value
-            calls_dict.append(call_dict)
+        def fetch_page(after, page_size):
+            return self._execute_with_retry(
+                lambda: self._decode_page(hubspot.crm.objects.basic_api.get_page(
+                    object_type="calls",
+                    limit=page_size,
+                    after=after,
+                    properties=properties_to_fetch,
+                    _preload_content=False,
+                    **kwargs
+                )),
+                "get_calls"
+            )
 
-        return calls_dict
+        return self._objects_to_dataframe(self._iter_pages(fetch_page, limit), properties_to_fetch)
 
-    def search_calls(self, filters: List[Dict], properties: List[Text] = None, limit: int = None) -> List[Dict]:
+    def search_calls(self, filters: List[Dict], properties: List[Text] = None, limit: int = None) -> pd.DataFrame:
         """Search calls using HubSpot search API"""
         hubspot = self.handler.connect()
 
         if properties is None:
-            properties_to_fetch = self.DEFAULT_PROPERTIES
+            properties_to_fetch = list(self.DEFAULT_PROPERTIES)
         elif len(properties) == 0:
             properties_cache = self.handler.get_properties_cache('calls')
-            properties_to_fetch = list(properties_cache['property_names'])
+            properties_to_fetch = list(properties_cache.property_names)
         else:
             properties_to_fetch = properties
 
-        search_request = {
-            "filterGroups": [{"filters": filters}],
-            "properties": properties_to_fetch,
-            "limit": min(limit or 100, 100),
-        }
-
-        all_calls = []
-        after = 0
-
-        try:
-            while True:
-                if after > 0:
-                    search_request["after"] = after
-
-                response = hubspot.crm.objects.search_api.do_search(
+        def fetch_page(after, page_size):
+            search_request = {
+                "filterGroups": [{"filters": filters}],
+                "properties": properties_to_fetch,
+                "limit": page_size,
+            }
+            if after:
+                search_request["after"] = after
+            return self._execute_with_retry(
+                lambda: hubspot.crm.objects.search_api.do_search(
                     object_type="calls",
                     public_object_search_request=search_request
-                )
-
-                for call in response.results:
-                    call_dict = {"id": call.id}
-                    if hasattr(call, 'properties') and call.properties:
-                        for prop_name, prop_value in call.properties.items():
-                            call_dict[prop_name] = prop_value
-                    all_calls.append(call_dict)
-
-                if limit and len(all_calls) >= limit:
-                    all_calls = all_calls[:limit]
-                    break
-
-                if not hasattr(response, 'paging') or not response.paging:
-                    break
-
-                if hasattr(response.paging, 'next') and response.paging.next:
-                    after = response.paging.next.after
-                else:
-                    break
+                ),
+                "search_calls",
+                endpoint="search"
+            )
 
+        try:
+            # Pages after the first are requested concurrently while the earlier ones are converted
+            calls_df = self._objects_to_dataframe(self._iter_search_pages(fetch_page, limit), properties_to_fetch)
         except Exception as e:
             logger.error(f"Error searching calls: {e}")
             raise Exception(f"Call search failed: {e}")
 
-        logger.info(f"Found {len(all_calls)} calls matching filters")
-        return all_calls
+        logger.info(f"Found {len(calls_df)} calls matching filters")
+        return calls_df
 
     def create_calls(self, calls_data: List[Dict[Text, Any]]) -> None:
-        """Create calls"""
+        """Create calls; the SDK inputs are built one batch at a time"""
         hubspot = self.handler.connect()
-        calls_to_create = [HubSpotObjectInputCreate(properties=call) for call in calls_data]
-        try:
-            created_calls = hubspot.crm.objects.batch_api.create(
+
+        def create_batch(batch: List[Dict[Text, Any]]):
+            return hubspot.crm.objects.batch_api.create(
                 object_type="calls",
-                batch_input_simple_public_object_input_for_create=HubSpotBatchObjectInputCreate(inputs=calls_to_create)
+                batch_input_simple_public_object_input_for_create=HubSpotBatchObjectInputCreate(
+                    inputs=[HubSpotObjectInputCreate(properties=call) for call in batch]
+                )
             )
-            logger.info(f"Calls created with IDs {[call.id for call in created_calls.results]}")
+
+        try:
+            responses = self._run_batches(calls_data, create_batch, "create_calls")
+            logger.info(f"Calls created with IDs {[call.id for response in responses for call in response.results]}")
         except Exception as e:
             raise Exception(f"Calls creation failed: {e}")
 
     def update_calls(self, call_ids: List[Text], values_to_update: Dict[Text, Any]) -> None:
-        """Update calls"""
+        """Update calls; the request bodies are built one batch at a time"""
         hubspot = self.handler.connect()
-        calls_to_update = [HubSpotObjectBatchInput(id=call_id, properties=values_to_update) for call_id in call_ids]
-        try:
-            updated_calls = hubspot.crm.objects.batch_api.update(
+
+        def update_batch(batch: List[Text]):
+            return hubspot.crm.objects.batch_api.update(
                 object_type="calls",
-                batch_input_simple_public_object_batch_input=HubSpotBatchObjectBatchInput(inputs=calls_to_update)
+                # Plain dicts serialize to the same body as the SDK models, without building them
+                batch_input_simple_public_object_batch_input={
+                    "inputs": [{"id": call_id, "properties": values_to_update} for call_id in batch]
+                }
             )
-            logger.info(f"Calls with IDs {[call.id for call in updated_calls.results]} updated")
+
+        try:
+            responses = self._run_batches(call_ids, update_batch, "update_calls")
+            logger.info(f"Calls with IDs {[call.id for response in responses for call in response.results]} updated")
         except Exception as e:
             raise Exception(f"Calls update failed: {e}")
 
     def delete_calls(self, call_ids: List[Text]) -> None:
-        """Delete calls"""
+        """Delete calls; the request bodies are built one batch at a time"""
         hubspot = self.handler.connect()
-        calls_to_delete = [HubSpotObjectId(id=call_id) for call_id in call_ids]
-        try:
-            hubspot.crm.objects.batch_api.archive(
+
+        def delete_batch(batch: List[Text]):
+            return hubspot.crm.objects.batch_api.archive(
                 object_type="calls",
-                batch_input_simple_public_object_id=HubSpotBatchObjectIdInput(inputs=calls_to_delete)
+                batch_input_simple_public_object_id={"inputs": [{"id": call_id} for call_id in batch]}
             )
+
+        try:
+            self._run_batches(call_ids, delete_batch, "delete_calls")
             logger.info("Calls deleted")
         except Exception as e:
             raise Exception(f"Calls deletion failed: {e}")
@@ -1,4 +1,4 @@
-from typing import List, Dict, Text, Any
+from typing import List, Dict, Sequence, Text, Any
 import pandas as pd
 from hubspot.crm.objects import (
     SimplePublicObjectId as HubSpotObjectId,
@@ -12,7 +12,6 @@ from hubspot.crm.objects import (
 from mindsdb_sql_parser import ast
 from mindsdb.integrations.libs.api_handler import APITable
 from mindsdb.integrations.utilities.handlers.query_utilities import (
-    INSERTQueryParser,
     SELECTQueryParser,
     UPDATEQueryParser,
     DELETEQueryParser,
@@ -31,11 +30,23 @@ class CompaniesTable(HubSpotSearchMixin, APITable):
     """Hubspot Companies table."""
 
     # Default essential properties to fetch (to avoid overloading with 100+ properties)
-    DEFAULT_PROPERTIES = [
+    DEFAULT_PROPERTIES = (
         'name', 'domain', 'city', 'state', 'country', 'phone', 'industry',
         'website', 'description', 'numberofemployees', 'annualrevenue',
         'createdate', 'hs_lastmodifieddate'
-    ]
+    )
+
+    # Columns accepted by INSERT when the property definitions cannot be loaded
+    INSERT_FALLBACK_COLUMNS = frozenset({'name', 'city', 'phone', 'state', 'domain', 'industry'})
+
+    # HubSpot types of the default properties that are returned as typed columns instead of strings
+    PROPERTY_TYPES = {
+        'industry': 'enumeration',
+        'numberofemployees': 'number',
+        'annualrevenue': 'number',
+        'createdate': 'datetime',
+        'hs_lastmodifieddate': 'datetime',
+    }
 
     def select(self, query: ast.Select) -> pd.DataFrame:
         """
@@ -65,42 +76,44 @@ class CompaniesTable(HubSpotSearchMixin, APITable):
         )
         selected_columns, where_conditions, order_by_conditions, result_limit = select_statement_parser.parse_query()
 
+        if result_limit == 0:
+            # Schema discovery probes (LIMIT 0) only need the typed, empty columns
+            properties = [column for column in selected_columns if column != 'id']
+            return self._objects_to_dataframe([], properties, self.PROPERTY_TYPES)[selected_columns]
+
+        # Convert WHERE conditions to HubSpot search filters
+        hubspot_filters = self._build_search_filters(where_conditions) if where_conditions else []
+        if hubspot_filters:
+            # Filters will be applied at API level
+            where_conditions = []
+
         # Determine which properties to fetch from HubSpot API
-        # If specific columns are requested, fetch only those (+ id)
-        # If SELECT * is used, fetch only default essential properties
-        requested_properties = None
-        if selected_columns and len(selected_columns) > 0:
-            # User requested specific columns - fetch only those
-            requested_properties = [col for col in selected_columns if col != 'id']
-        # else: Will use default properties in get_companies()
-
-        # Check if WHERE conditions exist - use search API if they do
-        if where_conditions and len(where_conditions) > 0:
-            # Convert WHERE conditions to HubSpot search filters
-            hubspot_filters = self._build_search_filters(where_conditions)
-
-            if hubspot_filters:
-                # Use search API with filters
-                logger.info(f"Using HubSpot search API with {len(hubspot_filters)} filter(s)")
-                companies_df = pd.json_normalize(
-                    self.search_companies(
-                        filters=hubspot_filters,
-                        properties=requested_properties,
-                        limit=result_limit
-                    )
-                )
-                # Filters already applied at API level
-                where_conditions = []
-            else:
+        # If specific columns are requested, fetch only those plus any column still needed
+        # to evaluate WHERE/ORDER BY locally. If SELECT * is used, fetch only default essential properties
+        requested_properties = self._get_requested_properties(
+            selected_columns, where_conditions, order_by_conditions
+        )
+
+        if hubspot_filters:
+            # Use search API with filters
+            logger.info(f"Using HubSpot search API with {len(hubspot_filters)} filter(s)")
+            companies_df = self._search_with_cache(
+                'companies',
+                self.search_companies,
+                filters=hubspot_filters,
+                properties=requested_properties,
+                limit=result_limit,
+            )
+        else:
+            if where_conditions:
                 # No valid filters, fall back to get_all
                 logger.info("No valid HubSpot filters, using get_all")
-                companies_df = pd.json_normalize(
-                    self.get_companies(limit=result_limit, properties=requested_properties)
-                )
-        else:
-            # No WHERE clause, use get_all
-            companies_df = pd.json_normalize(
-                self.get_companies(limit=result_limit, properties=requested_properties)
+            companies_df = self._get_rows_incrementally(
+                'companies',
+                self._resolve_properties('companies', requested_properties),
+                result_limit,
+                self.get_companies,
+                self.search_companies,
             )
 
         # Filter selected_columns to only include columns that actually exist in the dataframe
@@ -141,21 +154,12 @@ class CompaniesTable(HubSpotSearchMixin, APITable):
         ValueError
             If the query contains an unsupported condition
         """
-        # Get dynamic list of supported columns from properties cache
-        try:
-            properties_cache = self.handler.get_properties_cache('companies')
-            supported_columns = list(properties_cache['property_names'])
-        except Exception as e:
-            logger.warning(f"Failed to get dynamic columns for insert, using minimal set: {e}")
-            supported_columns = ['name', 'city', 'phone', 'state', 'domain', 'industry']
-
-        insert_statement_parser = INSERTQueryParser(
+        company_data = self._parse_insert_query(
             query,
-            supported_columns=supported_columns,
+            'companies',
+            fallback_columns=self.INSERT_FALLBACK_COLUMNS,
             mandatory_columns=['name'],
-            all_mandatory=False,
         )
-        company_data = insert_statement_parser.parse_query()
         self.create_companies(company_data)
 
     def update(self, query: ast.Update) -> None:
@@ -179,14 +183,14 @@ class CompaniesTable(HubSpotSearchMixin, APITable):
         update_statement_parser = UPDATEQueryParser(query)
         values_to_update, where_conditions = update_statement_parser.parse_query()
 
-        companies_df = pd.json_normalize(self.get_companies())
+        companies_df = self._get_rows_to_modify(where_conditions, self.get_companies, self.search_companies)
         update_query_executor = UPDATEQueryExecutor(
             companies_df,
             where_conditions
         )
 
         companies_df = update_query_executor.execute_query()
-        company_ids = companies_df['id'].tolist()
+        company_ids = companies_df['id'].to_numpy()
         self.update_companies(company_ids, values_to_update)
 
     def delete(self, query: ast.Delete) -> None:
@@ -210,14 +214,14 @@ class CompaniesTable(HubSpotSearchMixin, APITable):
         delete_statement_parser = DELETEQueryParser(query)
         where_conditions = delete_statement_parser.parse_query()
 
-        companies_df = pd.json_normalize(self.get_companies())
+        companies_df = self._get_rows_to_modify(where_conditions, self.get_companies, self.search_companies)
         delete_query_executor = DELETEQueryExecutor(
             companies_df,
             where_conditions
         )
 
         companies_df = delete_query_executor.execute_query()
-        company_ids = companies_df['id'].tolist()
+        company_ids = companies_df['id'].to_numpy()
         self.delete_companies(company_ids)
 
     def get_columns(self) -> List[Text]:
@@ -227,58 +231,50 @@ class CompaniesTable(HubSpotSearchMixin, APITable):
         Users can still query specific custom properties explicitly in SELECT.
         """
         # Return id + default essential properties
-        return ['id'] + self.DEFAULT_PROPERTIES
+        return ['id', *self.DEFAULT_PROPERTIES]
 
-    def get_companies(self, properties: List[Text] = None, **kwargs) -> List[Dict]:
+    def get_companies(self, properties: List[Text] = None, limit: int = None, **kwargs) -> pd.DataFrame:
         """
         Fetch companies with specified properties.
 
+        Pages through the companies list endpoint directly, stopping as soon as `limit`
+        companies have been read.
+
         Parameters
         ----------
         properties : List[Text], optional
             List of property names to fetch. If None, fetches DEFAULT_PROPERTIES.
             To fetch ALL properties, pass an empty list [].
+        limit : int, optional
+            Maximum number of companies to return. If None, fetches all companies.
         **kwargs : dict
-            Additional arguments to pass to the HubSpot API (e.g., limit)
+            Additional arguments to pass to the HubSpot API (e.g., archived)
 
         Returns
         -------
-        List[Dict]
-            List of company dictionaries with requested properties
+        pd.DataFrame
+            Companies with an `id` column and one column per requested property
         """
         hubspot = self.handler.connect()
+        properties_to_fetch = self._resolve_properties('companies', properties)
+
+        def fetch_page(after, page_size):
+            return self._execute_with_retry(
+                lambda: self._decode_page(hubspot.crm.companies.basic_api.get_page(
+                    limit=page_size,
+                    after=after,
+                    properties=properties_to_fetch,
+                    _preload_content=False,
+                    **kwargs
+                )),
+                "get_companies",
+            )
 
-        # Determine which properties to request from HubSpot
-        if properties is None:
-            # Default: fetch only essential properties
-            properties_to_fetch = self.DEFAULT_PROPERTIES
-        elif len(properties) == 0:
-            # Empty list means fetch ALL available properties
-            properties_cache = self.handler.get_properties_cache('companies')
-            properties_to_fetch = list(properties_cache['property_names'])
-        else:
-            # Specific properties requested
-            properties_to_fetch = properties
-
-        # Add properties parameter to API call
-        kwargs['properties'] = properties_to_fetch
-        companies = hubspot.crm.companies.get_all(**kwargs)
-
-        companies_dict = []
-        for company in companies:
-            # Start with the ID
-            company_dict = {"id": company.id}
-
-            # Extract properties that were returned
-            if hasattr(company, 'properties') and company.properties:
-                for prop_name, prop_value in company.properties.items():
-                    company_dict[prop_name] = prop_value
-
-            companies_dict.append(company_dict)
-
-        return companies_dict
+        return self._objects_to_dataframe(
+            self._iter_pages(fetch_page, limit), properties_to_fetch, self.PROPERTY_TYPES
+        )
 
-    def search_companies(self, filters: List[Dict], properties: List[Text] = None, limit: int = None) -> List[Dict]:
+    def search_companies(self, filters: List[Dict], properties: List[Text] = None, limit: int = None) -> pd.DataFrame:
         """
         Search companies using HubSpot search API with filters.
 
@@ -293,99 +289,89 @@ class CompaniesTable(HubSpotSearchMixin, APITable):
 
         Returns
         -------
-        List[Dict]
-            List of company dictionaries matching the filters
+        pd.DataFrame
+            Companies matching the filters
         """
         hubspot = self.handler.connect()
-
-        # Determine which properties to request
-        if properties is None:
-            properties_to_fetch = self.DEFAULT_PROPERTIES
-        elif len(properties) == 0:
-            properties_cache = self.handler.get_properties_cache('companies')
-            properties_to_fetch = list(properties_cache['property_names'])
-        else:
-            properties_to_fetch = properties
-
-        # Build search request
-        search_request = {
-            "filterGroups": [{"filters": filters}],
-            "properties": properties_to_fetch,
-            "limit": min(limit or 100, 100),  # HubSpot max is 100 per page
-        }
-
-        # Pagination to fetch all results
-        all_companies = []
-        after = 0
+        properties_to_fetch = self._resolve_properties('companies', properties)
+
+        def fetch_page(after, page_size):
+            search_request = {
+                "filterGroups": [{"filters": filters}],
+                "properties": properties_to_fetch,
+                "limit": page_size,
+            }
+            if after:
+                search_request["after"] = after
+            return self._execute_with_retry(
+                lambda: self._decode_page(hubspot.crm.companies.search_api.do_search(
+                    public_object_search_request=search_request, _preload_content=False
+                )),
+                "search_companies",
+                endpoint="search",
+            )
 
         try:
-            while True:
-                if after > 0:
-                    search_request["after"] = after
-
-                # Call HubSpot search API
-                response = hubspot.crm.companies.search_api.do_search(
-                    public_object_search_request=search_request
-                )
-
-                # Extract companies from response
-                for company in response.results:
-                    company_dict = {"id": company.id}
-                    if hasattr(company, 'properties') and company.properties:
-                        for prop_name, prop_value in company.properties.items():
-                            company_dict[prop_name] = prop_value
-                    all_companies.append(company_dict)
-
-                # Check if we've reached the limit
-                if limit and len(all_companies) >= limit:
-                    all_companies = all_companies[:limit]
-                    break
-
-                # Check if there are more results
-                if not hasattr(response, 'paging') or not response.paging:
-                    break
-
-                if hasattr(response.paging, 'next') and response.paging.next:
-                    after = response.paging.next.after
-                else:
-                    break
-
+            companies_df = self._objects_to_dataframe(
+                self._iter_search_pages(fetch_page, limit), properties_to_fetch, self.PROPERTY_TYPES
+            )
         except Exception as e:
             logger.error(f"Error searching companies: {e}")
             raise Exception(f"Company search failed: {e}")
 
-        logger.info(f"Found {len(all_companies)} companies matching filters")
-        return all_companies
+        logger.info(f"Found {len(companies_df)} companies matching filters")
+        return companies_df
 
     def create_companies(self, companies_data: List[Dict[Text, Any]]) -> None:
         hubspot = self.handler.connect()
-        companies_to_create = [HubSpotObjectInputCreate(properties=company) for company in companies_data]
-        try:
-            created_companies = hubspot.crm.companies.batch_api.create(
-                HubSpotBatchObjectInputCreate(inputs=companies_to_create),
+
+        def create_batch(batch: List[Dict[Text, Any]]):
+            return hubspot.crm.companies.batch_api.create(
+                HubSpotBatchObjectInputCreate(
+                    inputs=[HubSpotObjectInputCreate(properties=company) for company in batch]
+                ),
             )
-            logger.info(f"Companies created with ID's {[created_company.id for created_company in created_companies.results]}")
+
+        try:
+            responses = self._run_batches(companies_data, create_batch, "create_companies")
+            created_ids = [created_company.id for response in responses for created_company in response.results]
+            logger.info(f"Companies created with ID's {created_ids}")
         except Exception as e:
             raise Exception(f"Companies creation failed {e}")
+        finally:
+            self.handler.invalidate_row_cache('companies')
 
-    def update_companies(self, company_ids: List[Text], values_to_update: Dict[Text, Any]) -> None:
+    def update_companies(self, company_ids: Sequence[Text], values_to_update: Dict[Text, Any]) -> None:
         hubspot = self.handler.connect()
-        companies_to_update = [HubSpotObjectBatchInput(id=company_id, properties=values_to_update) for company_id in company_ids]
-        try:
-            updated_companies = hubspot.crm.companies.batch_api.update(
-                HubSpotBatchObjectBatchInput(inputs=companies_to_update),
+
+        def update_batch(batch: Sequence[Text]):
+            return hubspot.crm.companies.batch_api.update(
+                HubSpotBatchObjectBatchInput(
+                    inputs=[HubSpotObjectBatchInput(id=company_id, properties=values_to_update) for company_id in batch]
+                ),
             )
-            logger.info(f"Companies with ID {[updated_company.id for updated_company in updated_companies.results]} updated")
+
+        try:
+            responses = self._run_batches(company_ids, update_batch, "update_companies")
+            updated_ids = [updated_company.id for response in responses for updated_company in response.results]
+            logger.info(f"Companies with ID {updated_ids} updated")
         except Exception as e:
             raise Exception(f"Companies update failed {e}")
+        finally:
+            self.handler.invalidate_row_cache('companies')
 
-    def delete_companies(self, company_ids: List[Text]) -> None:
+    def delete_companies(self, company_ids: Sequence[Text]) -> None:
         hubspot = self.handler.connect()
-        companies_to_delete = [HubSpotObjectId(id=company_id) for company_id in company_ids]
-        try:
-            hubspot.crm.companies.batch_api.archive(
-                HubSpotBatchObjectIdInput(inputs=companies_to_delete),
+
+        def archive_batch(batch: Sequence[Text]):
+            return hubspot.crm.companies.batch_api.archive(
+                HubSpotBatchObjectIdInput(inputs=[HubSpotObjectId(id=company_id) for company_id in batch]),
             )
+
+        try:
+            self._run_batches(company_ids, archive_batch, "delete_companies")
             logger.info("Companies deleted")
         except Exception as e:
-            raise Exception(f"Companies deletion failed {e}")
\ No newline at end of file
+            raise Exception(f"Companies deletion failed {e}")
+        finally:
+            self.handler.invalidate_row_cache('companies')
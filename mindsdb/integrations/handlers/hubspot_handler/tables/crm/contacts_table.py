@@ -1,4 +1,4 @@
-from typing import List, Dict, Text, Any
+from typing import List, Dict, Sequence, Text, Any
 import pandas as pd
 from hubspot.crm.objects import (
     SimplePublicObjectId as HubSpotObjectId,
@@ -12,7 +12,6 @@ from hubspot.crm.objects import (
 from mindsdb_sql_parser import ast
 from mindsdb.integrations.libs.api_handler import APITable
 from mindsdb.integrations.utilities.handlers.query_utilities import (
-    INSERTQueryParser,
     SELECTQueryParser,
     UPDATEQueryParser,
     DELETEQueryParser,
@@ -31,11 +30,14 @@ class ContactsTable(HubSpotSearchMixin, APITable):
     """Hubspot Contacts table."""
 
     # Default essential properties to fetch (to avoid overloading with 100+ properties)
-    DEFAULT_PROPERTIES = [
+    DEFAULT_PROPERTIES = (
         'email', 'firstname', 'lastname', 'phone', 'company', 'website',
         'jobtitle', 'city', 'state', 'country', 'lifecyclestage',
         'createdate', 'lastmodifieddate'
-    ]
+    )
+
+    # Columns accepted by INSERT when the property definitions cannot be loaded
+    INSERT_FALLBACK_COLUMNS = frozenset({'email', 'firstname', 'lastname', 'phone', 'company', 'website'})
 
     def select(self, query: ast.Select) -> pd.DataFrame:
         """
@@ -68,7 +70,7 @@ class ContactsTable(HubSpotSearchMixin, APITable):
         # Determine which properties to fetch from HubSpot API
         requested_properties = None
         if selected_columns and len(selected_columns) > 0:
-            requested_properties = [col for col in selected_columns if col != 'id']
+            requested_properties = [col for col in selected_columns if col != 'id'] or ['hs_object_id']
 
         # Check if WHERE conditions exist - use search API if they do
         if where_conditions and len(where_conditions) > 0:
@@ -76,23 +78,19 @@ class ContactsTable(HubSpotSearchMixin, APITable):
 
             if hubspot_filters:
                 logger.info(f"Using HubSpot search API with {len(hubspot_filters)} filter(s)")
-                contacts_df = pd.json_normalize(
-                    self.search_contacts(
-                        filters=hubspot_filters,
-                        properties=requested_properties,
-                        limit=result_limit
-                    )
+                contacts_df = self._search_with_cache(
+                    'contacts',
+                    self.search_contacts,
+                    filters=hubspot_filters,
+                    properties=requested_properties,
+                    limit=result_limit,
                 )
                 where_conditions = []
             else:
                 logger.info("No valid HubSpot filters, using get_all")
-                contacts_df = pd.json_normalize(
-                    self.get_contacts(limit=result_limit, properties=requested_properties)
-                )
+                contacts_df = self.get_contacts(limit=result_limit, properties=requested_properties)
         else:
-            contacts_df = pd.json_normalize(
-                self.get_contacts(limit=result_limit, properties=requested_properties)
-            )
+            contacts_df = self.get_contacts(limit=result_limit, properties=requested_properties)
 
         # Filter selected_columns to only include columns that actually exist in the dataframe
         # This handles cases where requested properties don't exist in HubSpot
@@ -131,21 +129,12 @@ class ContactsTable(HubSpotSearchMixin, APITable):
         ValueError
             If the query contains an unsupported condition
         """
-        # Get dynamic list of supported columns from properties cache
-        try:
-            properties_cache = self.handler.get_properties_cache('contacts')
-            supported_columns = list(properties_cache['property_names'])
-        except Exception as e:
-            logger.warning(f"Failed to get dynamic columns for insert, using minimal set: {e}")
-            supported_columns = ['email', 'firstname', 'lastname', 'phone', 'company', 'website']
-
-        insert_statement_parser = INSERTQueryParser(
+        contact_data = self._parse_insert_query(
             query,
-            supported_columns=supported_columns,
+            'contacts',
+            fallback_columns=self.INSERT_FALLBACK_COLUMNS,
             mandatory_columns=['email'],
-            all_mandatory=False,
         )
-        contact_data = insert_statement_parser.parse_query()
         self.create_contacts(contact_data)
 
     def update(self, query: ast.Update) -> None:
@@ -169,14 +158,14 @@ class ContactsTable(HubSpotSearchMixin, APITable):
         update_statement_parser = UPDATEQueryParser(query)
         values_to_update, where_conditions = update_statement_parser.parse_query()
 
-        contacts_df = pd.json_normalize(self.get_contacts())
+        contacts_df = self._get_rows_to_modify(where_conditions, self.get_contacts, self.search_contacts)
         update_query_executor = UPDATEQueryExecutor(
             contacts_df,
             where_conditions
         )
 
         contacts_df = update_query_executor.execute_query()
-        contact_ids = contacts_df['id'].tolist()
+        contact_ids = contacts_df['id'].to_numpy()
         self.update_contacts(contact_ids, values_to_update)
 
     def delete(self, query: ast.Delete) -> None:
@@ -200,14 +189,14 @@ class ContactsTable(HubSpotSearchMixin, APITable):
         delete_statement_parser = DELETEQueryParser(query)
         where_conditions = delete_statement_parser.parse_query()
 
-        contacts_df = pd.json_normalize(self.get_contacts())
+        contacts_df = self._get_rows_to_modify(where_conditions, self.get_contacts, self.search_contacts)
         delete_query_executor = DELETEQueryExecutor(
             contacts_df,
             where_conditions
         )
 
         contacts_df = delete_query_executor.execute_query()
-        contact_ids = contacts_df['id'].tolist()
+        contact_ids = contacts_df['id'].to_numpy()
         self.delete_contacts(contact_ids)
 
     def get_columns(self) -> List[Text]:
@@ -217,58 +206,51 @@ class ContactsTable(HubSpotSearchMixin, APITable):
         Users can still query specific custom properties explicitly in SELECT.
         """
         # Return id + default essential properties
-        return ['id'] + self.DEFAULT_PROPERTIES
+        return ['id', *self.DEFAULT_PROPERTIES]
 
-    def get_contacts(self, properties: List[Text] = None, **kwargs) -> List[Dict]:
+    def get_contacts(self, properties: List[Text] = None, limit: int = None, **kwargs) -> pd.DataFrame:
         """
         Fetch contacts with specified properties.
 
+        Pages through the contacts list endpoint directly, building the DataFrame as pages arrive
+        and stopping as soon as `limit` contacts have been read.
+
         Parameters
         ----------
         properties : List[Text], optional
             List of property names to fetch. If None, fetches DEFAULT_PROPERTIES.
             To fetch ALL properties, pass an empty list [].
+        limit : int, optional
+            Maximum number of contacts to return. If None, fetches all contacts.
         **kwargs : dict
-            Additional arguments to pass to the HubSpot API (e.g., limit)
+            Additional arguments to pass to the HubSpot API (e.g., archived)
 
         Returns
         -------
-        List[Dict]
-            List of contact dictionaries with requested properties
+        pd.DataFrame
+            Contacts with an `id` column and one column per requested property
         """
         hubspot = self.handler.connect()
 
-        # Determine which properties to request from HubSpot
-        if properties is None:
-            # Default: fetch only essential properties
-            properties_to_fetch = self.DEFAULT_PROPERTIES
-        elif len(properties) == 0:
-            # Empty list means fetch ALL available properties
-            properties_cache = self.handler.get_properties_cache('contacts')
-            properties_to_fetch = list(properties_cache['property_names'])
-        else:
-            # Specific properties requested
-            properties_to_fetch = properties
-
-        # Add properties parameter to API call
-        kwargs['properties'] = properties_to_fetch
-        contacts = hubspot.crm.contacts.get_all(**kwargs)
-
-        contacts_dict = []
-        for contact in contacts:
-            # Start with the ID
-            contact_dict = {"id": contact.id}
-
-            # Extract properties that were returned
-            if hasattr(contact, 'properties') and contact.properties:
-                for prop_name, prop_value in contact.properties.items():
-                    contact_dict[prop_name] = prop_value
-
-            contacts_dict.append(contact_dict)
+        properties_to_fetch = self._resolve_properties('contacts', properties)
+
+        def fetch_page(after, page_size):
+            return self._execute_with_retry(
+                lambda: self._decode_page(hubspot.crm.contacts.basic_api.get_page(
+                    limit=page_size,
+                    after=after,
+                    properties=properties_to_fetch,
+                    _preload_content=False,
+                    **kwargs
+                )),
+                "get_contacts",
+            )
 
-        return contacts_dict
+        return self._objects_to_dataframe(self._iter_pages(fetch_page, limit), properties_to_fetch)
 
-    def search_contacts(self, filters: List[Dict], properties: List[Text] = None, limit: int = None) -> List[Dict]:
+    def search_contacts(
+        self, filters: List[Dict], properties: List[Text] = None, limit: int = None
+    ) -> pd.DataFrame:
         """
         Search contacts using HubSpot search API with filters.
 
@@ -283,99 +265,90 @@ class ContactsTable(HubSpotSearchMixin, APITable):
 
         Returns
         -------
-        List[Dict]
-            List of contact dictionaries matching the filters
+        pd.DataFrame
+            Contacts matching the filters
         """
         hubspot = self.handler.connect()
 
-        # Determine which properties to request
-        if properties is None:
-            properties_to_fetch = self.DEFAULT_PROPERTIES
-        elif len(properties) == 0:
-            properties_cache = self.handler.get_properties_cache('contacts')
-            properties_to_fetch = list(properties_cache['property_names'])
-        else:
-            properties_to_fetch = properties
-
-        # Build search request
-        search_request = {
-            "filterGroups": [{"filters": filters}],
-            "properties": properties_to_fetch,
-            "limit": min(limit or 100, 100),
-        }
-
-        # Pagination to fetch all results
-        all_contacts = []
-        after = 0
+        properties_to_fetch = self._resolve_properties('contacts', properties)
+
+        def fetch_page(after, page_size):
+            search_request = {
+                "filterGroups": [{"filters": filters}],
+                "properties": properties_to_fetch,
+                "limit": page_size,
+            }
+            if after:
+                search_request["after"] = after
+            return self._execute_with_retry(
+                lambda: self._decode_page(hubspot.crm.contacts.search_api.do_search(
+                    public_object_search_request=search_request, _preload_content=False
+                )),
+                "search_contacts",
+                endpoint="search",
+            )
 
         try:
-            while True:
-                if after > 0:
-                    search_request["after"] = after
-
-                # Call HubSpot search API
-                response = hubspot.crm.contacts.search_api.do_search(
-                    public_object_search_request=search_request
-                )
-
-                # Extract contacts from response
-                for contact in response.results:
-                    contact_dict = {"id": contact.id}
-                    if hasattr(contact, 'properties') and contact.properties:
-                        for prop_name, prop_value in contact.properties.items():
-                            contact_dict[prop_name] = prop_value
-                    all_contacts.append(contact_dict)
-
-                # Check if we've reached the limit
-                if limit and len(all_contacts) >= limit:
-                    all_contacts = all_contacts[:limit]
-                    break
-
-                # Check if there are more results
-                if not hasattr(response, 'paging') or not response.paging:
-                    break
-
-                if hasattr(response.paging, 'next') and response.paging.next:
-                    after = response.paging.next.after
-                else:
-                    break
-
+            contacts_df = self._objects_to_dataframe(
+                self._iter_search_pages(fetch_page, limit), properties_to_fetch
+            )
         except Exception as e:
             logger.error(f"Error searching contacts: {e}")
             raise Exception(f"Contact search failed: {e}")
 
-        logger.info(f"Found {len(all_contacts)} contacts matching filters")
-        return all_contacts
+        logger.info(f"Found {len(contacts_df)} contacts matching filters")
+        return contacts_df
 
     def create_contacts(self, contacts_data: List[Dict[Text, Any]]) -> None:
         hubspot = self.handler.connect()
-        contacts_to_create = [HubSpotObjectInputCreate(properties=contact) for contact in contacts_data]
-        try:
-            created_contacts = hubspot.crm.contacts.batch_api.create(
-                HubSpotBatchObjectInputCreate(inputs=contacts_to_create)
+
+        def create_batch(batch: List[Dict[Text, Any]]):
+            return hubspot.crm.contacts.batch_api.create(
+                HubSpotBatchObjectInputCreate(
+                    inputs=[HubSpotObjectInputCreate(properties=contact) for contact in batch]
+                ),
             )
-            logger.info(f"Contacts created with ID {[created_contact.id for created_contact in created_contacts.results]}")
+
+        try:
+            responses = self._run_batches(contacts_data, create_batch, "create_contacts")
+            created_ids = [created_contact.id for response in responses for created_contact in response.results]
+            logger.info(f"Contacts created with ID {created_ids}")
         except Exception as e:
             raise Exception(f"Contacts creation failed {e}")
+        finally:
+            self.handler.invalidate_row_cache('contacts')
 
-    def update_contacts(self, contact_ids: List[Text], values_to_update: Dict[Text, Any]) -> None:
+    def update_contacts(self, contact_ids: Sequence[Text], values_to_update: Dict[Text, Any]) -> None:
         hubspot = self.handler.connect()
-        contacts_to_update = [HubSpotObjectBatchInput(id=contact_id, properties=values_to_update) for contact_id in contact_ids]
-        try:
-            updated_contacts = hubspot.crm.contacts.batch_api.update(
-                HubSpotBatchObjectBatchInput(inputs=contacts_to_update),
+
+        def update_batch(batch: Sequence[Text]):
+            return hubspot.crm.contacts.batch_api.update(
+                HubSpotBatchObjectBatchInput(
+                    inputs=[HubSpotObjectBatchInput(id=contact_id, properties=values_to_update) for contact_id in batch]
+                ),
             )
-            logger.info(f"Contacts with ID {[updated_contact.id for updated_contact in updated_contacts.results]} updated")
+
+        try:
+            responses = self._run_batches(contact_ids, update_batch, "update_contacts")
+            updated_ids = [updated_contact.id for response in responses for updated_contact in response.results]
+            logger.info(f"Contacts with ID {updated_ids} updated")
         except Exception as e:
             raise Exception(f"Contacts update failed {e}")
+        finally:
+            self.handler.invalidate_row_cache('contacts')
 
-    def delete_contacts(self, contact_ids: List[Text]) -> None:
+    def delete_contacts(self, contact_ids: Sequence[Text]) -> None:
         hubspot = self.handler.connect()
-        contacts_to_delete = [HubSpotObjectId(id=contact_id) for contact_id in contact_ids]
-        try:
-            hubspot.crm.contacts.batch_api.archive(
-                HubSpotBatchObjectIdInput(inputs=contacts_to_delete),
+
+        def archive_batch(batch: Sequence[Text]):
+            return hubspot.crm.contacts.batch_api.archive(
+                HubSpotBatchObjectIdInput(inputs=[HubSpotObjectId(id=contact_id) for contact_id in batch]),
             )
+
+        try:
+            self._run_batches(contact_ids, archive_batch, "delete_contacts")
             logger.info("Contacts deleted")
         except Exception as e:
-            raise Exception(f"Contacts deletion failed {e}")
\ No newline at end of file
+            raise Exception(f"Contacts deletion failed {e}")
+        finally:
+            self.handler.invalidate_row_cache('contacts')
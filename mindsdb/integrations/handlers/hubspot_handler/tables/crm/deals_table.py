@@ -12,7 +12,6 @@ from hubspot.crm.objects import (
 from mindsdb_sql_parser import ast
 from mindsdb.integrations.libs.api_handler import APITable
 from mindsdb.integrations.utilities.handlers.query_utilities import (
-    INSERTQueryParser,
     SELECTQueryParser,
     UPDATEQueryParser,
     DELETEQueryParser,
@@ -75,23 +74,17 @@ class DealsTable(HubSpotSearchMixin, APITable):
 
             if hubspot_filters:
                 logger.info(f"Using HubSpot search API with {len(hubspot_filters)} filter(s)")
-                deals_df = pd.json_normalize(
-                    self.search_deals(
-                        filters=hubspot_filters,
-                        properties=requested_properties,
-                        limit=result_limit
-                    )
+                deals_df = self.search_deals(
+                    filters=hubspot_filters,
+                    properties=requested_properties,
+                    limit=result_limit
                 )
                 where_conditions = []
             else:
                 logger.info("No valid HubSpot filters, using get_all")
-                deals_df = pd.json_normalize(
-                    self.get_deals(limit=result_limit, properties=requested_properties)
-                )
+                deals_df = self.get_deals(limit=result_limit, properties=requested_properties)
         else:
-            deals_df = pd.json_normalize(
-                self.get_deals(limit=result_limit, properties=requested_properties)
-            )
+            deals_df = self.get_deals(limit=result_limit, properties=requested_properties)
 
         # Filter selected_columns to only include columns that actually exist in the dataframe
         # This handles cases where requested properties don't exist in HubSpot
@@ -130,21 +123,12 @@ class DealsTable(HubSpotSearchMixin, APITable):
         ValueError
             If the query contains an unsupported condition
         """
-        # Get dynamic list of supported columns from properties cache
-        try:
-            properties_cache = self.handler.get_properties_cache('deals')
-            supported_columns = list(properties_cache['property_names'])
-        except Exception as e:
-            logger.warning(f"Failed to get dynamic columns for insert, using minimal set: {e}")
-            supported_columns = ['amount', 'dealname', 'pipeline', 'closedate', 'dealstage', 'hubspot_owner_id']
-
-        insert_statement_parser = INSERTQueryParser(
+        deals_data = self._parse_insert_query(
             query,
-            supported_columns=supported_columns,
+            'deals',
+            fallback_columns=['amount', 'dealname', 'pipeline', 'closedate', 'dealstage', 'hubspot_owner_id'],
             mandatory_columns=['dealname'],
-            all_mandatory=False,
         )
-        deals_data = insert_statement_parser.parse_query()
         self.create_deals(deals_data)
 
     def update(self, query: ast.Update) -> None:
@@ -168,7 +152,7 @@ class DealsTable(HubSpotSearchMixin, APITable):
         update_statement_parser = UPDATEQueryParser(query)
         values_to_update, where_conditions = update_statement_parser.parse_query()
 
-        deals_df = pd.json_normalize(self.get_deals())
+        deals_df = self.get_deals()
         update_query_executor = UPDATEQueryExecutor(
             deals_df,
             where_conditions
@@ -199,7 +183,7 @@ class DealsTable(HubSpotSearchMixin, APITable):
         delete_statement_parser = DELETEQueryParser(query)
         where_conditions = delete_statement_parser.parse_query()
 
-        deals_df = pd.json_normalize(self.get_deals())
+        deals_df = self.get_deals()
         delete_query_executor = DELETEQueryExecutor(
             deals_df,
             where_conditions
@@ -218,10 +202,13 @@ class DealsTable(HubSpotSearchMixin, APITable):
         # Return id + default essential properties
         return ['id'] + self.DEFAULT_PROPERTIES
 
-    def get_deals(self, properties: List[Text] = None, **kwargs) -> List[Dict]:
+    def get_deals(self, properties: List[Text] = None, **kwargs) -> pd.DataFrame:
         """
         Fetch deals with specified properties.
 
+        The DataFrame is built column by column from the deals, with one column per requested
+        property whether or not HubSpot returned it.
+
         Parameters
         ----------
         properties : List[Text], optional
@@ -232,8 +219,8 @@ class DealsTable(HubSpotSearchMixin, APITable):
 
         Returns
         -------
-        List[Dict]
-            List of deal dictionaries with requested properties
+        pd.DataFrame
+            Deals with an `id` column and one column per requested property
         """
         hubspot = self.handler.connect()
 
@@ -244,7 +231,7 @@ class DealsTable(HubSpotSearchMixin, APITable):
         elif len(properties) == 0:
             # Empty list means fetch ALL available properties
             properties_cache = self.handler.get_properties_cache('deals')
-            properties_to_fetch = list(properties_cache['property_names'])
+            properties_to_fetch = list(properties_cache.property_names)
         else:
             # Specific properties requested
             properties_to_fetch = properties
@@ -253,24 +240,15 @@ class DealsTable(HubSpotSearchMixin, APITable):
         kwargs['properties'] = properties_to_fetch
         deals = hubspot.crm.deals.get_all(**kwargs)
 
-        deals_dict = []
-        for deal in deals:
-            # Start with the ID
-            deal_dict = {"id": deal.id}
+        return self._objects_to_dataframe(deals, properties_to_fetch)
 
-            # Extract properties that were returned
-            if hasattr(deal, 'properties') and deal.properties:
-                for prop_name, prop_value in deal.properties.items():
-                    deal_dict[prop_name] = prop_value
-
-            deals_dict.append(deal_dict)
-
-        return deals_dict
-
-    def search_deals(self, filters: List[Dict], properties: List[Text] = None, limit: int = None) -> List[Dict]:
+    def search_deals(self, filters: List[Dict], properties: List[Text] = None, limit: int = None) -> pd.DataFrame:
         """
         Search deals using HubSpot search API with filters.
 
+        The first page reports the total number of matches, so the remaining pages are requested
+        concurrently instead of one round trip after the other.
+
         Parameters
         ----------
         filters : List[Dict]
@@ -282,69 +260,37 @@ class DealsTable(HubSpotSearchMixin, APITable):
 
         Returns
         -------
-        List[Dict]
-            List of deal dictionaries matching the filters
+        pd.DataFrame
+            Deals matching the filters
         """
         hubspot = self.handler.connect()
 
-        # Determine which properties to request
-        if properties is None:
-            properties_to_fetch = self.DEFAULT_PROPERTIES
-        elif len(properties) == 0:
-            properties_cache = self.handler.get_properties_cache('deals')
-            properties_to_fetch = list(properties_cache['property_names'])
-        else:
-            properties_to_fetch = properties
-
-        # Build search request
-        search_request = {
-            "filterGroups": [{"filters": filters}],
-            "properties": properties_to_fetch,
-            "limit": min(limit or 100, 100),
-        }
-
-        # Pagination to fetch all results
-        all_deals = []
-        after = 0
+        properties_to_fetch = self._resolve_properties('deals', properties)
+
+        def fetch_page(after, page_size):
+            search_request = {
+                "filterGroups": [{"filters": filters}],
+                "properties": properties_to_fetch,
+                "limit": page_size,
+            }
+            if after:
+                search_request["after"] = after
+            return self._execute_with_retry(
+                lambda: self._decode_page(hubspot.crm.deals.search_api.do_search(
+                    public_object_search_request=search_request, _preload_content=False
+                )),
+                "search_deals",
+                endpoint="search",
+            )
 
         try:
-            while True:
-                if after > 0:
-                    search_request["after"] = after
-
-                # Call HubSpot search API
-                response = hubspot.crm.deals.search_api.do_search(
-                    public_object_search_request=search_request
-                )
-
-                # Extract deals from response
-                for deal in response.results:
-                    deal_dict = {"id": deal.id}
-                    if hasattr(deal, 'properties') and deal.properties:
-                        for prop_name, prop_value in deal.properties.items():
-                            deal_dict[prop_name] = prop_value
-                    all_deals.append(deal_dict)
-
-                # Check if we've reached the limit
-                if limit and len(all_deals) >= limit:
-                    all_deals = all_deals[:limit]
-                    break
-
-                # Check if there are more results
-                if not hasattr(response, 'paging') or not response.paging:
-                    break
-
-                if hasattr(response.paging, 'next') and response.paging.next:
-                    after = response.paging.next.after
-                else:
-                    break
-
+            deals_df = self._objects_to_dataframe(self._iter_search_pages(fetch_page, limit), properties_to_fetch)
         except Exception as e:
             logger.error(f"Error searching deals: {e}")
             raise Exception(f"Deal search failed: {e}")
 
-        logger.info(f"Found {len(all_deals)} deals matching filters")
-        return all_deals
+        logger.info(f"Found {len(deals_df)} deals matching filters")
+        return deals_df
 
     def create_deals(self, deals_data: List[Dict[Text, Any]]) -> None:
         hubspot = self.handler.connect()
@@ -12,7 +12,6 @@ from hubspot.crm.objects import (
 from mindsdb_sql_parser import ast
 from mindsdb.integrations.libs.api_handler import APITable
 from mindsdb.integrations.utilities.handlers.query_utilities import (
-    INSERTQueryParser,
     SELECTQueryParser,
     UPDATEQueryParser,
     DELETEQueryParser,
@@ -89,20 +88,12 @@ class EmailsTable(HubSpotSearchMixin, APITable):
 
     def insert(self, query: ast.Insert) -> None:
         """Inserts data into HubSpot Emails"""
-        try:
-            properties_cache = self.handler.get_properties_cache('emails')
-            supported_columns = list(properties_cache['property_names'])
-        except Exception as e:
-            logger.warning(f"Failed to get dynamic columns for insert: {e}")
-            supported_columns = ['hs_timestamp', 'hs_email_subject', 'hs_email_text']
-
-        insert_statement_parser = INSERTQueryParser(
+        emails_data = self._parse_insert_query(
             query,
-            supported_columns=supported_columns,
+            'emails',
+            fallback_columns=['hs_timestamp', 'hs_email_subject', 'hs_email_text'],
             mandatory_columns=['hs_timestamp'],
-            all_mandatory=False,
         )
-        emails_data = insert_statement_parser.parse_query()
         self.create_emails(emails_data)
 
     def update(self, query: ast.Update) -> None:
@@ -139,7 +130,7 @@ class EmailsTable(HubSpotSearchMixin, APITable):
             properties_to_fetch = self.DEFAULT_PROPERTIES
         elif len(properties) == 0:
             properties_cache = self.handler.get_properties_cache('emails')
-            properties_to_fetch = list(properties_cache['property_names'])
+            properties_to_fetch = list(properties_cache.property_names)
         else:
             properties_to_fetch = properties
 
@@ -164,7 +155,7 @@ class EmailsTable(HubSpotSearchMixin, APITable):
             properties_to_fetch = self.DEFAULT_PROPERTIES
         elif len(properties) == 0:
             properties_cache = self.handler.get_properties_cache('emails')
-            properties_to_fetch = list(properties_cache['property_names'])
+            properties_to_fetch = list(properties_cache.property_names)
         else:
             properties_to_fetch = properties
 
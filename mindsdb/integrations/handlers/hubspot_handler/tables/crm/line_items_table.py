@@ -12,7 +12,6 @@ from hubspot.crm.objects import (
 from mindsdb_sql_parser import ast
 from mindsdb.integrations.libs.api_handler import APITable
 from mindsdb.integrations.utilities.handlers.query_utilities import (
-    INSERTQueryParser,
     SELECTQueryParser,
     UPDATEQueryParser,
     DELETEQueryParser,
@@ -120,21 +119,12 @@ class LineItemsTable(HubSpotSearchMixin, APITable):
         ValueError
             If the query contains an unsupported condition
         """
-        # Get dynamic list of supported columns from properties cache
-        try:
-            properties_cache = self.handler.get_properties_cache('line_items')
-            supported_columns = list(properties_cache['property_names'])
-        except Exception as e:
-            logger.warning(f"Failed to get dynamic columns for insert, using minimal set: {e}")
-            supported_columns = ['name', 'quantity', 'price', 'hs_product_id']
-
-        insert_statement_parser = INSERTQueryParser(
+        line_items_data = self._parse_insert_query(
             query,
-            supported_columns=supported_columns,
+            'line_items',
+            fallback_columns=['name', 'quantity', 'price', 'hs_product_id'],
             mandatory_columns=['quantity', 'price'],
-            all_mandatory=False,
         )
-        line_items_data = insert_statement_parser.parse_query()
         self.create_line_items(line_items_data)
 
     def update(self, query: ast.Update) -> None:
@@ -234,7 +224,7 @@ class LineItemsTable(HubSpotSearchMixin, APITable):
         elif len(properties) == 0:
             # Empty list means fetch ALL available properties
             properties_cache = self.handler.get_properties_cache('line_items')
-            properties_to_fetch = list(properties_cache['property_names'])
+            properties_to_fetch = list(properties_cache.property_names)
         else:
             # Specific properties requested
             properties_to_fetch = properties
@@ -282,7 +272,7 @@ class LineItemsTable(HubSpotSearchMixin, APITable):
             properties_to_fetch = self.DEFAULT_PROPERTIES
         elif len(properties) == 0:
             properties_cache = self.handler.get_properties_cache('line_items')
-            properties_to_fetch = list(properties_cache['property_names'])
+            properties_to_fetch = list(properties_cache.property_names)
         else:
             properties_to_fetch = properties
 
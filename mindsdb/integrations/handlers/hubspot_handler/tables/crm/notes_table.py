@@ -12,7 +12,6 @@ from hubspot.crm.objects import (
 from mindsdb_sql_parser import ast
 from mindsdb.integrations.libs.api_handler import APITable
 from mindsdb.integrations.utilities.handlers.query_utilities import (
-    INSERTQueryParser,
     SELECTQueryParser,
     UPDATEQueryParser,
     DELETEQueryParser,
@@ -88,20 +87,12 @@ class NotesTable(HubSpotSearchMixin, APITable):
 
     def insert(self, query: ast.Insert) -> None:
         """Inserts data into HubSpot Notes"""
-        try:
-            properties_cache = self.handler.get_properties_cache('notes')
-            supported_columns = list(properties_cache['property_names'])
-        except Exception as e:
-            logger.warning(f"Failed to get dynamic columns for insert: {e}")
-            supported_columns = ['hs_timestamp', 'hs_note_body']
-
-        insert_statement_parser = INSERTQueryParser(
+        notes_data = self._parse_insert_query(
             query,
-            supported_columns=supported_columns,
+            'notes',
+            fallback_columns=['hs_timestamp', 'hs_note_body'],
             mandatory_columns=['hs_timestamp', 'hs_note_body'],
-            all_mandatory=False,
         )
-        notes_data = insert_statement_parser.parse_query()
         self.create_notes(notes_data)
 
     def update(self, query: ast.Update) -> None:
@@ -138,7 +129,7 @@ class NotesTable(HubSpotSearchMixin, APITable):
             properties_to_fetch = self.DEFAULT_PROPERTIES
         elif len(properties) == 0:
             properties_cache = self.handler.get_properties_cache('notes')
-            properties_to_fetch = list(properties_cache['property_names'])
+            properties_to_fetch = list(properties_cache.property_names)
         else:
             properties_to_fetch = properties
 
@@ -163,7 +154,7 @@ class NotesTable(HubSpotSearchMixin, APITable):
             properties_to_fetch = self.DEFAULT_PROPERTIES
         elif len(properties) == 0:
             properties_cache = self.handler.get_properties_cache('notes')
-            properties_to_fetch = list(properties_cache['property_names'])
+            properties_to_fetch = list(properties_cache.property_names)
         else:
             properties_to_fetch = properties
 
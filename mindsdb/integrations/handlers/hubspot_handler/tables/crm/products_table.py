@@ -12,7 +12,6 @@ from hubspot.crm.objects import (
 from mindsdb_sql_parser import ast
 from mindsdb.integrations.libs.api_handler import APITable
 from mindsdb.integrations.utilities.handlers.query_utilities import (
-    INSERTQueryParser,
     SELECTQueryParser,
     UPDATEQueryParser,
     DELETEQueryParser,
@@ -120,21 +119,12 @@ class ProductsTable(HubSpotSearchMixin, APITable):
         ValueError
             If the query contains an unsupported condition
         """
-        # Get dynamic list of supported columns from properties cache
-        try:
-            properties_cache = self.handler.get_properties_cache('products')
-            supported_columns = list(properties_cache['property_names'])
-        except Exception as e:
-            logger.warning(f"Failed to get dynamic columns for insert, using minimal set: {e}")
-            supported_columns = ['name', 'description', 'price', 'hs_sku']
-
-        insert_statement_parser = INSERTQueryParser(
+        products_data = self._parse_insert_query(
             query,
-            supported_columns=supported_columns,
+            'products',
+            fallback_columns=['name', 'description', 'price', 'hs_sku'],
             mandatory_columns=['name'],
-            all_mandatory=False,
         )
-        products_data = insert_statement_parser.parse_query()
         self.create_products(products_data)
 
     def update(self, query: ast.Update) -> None:
@@ -234,7 +224,7 @@ class ProductsTable(HubSpotSearchMixin, APITable):
         elif len(properties) == 0:
             # Empty list means fetch ALL available properties
             properties_cache = self.handler.get_properties_cache('products')
-            properties_to_fetch = list(properties_cache['property_names'])
+            properties_to_fetch = list(properties_cache.property_names)
         else:
             # Specific properties requested
             properties_to_fetch = properties
@@ -282,7 +272,7 @@ class ProductsTable(HubSpotSearchMixin, APITable):
             properties_to_fetch = self.DEFAULT_PROPERTIES
         elif len(properties) == 0:
             properties_cache = self.handler.get_properties_cache('products')
-            properties_to_fetch = list(properties_cache['property_names'])
+            properties_to_fetch = list(properties_cache.property_names)
         else:
             properties_to_fetch = properties
 
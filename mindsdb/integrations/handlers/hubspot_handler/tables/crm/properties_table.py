@@ -97,17 +97,17 @@ class PropertiesTable(APITable):
             try:
                 properties_cache = self.handler.get_properties_cache(obj_type)
 
-                for prop in properties_cache['properties']:
+                for prop in properties_cache.properties:
                     property_data = {
                         'object_type': obj_type,
-                        'name': prop['name'],
-                        'label': prop['label'],
-                        'type': prop['type'],
-                        'fieldType': prop['fieldType'],
-                        'description': prop.get('description', ''),
-                        'groupName': prop.get('groupName', ''),
-                        'hidden': prop.get('hidden', False),
-                        'hubspotDefined': prop.get('hubspotDefined', True)
+                        'name': prop.name,
+                        'label': prop.label,
+                        'type': prop.type,
+                        'fieldType': prop.field_type,
+                        'description': prop.description,
+                        'groupName': prop.group_name,
+                        'hidden': prop.hidden,
+                        'hubspotDefined': prop.hubspot_defined
                     }
                     all_properties.append(property_data)
 
@@ -12,7 +12,6 @@ from hubspot.crm.objects import (
 from mindsdb_sql_parser import ast
 from mindsdb.integrations.libs.api_handler import APITable
 from mindsdb.integrations.utilities.handlers.query_utilities import (
-    INSERTQueryParser,
     SELECTQueryParser,
     UPDATEQueryParser,
     DELETEQueryParser,
@@ -130,21 +129,12 @@ class QuotesTable(HubSpotSearchMixin, APITable):
         ValueError
             If the query contains an unsupported condition
         """
-        # Get dynamic list of supported columns from properties cache
-        try:
-            properties_cache = self.handler.get_properties_cache('quotes')
-            supported_columns = list(properties_cache['property_names'])
-        except Exception as e:
-            logger.warning(f"Failed to get dynamic columns for insert, using minimal set: {e}")
-            supported_columns = ['hs_title', 'hs_expiration_date', 'hs_quote_amount']
-
-        insert_statement_parser = INSERTQueryParser(
+        quotes_data = self._parse_insert_query(
             query,
-            supported_columns=supported_columns,
+            'quotes',
+            fallback_columns=['hs_title', 'hs_expiration_date', 'hs_quote_amount'],
             mandatory_columns=['hs_title'],
-            all_mandatory=False,
         )
-        quotes_data = insert_statement_parser.parse_query()
         self.create_quotes(quotes_data)
 
     def update(self, query: ast.Update) -> None:
@@ -244,7 +234,7 @@ class QuotesTable(HubSpotSearchMixin, APITable):
         elif len(properties) == 0:
             # Empty list means fetch ALL available properties
             properties_cache = self.handler.get_properties_cache('quotes')
-            properties_to_fetch = list(properties_cache['property_names'])
+            properties_to_fetch = list(properties_cache.property_names)
         else:
             # Specific properties requested
             properties_to_fetch = properties
@@ -292,7 +282,7 @@ class QuotesTable(HubSpotSearchMixin, APITable):
             properties_to_fetch = self.DEFAULT_PROPERTIES
         elif len(properties) == 0:
             properties_cache = self.handler.get_properties_cache('quotes')
-            properties_to_fetch = list(properties_cache['property_names'])
+            properties_to_fetch = list(properties_cache.property_names)
         else:
             properties_to_fetch = properties
 
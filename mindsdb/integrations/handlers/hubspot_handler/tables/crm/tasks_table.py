@@ -12,7 +12,6 @@ from hubspot.crm.objects import (
 from mindsdb_sql_parser import ast
 from mindsdb.integrations.libs.api_handler import APITable
 from mindsdb.integrations.utilities.handlers.query_utilities import (
-    INSERTQueryParser,
     SELECTQueryParser,
     UPDATEQueryParser,
     DELETEQueryParser,
@@ -89,20 +88,12 @@ class TasksTable(HubSpotSearchMixin, APITable):
 
     def insert(self, query: ast.Insert) -> None:
         """Inserts data into HubSpot Tasks"""
-        try:
-            properties_cache = self.handler.get_properties_cache('tasks')
-            supported_columns = list(properties_cache['property_names'])
-        except Exception as e:
-            logger.warning(f"Failed to get dynamic columns for insert: {e}")
-            supported_columns = ['hs_timestamp', 'hs_task_subject', 'hs_task_body', 'hs_task_status']
-
-        insert_statement_parser = INSERTQueryParser(
+        tasks_data = self._parse_insert_query(
             query,
-            supported_columns=supported_columns,
+            'tasks',
+            fallback_columns=['hs_timestamp', 'hs_task_subject', 'hs_task_body', 'hs_task_status'],
             mandatory_columns=['hs_timestamp', 'hs_task_subject'],
-            all_mandatory=False,
         )
-        tasks_data = insert_statement_parser.parse_query()
         self.create_tasks(tasks_data)
 
     def update(self, query: ast.Update) -> None:
@@ -139,7 +130,7 @@ class TasksTable(HubSpotSearchMixin, APITable):
             properties_to_fetch = self.DEFAULT_PROPERTIES
         elif len(properties) == 0:
             properties_cache = self.handler.get_properties_cache('tasks')
-            properties_to_fetch = list(properties_cache['property_names'])
+            properties_to_fetch = list(properties_cache.property_names)
         else:
             properties_to_fetch = properties
 
@@ -164,7 +155,7 @@ class TasksTable(HubSpotSearchMixin, APITable):
             properties_to_fetch = self.DEFAULT_PROPERTIES
         elif len(properties) == 0:
             properties_cache = self.handler.get_properties_cache('tasks')
-            properties_to_fetch = list(properties_cache['property_names'])
+            properties_to_fetch = list(properties_cache.property_names)
         else:
             properties_to_fetch = properties
 
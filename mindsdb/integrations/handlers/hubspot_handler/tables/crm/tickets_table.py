@@ -12,7 +12,6 @@ from hubspot.crm.objects import (
 from mindsdb_sql_parser import ast
 from mindsdb.integrations.libs.api_handler import APITable
 from mindsdb.integrations.utilities.handlers.query_utilities import (
-    INSERTQueryParser,
     SELECTQueryParser,
     UPDATEQueryParser,
     DELETEQueryParser,
@@ -130,21 +129,12 @@ class TicketsTable(HubSpotSearchMixin, APITable):
         ValueError
             If the query contains an unsupported condition
         """
-        # Get dynamic list of supported columns from properties cache
-        try:
-            properties_cache = self.handler.get_properties_cache('tickets')
-            supported_columns = list(properties_cache['property_names'])
-        except Exception as e:
-            logger.warning(f"Failed to get dynamic columns for insert, using minimal set: {e}")
-            supported_columns = ['subject', 'content', 'hs_pipeline', 'hs_pipeline_stage', 'hs_ticket_priority']
-
-        insert_statement_parser = INSERTQueryParser(
+        tickets_data = self._parse_insert_query(
             query,
-            supported_columns=supported_columns,
+            'tickets',
+            fallback_columns=['subject', 'content', 'hs_pipeline', 'hs_pipeline_stage', 'hs_ticket_priority'],
             mandatory_columns=['subject'],
-            all_mandatory=False,
         )
-        tickets_data = insert_statement_parser.parse_query()
         self.create_tickets(tickets_data)
 
     def update(self, query: ast.Update) -> None:
@@ -244,7 +234,7 @@ class TicketsTable(HubSpotSearchMixin, APITable):
         elif len(properties) == 0:
             # Empty list means fetch ALL available properties
             properties_cache = self.handler.get_properties_cache('tickets')
-            properties_to_fetch = list(properties_cache['property_names'])
+            properties_to_fetch = list(properties_cache.property_names)
         else:
             # Specific properties requested
             properties_to_fetch = properties
@@ -292,7 +282,7 @@ class TicketsTable(HubSpotSearchMixin, APITable):
             properties_to_fetch = self.DEFAULT_PROPERTIES
         elif len(properties) == 0:
             properties_cache = self.handler.get_properties_cache('tickets')
-            properties_to_fetch = list(properties_cache['property_names'])
+            properties_to_fetch = list(properties_cache.property_names)
         else:
             properties_to_fetch = properties
 
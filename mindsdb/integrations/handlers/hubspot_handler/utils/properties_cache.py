@@ -0,0 +1,30 @@
+"""
+Entries of the HubSpot handler's property definitions cache.
+
+Slotted dataclasses are used instead of dicts: accounts can define thousands of properties
+per object type, and a slotted instance takes a fraction of the memory of the equivalent dict.
+"""
+
+from dataclasses import dataclass
+from typing import FrozenSet, Optional, Tuple
+
+
+@dataclass(slots=True, frozen=True)
+class PropertyInfo:
+    """Definition of a single HubSpot property."""
+    name: str
+    label: str
+    type: str
+    field_type: str
+    description: Optional[str] = ''
+    group_name: Optional[str] = ''
+    hidden: bool = False
+    hubspot_defined: bool = True
+
+
+@dataclass(slots=True)
+class PropertiesCacheEntry:
+    """Property definitions of one object type, as cached by the handler."""
+    properties: Tuple[PropertyInfo, ...]
+    property_names: FrozenSet[str]
+    timestamp: float
@@ -2,15 +2,19 @@
 Rate limiting and retry logic for HubSpot API calls.
 
 This module provides decorators and utilities to handle HubSpot's rate limits gracefully:
-- Exponential backoff on rate limit errors (429)
+- Waits driven by HubSpot's Retry-After / X-HubSpot-RateLimit-* headers on rate limit errors (429)
+- Full-jitter exponential backoff when HubSpot gives no hint
+- Client-side token buckets to stay under the documented request rates
 - Retry on temporary failures (502, 503, 504)
 - Configurable retry attempts and backoff
 - Batch chunking for operations exceeding API limits
 """
 
 import time
+import random
 import functools
-from typing import Callable, Any, List, Dict
+import threading
+from typing import Callable, Any, List, Dict, Optional, Sequence
 from mindsdb.utilities import log
 
 logger = log.getLogger(__name__)
@@ -26,14 +30,86 @@ class HubSpotAPIError(Exception):
     pass
 
 
-def with_retry(max_retries: int = 5, backoff_factor: int = 2, retry_on_status: tuple = (429, 502, 503, 504)):
+class TokenBucket:
     """
-    Decorator to retry HubSpot API calls with exponential backoff.
+    Thread-safe token bucket allowing at most `capacity` calls per `period` seconds.
+
+    Args:
+        capacity: Number of calls allowed per period (also the maximum burst)
+        period: Length of the period in seconds
+    """
+
+    def __init__(self, capacity: int, period: float):
+        self.capacity = capacity
+        self.rate = capacity / period
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_time = (1 - self._tokens) / self.rate
+
+            time.sleep(wait_time)
+
+
+def get_retry_after(error: Exception) -> Optional[float]:
+    """
+    Get the number of seconds to wait from the rate limit headers of a HubSpot API error.
+
+    Retry-After is used when present. Otherwise, an exhausted per-second budget
+    (X-HubSpot-RateLimit-Secondly-Remaining of 0) means waiting for the next one-second window.
+
+    Args:
+        error: Exception from HubSpot API
+
+    Returns:
+        Seconds to wait, or None if the headers give no hint
+    """
+    headers = getattr(error, 'headers', None) or {}
+    try:
+        return max(float(headers.get('Retry-After')), 0.0)
+    except (TypeError, ValueError):
+        pass
+
+    try:
+        if int(headers.get('X-HubSpot-RateLimit-Secondly-Remaining')) <= 0:
+            return 1.0
+    except (TypeError, ValueError):
+        pass
+    return None
+
+
+def with_retry(
+    max_retries: int = 5,
+    backoff_factor: int = 2,
+    retry_on_status: tuple = (429, 502, 503, 504),
+    max_backoff: float = 30,
+    max_throttle_waits: int = 10
+):
+    """
+    Decorator to retry HubSpot API calls.
+
+    When the rate limit headers of the error say how long to wait (see `get_retry_after`),
+    that wait is used, plus up to one second of jitter, and it does not count against
+    `max_retries`: a long but legitimate throttle should not exhaust the retry budget.
+    Such waits are capped separately by `max_throttle_waits`. Otherwise the wait is a
+    full-jitter exponential backoff, uniform between 0 and min(max_backoff, backoff_factor ** attempt).
 
     Args:
         max_retries: Maximum number of retry attempts (default: 5)
         backoff_factor: Base for exponential backoff calculation (default: 2)
         retry_on_status: HTTP status codes to retry on (default: 429, 502, 503, 504)
+        max_backoff: Upper bound in seconds of a single backoff (default: 30)
+        max_throttle_waits: Maximum number of header-driven waits (default: 10)
 
     Usage:
         @with_retry(max_retries=5)
@@ -43,9 +119,10 @@ def with_retry(max_retries: int = 5, backoff_factor: int = 2, retry_on_status: t
     def decorator(func: Callable) -> Callable:
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            last_exception = None
+            attempt = 0
+            throttle_waits = 0
 
-            for attempt in range(max_retries + 1):
+            while True:
                 try:
                     return func(*args, **kwargs)
 
@@ -58,10 +135,13 @@ def with_retry(max_retries: int = 5, backoff_factor: int = 2, retry_on_status: t
                         # Not a retryable error, re-raise immediately
                         raise
 
-                    last_exception = e
-
-                    # If we've exhausted retries, raise the exception
-                    if attempt >= max_retries:
+                    retry_after = get_retry_after(e)
+                    if retry_after is not None and throttle_waits < max_throttle_waits:
+                        # HubSpot told us when to come back: honor it without spending a retry
+                        throttle_waits += 1
+                        wait_time = retry_after + random.uniform(0, 1)
+                    elif attempt >= max_retries:
+                        # Retries are exhausted
                         if status_code == 429:
                             logger.error(f"Rate limit exceeded after {max_retries} retries in {func.__name__}")
                             raise RateLimitError(
@@ -73,31 +153,32 @@ def with_retry(max_retries: int = 5, backoff_factor: int = 2, retry_on_status: t
                             raise HubSpotAPIError(
                                 f"HubSpot API call failed after {max_retries} retries: {e}"
                             ) from e
-
-                    # Calculate wait time with exponential backoff
-                    wait_time = backoff_factor ** attempt
+                    else:
+                        # Full jitter keeps concurrent callers from retrying in lockstep
+                        wait_time = random.uniform(0, min(max_backoff, backoff_factor ** attempt))
+                        attempt += 1
 
                     logger.warning(
-                        f"API call failed in {func.__name__} (attempt {attempt + 1}/{max_retries}), "
-                        f"status: {status_code}, retrying in {wait_time}s: {e}"
+                        f"API call failed in {func.__name__} (attempt {attempt}/{max_retries}, "
+                        f"throttled {throttle_waits}/{max_throttle_waits}), "
+                        f"status: {status_code}, retrying in {wait_time:.1f}s: {e}"
                     )
 
                     time.sleep(wait_time)
 
-            # This should never be reached, but just in case
-            if last_exception:
-                raise last_exception
-
         return wrapper
     return decorator
 
 
-def chunk_list(items: List[Any], chunk_size: int = 100) -> List[List[Any]]:
+def chunk_list(items: Sequence[Any], chunk_size: int = 100) -> List[Sequence[Any]]:
     """
     Split a list into chunks of specified size.
 
+    Any sliceable sequence is accepted, e.g. a NumPy array of ids taken straight from a
+    DataFrame column; chunks are slices of the same type.
+
     Args:
-        items: List to be chunked
+        items: Sequence to be chunked
         chunk_size: Maximum size of each chunk (default: 100, HubSpot's batch limit)
 
     Returns:
@@ -107,7 +188,7 @@ def chunk_list(items: List[Any], chunk_size: int = 100) -> List[List[Any]]:
         >>> chunk_list([1, 2, 3, 4, 5], chunk_size=2)
         [[1, 2], [3, 4], [5]]
     """
-    if not items:
+    if len(items) == 0:
         return []
 
     chunks = []
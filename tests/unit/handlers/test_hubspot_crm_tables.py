@@ -0,0 +1,1177 @@
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import orjson
+import pandas as pd
+import pytest
+
+try:
+    from hubspot.crm.objects import SimplePublicObject
+    from mindsdb_sql_parser import ast, parse_sql
+    from mindsdb.integrations.handlers.hubspot_handler.hubspot_handler import HubspotHandler
+    from mindsdb.integrations.handlers.hubspot_handler.tables.crm.appointments_table import AppointmentsTable
+    from mindsdb.integrations.handlers.hubspot_handler.tables.crm.base_hubspot_table import HubSpotSearchMixin
+    from mindsdb.integrations.handlers.hubspot_handler.utils.rate_limiter import HubSpotAPIError, with_retry
+except ImportError:
+    pytestmark = pytest.mark.skip("HubSpot handler not installed")
+
+
+def make_objects(count, properties=("name", "city")):
+    return [
+        SimplePublicObject(id=str(i), properties={prop: f"{prop}{i}" for prop in properties})
+        for i in range(count)
+    ]
+
+
+def make_page(results, paging=None, total=None, raw=False):
+    """Return a page of `results` as the SDK model would, or as the raw response if `raw` is set."""
+    if not raw:
+        return SimpleNamespace(results=results, paging=paging, total=total)
+    body = {"results": [{"id": obj.id, "properties": obj.properties} for obj in results]}
+    if paging:
+        body["paging"] = {"next": {"after": paging.next.after}}
+    if total is not None:
+        body["total"] = total
+    return SimpleNamespace(data=orjson.dumps(body))
+
+
+def make_page_fetcher(objects):
+    """Return a fake `get_page` that serves `objects` using numeric `after` cursors."""
+    calls = []
+
+    def get_page(limit=10, after=None, **kwargs):
+        calls.append({"limit": limit, "after": after, **kwargs})
+        start = int(after or 0)
+        end = start + limit
+        paging = SimpleNamespace(next=SimpleNamespace(after=str(end))) if end < len(objects) else None
+        return make_page(objects[start:end], paging, raw=kwargs.get("_preload_content") is False)
+
+    get_page.calls = calls
+    return get_page
+
+
+def make_searcher(objects, numeric_cursors=True):
+    """Return a fake `do_search` that pages `objects` by offset and reports the total."""
+    calls = []
+    lock = threading.Lock()
+
+    def do_search(public_object_search_request, _preload_content=True):
+        with lock:
+            calls.append(public_object_search_request)
+        after = public_object_search_request.get("after")
+        start = int(after.lstrip("c") if after else 0)
+        end = start + public_object_search_request["limit"]
+        cursor = str(end) if numeric_cursors else f"c{end}"
+        paging = SimpleNamespace(next=SimpleNamespace(after=cursor)) if end < len(objects) else None
+        return make_page(objects[start:end], paging, len(objects), raw=not _preload_content)
+
+    do_search.calls = calls
+    return do_search
+
+
+class TestHubSpotSearchMixin(unittest.TestCase):
+    """Tests for the shared pagination and DataFrame helpers."""
+
+    def test_iter_pages_stops_at_limit(self):
+        get_page = make_page_fetcher(make_objects(250))
+
+        objects = list(HubSpotSearchMixin._iter_pages(lambda after, size: get_page(limit=size, after=after), 130))
+
+        self.assertEqual(len(objects), 130)
+        self.assertEqual([call["limit"] for call in get_page.calls], [100, 30])
+
+    def test_iter_pages_reads_all_pages_without_limit(self):
+        get_page = make_page_fetcher(make_objects(250))
+
+        objects = list(HubSpotSearchMixin._iter_pages(lambda after, size: get_page(limit=size, after=after)))
+
+        self.assertEqual(len(objects), 250)
+        self.assertEqual(len(get_page.calls), 3)
+
+    def test_iter_search_pages_fetches_remaining_pages_by_offset(self):
+        do_search = make_searcher(make_objects(350))
+
+        objects = list(HubSpotSearchMixin._iter_search_pages(
+            lambda after, size: do_search({"after": after, "limit": size}), 320
+        ))
+
+        self.assertEqual([obj.id for obj in objects], [str(i) for i in range(320)])
+        self.assertEqual(
+            sorted((call["after"] or "0", call["limit"]) for call in do_search.calls),
+            [("0", 100), ("100", 100), ("200", 100), ("300", 20)],
+        )
+
+    def test_iter_search_pages_follows_opaque_cursors(self):
+        do_search = make_searcher(make_objects(250), numeric_cursors=False)
+
+        objects = list(HubSpotSearchMixin._iter_search_pages(
+            lambda after, size: do_search({"after": after, "limit": size})
+        ))
+
+        self.assertEqual([obj.id for obj in objects], [str(i) for i in range(250)])
+        self.assertEqual([call["after"] for call in do_search.calls], [None, "c100", "c200"])
+
+    def test_build_search_filters(self):
+        filters = HubSpotSearchMixin._build_search_filters([
+            ["IN", "industry", ["Tech", "Retail"]],
+            ["is not null", "domain", None],
+            [">=", "annualrevenue", 10],
+            ["between", "numberofemployees", (5, 50)],
+            ["like", "name", "%acme%"],
+            ["=", "id", 5],
+            ["not between", "numberofemployees", (5, 50)],
+        ])
+
+        self.assertEqual(filters, [
+            {"propertyName": "industry", "operator": "IN", "values": ["Tech", "Retail"]},
+            {"propertyName": "domain", "operator": "HAS_PROPERTY"},
+            {"propertyName": "annualrevenue", "operator": "GTE", "value": "10"},
+            {"propertyName": "numberofemployees", "operator": "BETWEEN", "value": "5", "highValue": "50"},
+            {"propertyName": "name", "operator": "CONTAINS_TOKEN", "value": "acme"},
+            {"propertyName": "hs_object_id", "operator": "EQ", "value": "5"},
+        ])
+
+    def test_build_search_filters_drops_duplicates(self):
+        filters = HubSpotSearchMixin._build_search_filters([
+            ["=", "name", "acme"],
+            ["in", "industry", ["Tech"]],
+            ["=", "name", "acme"],
+            ["in", "industry", "Tech"],
+            ["=", "city", "acme"],
+        ])
+
+        self.assertEqual(filters, [
+            {"propertyName": "name", "operator": "EQ", "value": "acme"},
+            {"propertyName": "industry", "operator": "IN", "values": ["Tech"]},
+            {"propertyName": "city", "operator": "EQ", "value": "acme"},
+        ])
+
+    def test_build_search_filters_merges_exclusions_of_a_property(self):
+        filters = HubSpotSearchMixin._build_search_filters([
+            ["!=", "industry", "Tech"],
+            ["=", "city", "Berlin"],
+            ["not in", "industry", ["Retail", "Tech"]],
+            ["=", "city", "Paris"],
+            ["!=", "name", "acme"],
+        ])
+
+        self.assertEqual(filters, [
+            {"propertyName": "industry", "operator": "NOT_IN", "values": ["Tech", "Retail"]},
+            {"propertyName": "city", "operator": "EQ", "value": "Berlin"},
+            {"propertyName": "city", "operator": "EQ", "value": "Paris"},
+            {"propertyName": "name", "operator": "NEQ", "value": "acme"},
+        ])
+
+    def test_get_id_values(self):
+        self.assertEqual(HubSpotSearchMixin._get_id_values([["=", "id", 5]]), ["5"])
+        self.assertEqual(HubSpotSearchMixin._get_id_values([["in", "id", ["1", "2", "1"]]]), ["1", "2"])
+        self.assertIsNone(HubSpotSearchMixin._get_id_values([["=", "name", "x"]]))
+        self.assertIsNone(HubSpotSearchMixin._get_id_values([["=", "id", "1"], ["=", "name", "x"]]))
+
+    def test_is_unsatisfiable(self):
+        self.assertTrue(HubSpotSearchMixin._is_unsatisfiable([["=", "name", "a"], ["in", "name", ["b", "c"]]]))
+        self.assertTrue(HubSpotSearchMixin._is_unsatisfiable([[">", "amount", 10], ["<=", "amount", 5]]))
+        self.assertTrue(HubSpotSearchMixin._is_unsatisfiable([[">=", "amount", 5], ["<", "amount", 5]]))
+        self.assertTrue(HubSpotSearchMixin._is_unsatisfiable([["is null", "name", None], ["=", "name", "a"]]))
+        self.assertTrue(HubSpotSearchMixin._is_unsatisfiable([["in", "id", []]]))
+
+        self.assertFalse(HubSpotSearchMixin._is_unsatisfiable([["between", "amount", [1, 5]], ["<=", "amount", 1]]))
+        self.assertFalse(HubSpotSearchMixin._is_unsatisfiable([["=", "id", 1], ["in", "id", ["1", "2"]]]))
+        self.assertFalse(HubSpotSearchMixin._is_unsatisfiable([[">", "amount", "10"], ["<", "amount", 5]]))
+        self.assertFalse(HubSpotSearchMixin._is_unsatisfiable([["is null", "name", None], ["!=", "city", "a"]]))
+
+    def test_build_search_sorts(self):
+        order_by = parse_sql("SELECT * FROM t ORDER BY id DESC").order_by
+        self.assertEqual(
+            HubSpotSearchMixin._build_search_sorts(order_by),
+            [{"propertyName": "hs_object_id", "direction": "DESCENDING"}]
+        )
+
+        order_by = parse_sql("SELECT * FROM t ORDER BY name, city").order_by
+        self.assertIsNone(HubSpotSearchMixin._build_search_sorts(order_by))
+
+    def test_objects_to_dataframe_uses_requested_properties(self):
+        df = HubSpotSearchMixin._objects_to_dataframe(make_objects(2), ["name", "missing"])
+
+        self.assertEqual(list(df.columns), ["id", "name", "missing"])
+        self.assertEqual(df["name"].tolist(), ["name0", "name1"])
+        self.assertTrue(df["missing"].isna().all())
+
+
+class RateLimitedError(Exception):
+    status = 429
+    headers = {"Retry-After": "7"}
+
+
+class TestRetry(unittest.TestCase):
+    """Tests for the retry decorator."""
+
+    @patch("mindsdb.integrations.handlers.hubspot_handler.utils.rate_limiter.time.sleep")
+    def test_retry_waits_for_retry_after(self, sleep):
+        calls = []
+
+        @with_retry(max_retries=3)
+        def call_api():
+            calls.append(1)
+            if len(calls) == 1:
+                raise RateLimitedError()
+            return "ok"
+
+        self.assertEqual(call_api(), "ok")
+        self.assertEqual(len(calls), 2)
+        wait_time = sleep.call_args.args[0]
+        self.assertGreaterEqual(wait_time, 7)
+        self.assertLessEqual(wait_time, 8)
+
+    @patch("mindsdb.integrations.handlers.hubspot_handler.utils.rate_limiter.time.sleep")
+    def test_retry_after_waits_do_not_spend_retries(self, sleep):
+        calls = []
+
+        @with_retry(max_retries=1)
+        def call_api():
+            calls.append(1)
+            if len(calls) <= 3:
+                raise RateLimitedError()
+            return "ok"
+
+        self.assertEqual(call_api(), "ok")
+        self.assertEqual(sleep.call_count, 3)
+
+    @patch("mindsdb.integrations.handlers.hubspot_handler.utils.rate_limiter.time.sleep")
+    def test_retry_waits_for_exhausted_secondly_budget(self, sleep):
+        error = RateLimitedError()
+        error.headers = {"X-HubSpot-RateLimit-Secondly-Remaining": "0"}
+        calls = []
+
+        @with_retry(max_retries=0)
+        def call_api():
+            calls.append(1)
+            if len(calls) == 1:
+                raise error
+            return "ok"
+
+        self.assertEqual(call_api(), "ok")
+        self.assertGreaterEqual(sleep.call_args.args[0], 1)
+
+    @patch(
+        "mindsdb.integrations.handlers.hubspot_handler.utils.rate_limiter.random.uniform",
+        side_effect=lambda low, high: high,
+    )
+    @patch("mindsdb.integrations.handlers.hubspot_handler.utils.rate_limiter.time.sleep")
+    def test_retry_backs_off_with_capped_full_jitter(self, sleep, uniform):
+        error = RateLimitedError()
+        error.status = 503
+        error.headers = {}
+
+        @with_retry(max_retries=4, max_backoff=5)
+        def call_api():
+            raise error
+
+        with self.assertRaises(HubSpotAPIError):
+            call_api()
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], [1, 2, 4, 5])
+        self.assertTrue(all(c.args[0] == 0 for c in uniform.call_args_list))
+
+
+class TestCompaniesTable(unittest.TestCase):
+    """Tests for the companies table fetch paths."""
+
+    def setUp(self):
+        self.client = MagicMock()
+        self.handler = HubspotHandler("hubspot", connection_data={"access_token": "test_token"})
+        self.handler.connection = self.client
+        self.handler.is_connected = True
+        self.table = self.handler._tables["companies"]
+
+    def test_select_pages_until_limit(self):
+        get_page = make_page_fetcher(make_objects(250))
+        self.client.crm.companies.basic_api.get_page = get_page
+
+        df = self.table.select(parse_sql("SELECT id, name FROM companies LIMIT 130"))
+
+        self.assertEqual(len(df), 130)
+        self.assertEqual(list(df.columns), ["id", "name"])
+        self.assertEqual(get_page.calls[0]["properties"], ["name"])
+
+    def test_select_id_only_requests_a_single_property(self):
+        get_page = make_page_fetcher(make_objects(3))
+        self.client.crm.companies.basic_api.get_page = get_page
+
+        df = self.table.select(parse_sql("SELECT id FROM companies"))
+
+        self.assertEqual(get_page.calls[0]["properties"], ["hs_object_id"])
+        self.assertEqual(df.columns.tolist(), ["id"])
+        self.client.crm.properties.core_api.get_all.assert_not_called()
+
+    def test_select_fetches_columns_filtered_locally(self):
+        get_page = make_page_fetcher(make_objects(3))
+        self.client.crm.companies.basic_api.get_page = get_page
+
+        self.table.select(parse_sql("SELECT name FROM companies WHERE city = 'city1' OR name = 'x' ORDER BY city"))
+
+        self.assertEqual(get_page.calls[0]["properties"], ["name", "city"])
+
+    @patch("mindsdb.integrations.handlers.hubspot_handler.utils.rate_limiter.time.sleep")
+    def test_select_retries_rate_limited_page(self, sleep):
+        get_page = make_page_fetcher(make_objects(3))
+        self.client.crm.companies.basic_api.get_page.side_effect = [
+            RateLimitedError(),
+            get_page(limit=100, _preload_content=False),
+        ]
+
+        df = self.table.select(parse_sql("SELECT id, name FROM companies"))
+
+        self.assertEqual(len(df), 3)
+        sleep.assert_called_once()
+
+    def test_select_returns_typed_columns(self):
+        objects = [
+            SimplePublicObject(
+                id="1",
+                properties={"createdate": "2024-01-15T10:30:00Z", "annualrevenue": "1500.5", "industry": "RETAIL"},
+            ),
+            SimplePublicObject(
+                id="2",
+                properties={"createdate": "2024-03-01T08:00:00Z", "annualrevenue": None, "industry": "RETAIL"},
+            ),
+        ]
+        self.client.crm.companies.basic_api.get_page = make_page_fetcher(objects)
+
+        df = self.table.select(parse_sql("SELECT id, createdate, annualrevenue, industry FROM companies"))
+
+        self.assertEqual(str(df["createdate"].dtype), "datetime64[ns, UTC]")
+        self.assertEqual(df["annualrevenue"].iloc[0], 1500.5)
+        self.assertTrue(df["annualrevenue"].isna().iloc[1])
+        self.assertEqual(df["industry"].dtype, "category")
+        self.assertEqual(df["industry"].tolist(), ["RETAIL", "RETAIL"])
+
+    def test_update_searches_only_filtered_columns(self):
+        do_search = make_searcher(make_objects(3, properties=("city",)))
+        self.client.crm.companies.search_api.do_search = do_search
+
+        self.table.update(parse_sql("UPDATE companies SET name = 'x' WHERE city = 'city1'"))
+
+        self.assertEqual(do_search.calls[0]["properties"], ["city"])
+        self.assertEqual(do_search.calls[0]["filterGroups"][0]["filters"][0]["propertyName"], "city")
+        self.client.crm.companies.basic_api.get_page.assert_not_called()
+        batch_input = self.client.crm.companies.batch_api.update.call_args.args[0]
+        self.assertEqual([company.id for company in batch_input.inputs], ["1"])
+
+    def test_select_limit_zero_does_not_call_hubspot(self):
+        df = self.table.select(parse_sql("SELECT name, createdate, id FROM companies LIMIT 0"))
+
+        self.assertTrue(df.empty)
+        self.assertEqual(df.columns.tolist(), ["name", "createdate", "id"])
+        self.assertEqual(str(df["createdate"].dtype), "datetime64[ns, UTC]")
+        self.client.crm.companies.basic_api.get_page.assert_not_called()
+
+    def test_repeated_select_only_fetches_modified_companies(self):
+        self.handler.row_cache_ttl = 3600
+        objects = [
+            SimplePublicObject(
+                id=str(i), properties={"name": f"name{i}", "hs_lastmodifieddate": "2024-01-01T00:00:00Z"}
+            )
+            for i in range(3)
+        ]
+        get_page = make_page_fetcher(objects)
+        self.client.crm.companies.basic_api.get_page = get_page
+        modified = SimplePublicObject(
+            id="1", properties={"name": "renamed", "hs_lastmodifieddate": "2024-02-01T00:00:00Z"}
+        )
+        do_search = make_searcher([modified])
+        self.client.crm.companies.search_api.do_search = do_search
+
+        self.table.select(parse_sql("SELECT id, name FROM companies"))
+        df = self.table.select(parse_sql("SELECT id, name FROM companies"))
+
+        self.assertEqual(len(get_page.calls), 1)
+        self.assertEqual(do_search.calls[0]["filterGroups"][0]["filters"][0]["value"], "1704067200000")
+        self.assertEqual(df["name"].tolist(), ["name0", "renamed", "name2"])
+
+        self.table.delete_companies(["2"])
+        self.assertEqual(self.handler.row_cache, {})
+
+    def test_repeated_search_is_served_from_cache(self):
+        self.handler.row_cache_ttl = 60
+        do_search = make_searcher(make_objects(3))
+        self.client.crm.companies.search_api.do_search = do_search
+        query = "SELECT id, name FROM companies WHERE city = 'city1'"
+
+        self.table.select(parse_sql(query))
+        df = self.table.select(parse_sql(query))
+        self.assertEqual(len(do_search.calls), 1)
+        self.assertEqual(df["id"].tolist(), ["0", "1", "2"])
+
+        # Stale results are served while the search is repeated in the background
+        key = next(iter(self.handler.search_cache))
+        self.handler.search_cache[key] = (self.handler.search_cache[key][0], time.time() - 90)
+        self.table.select(parse_sql(query))
+        self.handler._search_executor.shutdown(wait=True)
+        self.assertEqual(len(do_search.calls), 2)
+        self.assertLess(time.time() - self.handler.search_cache[key][1], 60)
+
+        self.table.delete_companies(["1"])
+        self.assertEqual(self.handler.search_cache, {})
+
+    def test_batch_writes_are_chunked(self):
+        company_ids = [str(i) for i in range(250)]
+
+        self.table.update_companies(company_ids, {"city": "Berlin"})
+        self.table.delete_companies(company_ids)
+
+        batch_api = self.client.crm.companies.batch_api
+        update_sizes = sorted(len(call.args[0].inputs) for call in batch_api.update.call_args_list)
+        archive_sizes = sorted(len(call.args[0].inputs) for call in batch_api.archive.call_args_list)
+        self.assertEqual(update_sizes, [50, 100, 100])
+        self.assertEqual(archive_sizes, [50, 100, 100])
+
+    def test_chunked_update_and_delete_dispatch_every_chunk_concurrently(self):
+        item_ids = [str(i) for i in range(250)]
+        updated, threads = [], set()
+
+        def update(chunk, values):
+            threads.add(threading.current_thread().name)
+            time.sleep(0.05)
+            updated.append((chunk[0], values))
+
+        def delete(chunk):
+            if chunk[0] == "100":
+                raise Exception("archive failed")
+
+        self.table._batch_update_with_chunking(item_ids, {"city": "Berlin"}, update, "companies")
+
+        self.assertEqual(sorted(updated), [(first_id, {"city": "Berlin"}) for first_id in ["0", "100", "200"]])
+        self.assertGreater(len(threads), 1)
+        self.assertTrue(all(name.startswith("hubspot-batch") for name in threads))
+        executor = self.handler._batch_executor
+        with patch("mindsdb.integrations.handlers.hubspot_handler.utils.rate_limiter.time.sleep"):
+            with self.assertRaisesRegex(Exception, r"1/3 batch\(es\) failed \(batches: \[2\]\)"):
+                self.table._batch_delete_with_chunking(item_ids, delete, "companies")
+        self.assertIs(self.handler._batch_executor, executor)
+
+
+class TestContactsTable(unittest.TestCase):
+    """Tests for the contacts table fetch paths."""
+
+    def setUp(self):
+        self.client = MagicMock()
+        self.handler = HubspotHandler("hubspot", connection_data={"access_token": "test_token"})
+        self.handler.connection = self.client
+        self.handler.is_connected = True
+        self.table = self.handler._tables["contacts"]
+
+    def test_select_pages_until_limit(self):
+        get_page = make_page_fetcher(make_objects(250, properties=("email",)))
+        self.client.crm.contacts.basic_api.get_page = get_page
+
+        df = self.table.select(parse_sql("SELECT id, email FROM contacts LIMIT 130"))
+
+        self.assertEqual(len(df), 130)
+        self.assertEqual([call["limit"] for call in get_page.calls], [100, 30])
+        self.assertEqual(df["email"].iloc[-1], "email129")
+
+    def test_select_builds_dataframe_from_search_results(self):
+        objects = make_objects(3, properties=("email", "city"))
+        objects[1].properties.pop("city")
+        self.client.crm.contacts.search_api.do_search = make_searcher(objects)
+
+        df = self.table.select(parse_sql("SELECT id, email, city FROM contacts WHERE email = 'a@b.c'"))
+
+        self.assertEqual(df["id"].tolist(), ["0", "1", "2"])
+        self.assertEqual(df["city"].tolist(), ["city0", None, "city2"])
+
+    def test_search_fetches_remaining_pages_concurrently(self):
+        do_search = make_searcher(make_objects(250, properties=("email",)))
+        self.client.crm.contacts.search_api.do_search = do_search
+
+        df = self.table.search_contacts([{"propertyName": "email", "operator": "HAS_PROPERTY"}], ["email"])
+
+        self.assertEqual(df["id"].tolist(), [str(i) for i in range(250)])
+        self.assertEqual(sorted(call.get("after") or "0" for call in do_search.calls), ["0", "100", "200"])
+
+    def test_batch_writes_are_chunked(self):
+        self.table.delete_contacts([str(i) for i in range(250)])
+
+        batch_sizes = sorted(
+            len(call.args[0].inputs) for call in self.client.crm.contacts.batch_api.archive.call_args_list
+        )
+        self.assertEqual(batch_sizes, [50, 100, 100])
+
+    def test_insert_falls_back_to_minimal_columns(self):
+        query = parse_sql("INSERT INTO contacts (email, firstname, lastname) VALUES ('a@b.c', 'A', 'B')")
+        query.values = [[value.value for value in row] for row in query.values]
+
+        with patch.object(self.handler, "get_properties_cache", side_effect=Exception("unavailable")):
+            self.table.insert(query)
+
+        inputs = self.client.crm.contacts.batch_api.create.call_args.args[0].inputs
+        self.assertEqual(inputs[0].properties, {"email": "a@b.c", "firstname": "A", "lastname": "B"})
+
+    def test_update_filters_searched_contacts(self):
+        self.client.crm.contacts.search_api.do_search = make_searcher(make_objects(3, properties=("email",)))
+
+        self.table.update(parse_sql("UPDATE contacts SET city = 'x' WHERE email LIKE '%email1%'"))
+
+        inputs = self.client.crm.contacts.batch_api.update.call_args.args[0].inputs
+        self.assertEqual([contact.id for contact in inputs], ["1"])
+
+
+class TestDealsTable(unittest.TestCase):
+    """Tests for the deals table fetch paths."""
+
+    def setUp(self):
+        self.client = MagicMock()
+        self.handler = HubspotHandler("hubspot", connection_data={"access_token": "test_token"})
+        self.handler.connection = self.client
+        self.handler.is_connected = True
+        self.table = self.handler._tables["deals"]
+
+    def test_select_builds_frame_from_deals(self):
+        self.client.crm.deals.get_all.return_value = make_objects(3, properties=("dealname", "amount"))
+
+        df = self.table.select(parse_sql("SELECT id, dealname FROM deals"))
+
+        self.assertEqual(df.columns.tolist(), ["id", "dealname"])
+        self.assertEqual(df["dealname"].tolist(), ["dealname0", "dealname1", "dealname2"])
+
+    def test_get_deals_has_a_column_per_requested_property(self):
+        self.client.crm.deals.get_all.return_value = make_objects(2, properties=("dealname",))
+
+        deals = self.table.get_deals(properties=["dealname", "amount"])
+
+        self.assertEqual(deals.columns.tolist(), ["id", "dealname", "amount"])
+        self.assertTrue(deals["amount"].isna().all())
+
+    def test_search_requests_remaining_pages_concurrently(self):
+        do_search = make_searcher(make_objects(250, properties=("dealname",)))
+        self.client.crm.deals.search_api.do_search = do_search
+
+        deals = self.table.search_deals([{"propertyName": "dealname", "operator": "HAS_PROPERTY"}], ["dealname"])
+
+        self.assertEqual(deals["id"].tolist(), [str(i) for i in range(250)])
+        self.assertEqual(sorted((c.get("after", ""), c["limit"]) for c in do_search.calls), [
+            ("", 100), ("100", 100), ("200", 50)
+        ])
+
+
+class TestCallsTable(unittest.TestCase):
+    """Tests for the calls table search path."""
+
+    def setUp(self):
+        self.client = MagicMock()
+        self.handler = HubspotHandler("hubspot", connection_data={"access_token": "test_token"})
+        self.handler.connection = self.client
+        self.handler.is_connected = True
+        self.table = self.handler._tables["calls"]
+
+    def test_search_requests_remaining_pages_by_offset(self):
+        do_search = make_searcher(make_objects(250))
+        self.client.crm.objects.search_api.do_search = lambda object_type, **kwargs: do_search(**kwargs)
+
+        calls = self.table.search_calls([{"propertyName": "name", "operator": "EQ", "value": "x"}], ["name"], 230)
+
+        self.assertEqual(calls.columns.tolist(), ["id", "name"])
+        self.assertEqual(calls["id"].tolist(), [str(i) for i in range(230)])
+        self.assertEqual(sorted((c.get("after", ""), c["limit"]) for c in do_search.calls), [
+            ("", 100), ("100", 100), ("200", 30)
+        ])
+
+    def test_select_builds_frame_from_page(self):
+        get_page = make_page_fetcher(make_objects(3, properties=("hs_call_title", "hs_timestamp")))
+        self.client.crm.objects.basic_api.get_page = lambda object_type, **kwargs: get_page(**kwargs)
+
+        df = self.table.select(parse_sql("SELECT id, hs_call_title FROM calls LIMIT 10"))
+
+        self.assertEqual(df.columns.tolist(), ["id", "hs_call_title"])
+        self.assertEqual(df["hs_call_title"].tolist(), ["hs_call_title0", "hs_call_title1", "hs_call_title2"])
+
+    def test_get_calls_pages_through_all_calls_with_full_pages(self):
+        get_page = make_page_fetcher(make_objects(250, properties=("hs_call_title",)))
+        self.client.crm.objects.basic_api.get_page = lambda object_type, **kwargs: get_page(**kwargs)
+
+        calls = self.table.get_calls(properties=["hs_call_title"])
+
+        self.assertEqual(len(calls), 250)
+        self.assertEqual([c["limit"] for c in get_page.calls], [100, 100, 100])
+
+    def test_delete_searches_only_matching_calls(self):
+        do_search = make_searcher(make_objects(2, properties=("hs_call_status",)))
+        self.client.crm.objects.search_api.do_search = lambda object_type, **kwargs: do_search(**kwargs)
+
+        with patch.object(self.table, "delete_calls") as delete_calls:
+            self.table.delete(parse_sql("DELETE FROM calls WHERE hs_call_status = 'hs_call_status1'"))
+
+        self.client.crm.objects.basic_api.get_page.assert_not_called()
+        self.assertEqual(do_search.calls[0]["filterGroups"][0]["filters"][0]["propertyName"], "hs_call_status")
+        delete_calls.assert_called_once_with(["1"])
+
+    def test_update_by_id_uses_search_matches_directly(self):
+        do_search = make_searcher(make_objects(2, properties=("hs_object_id",)))
+        self.client.crm.objects.search_api.do_search = lambda object_type, **kwargs: do_search(**kwargs)
+
+        with patch.object(self.table, "update_calls") as update_calls, \
+                patch("mindsdb.integrations.handlers.hubspot_handler.tables.crm.calls_table.UPDATEQueryExecutor") \
+                as executor:
+            self.table.update(parse_sql("UPDATE calls SET hs_call_status = 'COMPLETED' WHERE id IN ('0', '1', '9')"))
+
+        executor.assert_not_called()
+        self.assertEqual(do_search.calls[0]["filterGroups"][0]["filters"], [
+            {"propertyName": "hs_object_id", "operator": "IN", "values": ["0", "1", "9"]}
+        ])
+        update_calls.assert_called_once_with(["0", "1"], {"hs_call_status": "COMPLETED"})
+
+    def test_writes_are_sent_in_batches(self):
+        call_ids = [str(i) for i in range(150)]
+        batch_api = self.client.crm.objects.batch_api
+
+        self.table.create_calls([{"hs_timestamp": "2024-01-01T00:00:00Z"}] * 150)
+        self.table.update_calls(call_ids, {"hs_call_status": "COMPLETED"})
+        self.table.delete_calls(call_ids)
+
+        def batch_sizes(method, argument):
+            bodies = [call.kwargs[argument] for call in method.call_args_list]
+            return sorted(len(body["inputs"] if isinstance(body, dict) else body.inputs) for body in bodies)
+
+        self.assertEqual(batch_sizes(batch_api.create, "batch_input_simple_public_object_input_for_create"), [50, 100])
+        self.assertEqual(batch_sizes(batch_api.update, "batch_input_simple_public_object_batch_input"), [50, 100])
+        self.assertEqual(batch_sizes(batch_api.archive, "batch_input_simple_public_object_id"), [50, 100])
+        self.assertIn({"id": "0", "properties": {"hs_call_status": "COMPLETED"}}, [
+            call.kwargs["batch_input_simple_public_object_batch_input"]["inputs"][0]
+            for call in batch_api.update.call_args_list
+        ])
+
+
+class TestAppointmentsTable(unittest.TestCase):
+    """Tests for the appointments table, served by the generic objects API."""
+
+    def setUp(self):
+        self.client = MagicMock()
+        self.handler = HubspotHandler("hubspot", connection_data={"access_token": "test_token"})
+        self.handler.connection = self.client
+        self.handler.is_connected = True
+        # Appointments are not registered by the handler, so the table is built directly
+        self.table = AppointmentsTable(self.handler)
+
+    def set_searcher(self, objects):
+        do_search = make_searcher(objects)
+
+        def search(object_type, public_object_search_request, **kwargs):
+            return do_search(public_object_search_request, **kwargs)
+
+        self.client.crm.objects.search_api.do_search = search
+        return do_search
+
+    def test_update_searches_matching_appointments(self):
+        do_search = self.set_searcher(make_objects(3, properties=("hs_meeting_title",)))
+
+        self.table.update(parse_sql(
+            "UPDATE appointments SET hs_meeting_body = 'x' WHERE hs_meeting_title = 'hs_meeting_title1'"
+        ))
+
+        self.client.crm.objects.basic_api.get_page.assert_not_called()
+        self.assertEqual(do_search.calls[0]["properties"], ["hs_meeting_title"])
+        inputs = self.client.crm.objects.batch_api.update.call_args.kwargs[
+            "batch_input_simple_public_object_batch_input"
+        ].inputs
+        self.assertEqual([appointment.id for appointment in inputs], ["1"])
+
+    def test_delete_by_ids_skips_search(self):
+        self.client.crm.objects.batch_api.read.return_value = SimpleNamespace(results=make_objects(1))
+
+        self.table.delete(parse_sql("DELETE FROM appointments WHERE id IN ('0', '404')"))
+
+        self.client.crm.objects.search_api.do_search.assert_not_called()
+        read_input = self.client.crm.objects.batch_api.read.call_args.kwargs["batch_read_input_simple_public_object_id"]
+        self.assertEqual(read_input.properties, ["hs_object_id"])
+        archive_kwargs = self.client.crm.objects.batch_api.archive.call_args.kwargs
+        self.assertEqual([obj.id for obj in archive_kwargs["batch_input_simple_public_object_id"].inputs], ["0"])
+
+    def test_select_pages_until_limit(self):
+        get_page = make_page_fetcher(make_objects(250, properties=("hs_meeting_title",)))
+        self.client.crm.objects.basic_api.get_page = get_page
+
+        df = self.table.select(parse_sql("SELECT id, hs_meeting_title FROM appointments LIMIT 130"))
+
+        self.assertEqual(len(df), 130)
+        self.assertEqual([call["limit"] for call in get_page.calls], [100, 30])
+
+    def test_select_returns_typed_timestamps(self):
+        objects = make_objects(2, properties=("hs_meeting_title", "createdate"))
+        objects[0].properties["createdate"] = "2024-01-02T03:04:05.678Z"
+        objects[1].properties["createdate"] = None
+        self.client.crm.objects.basic_api.get_page = make_page_fetcher(objects)
+
+        df = self.table.select(parse_sql("SELECT id, hs_meeting_title, createdate FROM appointments"))
+
+        self.assertEqual(str(df["createdate"].dtype), "datetime64[ns, UTC]")
+        self.assertEqual(df["createdate"].iloc[0].isoformat(), "2024-01-02T03:04:05.678000+00:00")
+        self.assertTrue(df["createdate"].isna().iloc[1])
+        self.assertEqual(df["hs_meeting_title"].dtype, object)
+
+    def test_search_fetches_remaining_pages_concurrently(self):
+        do_search = self.set_searcher(make_objects(250, properties=("hs_meeting_title",)))
+
+        df = self.table.search_objects([{"propertyName": "hs_meeting_title", "operator": "HAS_PROPERTY"}])
+
+        self.assertEqual(df["id"].tolist(), [str(i) for i in range(250)])
+        self.assertEqual(sorted(call.get("after") or "0" for call in do_search.calls), ["0", "100", "200"])
+
+    def test_repeated_select_only_fetches_modified_appointments(self):
+        self.handler.row_cache_ttl = 60
+        objects = make_objects(3, properties=("hs_meeting_title", "hs_lastmodifieddate"))
+        for i, obj in enumerate(objects):
+            obj.properties["hs_lastmodifieddate"] = f"2024-01-0{i + 1}T00:00:00Z"
+        get_page = make_page_fetcher(objects)
+        self.client.crm.objects.basic_api.get_page = get_page
+        do_search = self.set_searcher(objects[2:])
+        query = "SELECT id, hs_meeting_title FROM appointments"
+
+        self.table.select(parse_sql(query))
+        df = self.table.select(parse_sql(query))
+
+        self.assertEqual(len(get_page.calls), 1)
+        self.assertEqual(do_search.calls[0]["filterGroups"][0]["filters"][0]["operator"], "GTE")
+        self.assertEqual(df["id"].tolist(), ["0", "1", "2"])
+
+        self.table.delete_objects(["0"])
+        self.table.select(parse_sql(query))
+        self.assertEqual(len(get_page.calls), 2)
+
+    def test_select_with_contradicting_conditions_does_not_call_hubspot(self):
+        df = self.table.select(parse_sql(
+            "SELECT id, createdate FROM appointments WHERE hs_meeting_title = 'a' AND hs_meeting_title = 'b'"
+        ))
+
+        self.client.crm.objects.search_api.do_search.assert_not_called()
+        self.assertEqual(df.columns.tolist(), ["id", "createdate"])
+        self.assertEqual(str(df["createdate"].dtype), "datetime64[ns, UTC]")
+        self.assertTrue(df.empty)
+
+    def test_select_by_ids_uses_batch_read(self):
+        self.client.crm.objects.batch_api.read.return_value = SimpleNamespace(
+            results=make_objects(2, properties=("hs_meeting_title",))
+        )
+
+        df = self.table.select(parse_sql("SELECT id, hs_meeting_title FROM appointments WHERE id IN ('0', '1', '0')"))
+
+        self.client.crm.objects.search_api.do_search.assert_not_called()
+        read_input = self.client.crm.objects.batch_api.read.call_args.kwargs["batch_read_input_simple_public_object_id"]
+        self.assertEqual([obj.id for obj in read_input.inputs], ["0", "1"])
+        self.assertEqual(df["hs_meeting_title"].tolist(), ["hs_meeting_title0", "hs_meeting_title1"])
+
+    def test_select_builds_dataframe_from_search_results(self):
+        objects = make_objects(3, properties=("hs_meeting_title", "hs_meeting_outcome"))
+        objects[1].properties.pop("hs_meeting_outcome")
+        self.set_searcher(objects)
+
+        df = self.table.select(parse_sql(
+            "SELECT id, hs_meeting_outcome FROM appointments WHERE hs_meeting_title = 'x'"
+        ))
+
+        self.assertEqual(df.columns.tolist(), ["id", "hs_meeting_outcome"])
+        self.assertEqual(df["hs_meeting_outcome"].tolist(), ["hs_meeting_outcome0", None, "hs_meeting_outcome2"])
+
+    def test_select_pushes_order_by_to_search(self):
+        objects = make_objects(3, properties=("hs_meeting_title",))[::-1]
+        do_search = self.set_searcher(objects)
+
+        df = self.table.select(parse_sql(
+            "SELECT id, hs_meeting_title FROM appointments WHERE hs_meeting_title != 'x' "
+            "ORDER BY hs_meeting_title DESC LIMIT 2"
+        ))
+
+        self.assertEqual(do_search.calls[0]["sorts"], [{"propertyName": "hs_meeting_title", "direction": "DESCENDING"}])
+        self.assertEqual(do_search.calls[0]["limit"], 2)
+        self.assertEqual(df["id"].tolist(), ["2", "1"])
+
+    def test_concurrent_identical_searches_share_one_request(self):
+        release = threading.Event()
+        do_search = make_searcher(make_objects(3, properties=("hs_meeting_title",)))
+
+        def search(object_type, public_object_search_request, **kwargs):
+            release.wait(5)
+            return do_search(public_object_search_request, **kwargs)
+
+        self.client.crm.objects.search_api.do_search = search
+        query = "SELECT id, hs_meeting_title FROM appointments WHERE hs_meeting_title != 'x'"
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(self.table.select(parse_sql(query))))
+            for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.1)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(do_search.calls), 1)
+        self.assertEqual([df["id"].tolist() for df in results], [["0", "1", "2"]] * 3)
+
+    @patch("mindsdb.integrations.handlers.hubspot_handler.utils.rate_limiter.time.sleep")
+    def test_search_retries_rate_limited_page(self, sleep):
+        do_search = make_searcher(make_objects(3, properties=("hs_meeting_title",)))
+        self.client.crm.objects.search_api.do_search = MagicMock(side_effect=[
+            RateLimitedError(),
+            do_search({"limit": 100}, _preload_content=False),
+        ])
+
+        df = self.table.search_objects([{"propertyName": "hs_meeting_title", "operator": "HAS_PROPERTY"}])
+
+        self.assertEqual(df["id"].tolist(), ["0", "1", "2"])
+        self.assertEqual(self.client.crm.objects.search_api.do_search.call_count, 2)
+
+    def test_batch_writes_are_chunked(self):
+        self.table.delete_objects([str(i) for i in range(250)])
+
+        batch_sizes = [
+            len(call.kwargs["batch_input_simple_public_object_id"].inputs)
+            for call in self.client.crm.objects.batch_api.archive.call_args_list
+        ]
+        self.assertEqual(sorted(batch_sizes), [50, 100, 100])
+
+
+def make_associations_response(from_ids, to_ids, type_id=1):
+    """Return a v4 batch associations response linking every `from_ids` object to every `to_ids` object."""
+    return SimpleNamespace(results=[
+        SimpleNamespace(
+            from_=SimpleNamespace(id=from_id),
+            to=[
+                SimpleNamespace(to_object_id=to_id, association_types=[SimpleNamespace(type_id=type_id, label=None)])
+                for to_id in to_ids
+            ],
+        )
+        for from_id in from_ids
+    ])
+
+
+class TestAssociationsTable(unittest.TestCase):
+    """Tests for the associations table."""
+
+    def setUp(self):
+        self.client = MagicMock()
+        self.handler = HubspotHandler("hubspot", connection_data={"access_token": "test_token"})
+        self.handler.connection = self.client
+        self.handler.is_connected = True
+        self.table = self.handler._tables["associations"]
+
+    @staticmethod
+    def make_insert(rows):
+        """Build an INSERT of association rows as the executor passes it to the table."""
+        columns = ["from_object_type", "from_object_id", "to_object_type", "to_object_id"]
+        return ast.Insert(
+            table=ast.Identifier("associations"), columns=[ast.Identifier(parts=[c]) for c in columns], values=rows
+        )
+
+    def test_select_fetches_all_destination_types_concurrently(self):
+        threads = set()
+
+        def get_page(from_object_type, to_object_type, batch_input_public_fetch_associations_batch_request):
+            threads.add(threading.current_thread().name)
+            time.sleep(0.05)
+            if to_object_type == "tickets":
+                raise Exception("invalid association")
+            return make_associations_response(["1"], [f"{to_object_type}-1"])
+
+        self.client.crm.associations.v4.batch_api.get_page = get_page
+
+        df = self.table.select(parse_sql(
+            "SELECT * FROM associations WHERE from_object_type = 'deals' AND from_object_id = '1'"
+        ))
+
+        self.assertEqual(df["to_object_type"].tolist(), ["contacts", "companies", "line_items"])
+        self.assertEqual(df["to_object_id"].tolist(), ["contacts-1", "companies-1", "line_items-1"])
+        self.assertGreater(len(threads), 1)
+
+    def test_select_skips_object_pairs_without_association_type(self):
+        get_page = self.client.crm.associations.v4.batch_api.get_page
+        get_page.return_value = make_associations_response([], [])
+
+        self.table.get_associations("contacts", ["1"])
+        self.table.get_associations("contacts", ["1"], to_object_type="line_items")
+        self.table.get_associations("notes", ["1"])
+
+        requested = [(c.kwargs["from_object_type"], c.kwargs["to_object_type"]) for c in get_page.call_args_list]
+        self.assertEqual(set(requested[:3]), {
+            ("contacts", "companies"), ("contacts", "deals"), ("contacts", "tickets")
+        })
+        self.assertEqual(requested[3], ("contacts", "line_items"))
+        self.assertEqual({to_type for from_type, to_type in requested[4:]}, {
+            "contacts", "companies", "deals", "tickets", "line_items"
+        })
+
+    def test_get_associations_builds_typed_frame(self):
+        response = make_associations_response(["1", "2"], ["10"], type_id=279)
+        response.results[1].to[0].association_types = []
+        self.client.crm.associations.v4.batch_api.get_page.return_value = response
+
+        df = self.table.get_associations("contacts", ["1", "2"], to_object_type="companies")
+
+        self.assertEqual(tuple(df.columns), self.table.get_columns())
+        self.assertEqual(df["from_object_id"].tolist(), ["1", "2"])
+        self.assertEqual(df["to_object_type"].tolist(), ["companies", "companies"])
+        self.assertEqual(str(df["association_type_id"].dtype), "Int64")
+        self.assertEqual(str(df["from_object_type"].dtype), "category")
+        self.assertEqual(df["from_object_type"].tolist(), ["contacts", "contacts"])
+        self.assertEqual(str(df["association_label"].dtype), "category")
+        self.assertEqual(df["association_type_id"].iloc[0], 279)
+        self.assertTrue(pd.isna(df["association_type_id"].iloc[1]))
+
+    def test_select_stops_parsing_once_limit_is_reached(self):
+        def get_page(from_object_type, to_object_type, batch_input_public_fetch_associations_batch_request):
+            return make_associations_response(["1"], [f"{to_object_type}-1", f"{to_object_type}-2"])
+
+        self.client.crm.associations.v4.batch_api.get_page = get_page
+
+        df = self.table.get_associations("deals", ["1"], limit=2)
+        self.assertEqual(df["to_object_type"].tolist(), ["contacts", "contacts"])
+
+        df = self.table.select(parse_sql(
+            "SELECT * FROM associations WHERE from_object_type = 'deals' AND from_object_id = '1' "
+            "AND to_object_id = 'line_items-2' LIMIT 1"
+        ))
+        self.assertEqual(df["to_object_id"].tolist(), ["line_items-2"])
+
+    def test_select_with_limit_zero_fetches_nothing(self):
+        df = self.table.select(parse_sql(
+            "SELECT * FROM associations WHERE from_object_type = 'contacts' AND from_object_id = '1' LIMIT 0"
+        ))
+
+        self.assertTrue(df.empty)
+        self.assertEqual(tuple(df.columns), self.table.get_columns())
+        self.client.crm.associations.v4.batch_api.get_page.assert_not_called()
+
+    def test_apply_conditions_combines_all_filters(self):
+        df = pd.DataFrame({
+            "to_object_id": ["10", "20", "30", "40"],
+            "association_type_id": pd.array([1, 1, None, 2], dtype="Int64"),
+        })
+
+        filtered = self.table._apply_conditions(df, [
+            ["!=", "to_object_id", "20"],
+            ["in", "association_type_id", [1, 2]],
+            ["not in", "to_object_id", ["40"]],
+            ["=", "unknown_column", "x"],
+        ])
+
+        self.assertEqual(filtered["to_object_id"].tolist(), ["10"])
+
+    def test_insert_creates_each_object_pair_in_its_own_batch(self):
+        self.table.insert(self.make_insert([
+            ["contacts", "1", "companies", "10"],
+            ["contacts", "2", "deals", "20"],
+            ["contacts", "3", "companies", "30"],
+        ]))
+
+        batches = sorted(
+            (call.kwargs["to_object_type"], [
+                item["to"]["id"] for item in call.kwargs["batch_input_public_association"]["inputs"]
+            ])
+            for call in self.client.crm.associations.v4.batch_api.create.call_args_list
+        )
+        self.assertEqual(batches, [("companies", ["10", "30"]), ("deals", ["20"])])
+
+    def test_insert_reports_failed_object_pair(self):
+        query = self.make_insert([["contacts", "1", "companies", "10"], ["contacts", "2", "notes", "20"]])
+
+        with self.assertRaisesRegex(Exception, "contacts to notes"):
+            self.table.insert(query)
+
+        self.client.crm.associations.v4.batch_api.create.assert_called_once()
+
+    def test_insert_uses_default_type_of_object_pair(self):
+        self.table.create_associations([
+            {"from_object_type": "deals", "from_object_id": "1", "to_object_type": "contacts", "to_object_id": "10"},
+            {"from_object_type": "deals", "from_object_id": "2", "to_object_type": "contacts", "to_object_id": "20",
+             "association_type_id": "3"},
+            {"from_object_type": "deals", "from_object_id": "3", "to_object_type": "contacts", "to_object_id": "30"},
+        ])
+
+        inputs = self.client.crm.associations.v4.batch_api.create.call_args.kwargs[
+            "batch_input_public_association"]["inputs"]
+        self.assertEqual([item["types"] for item in inputs], [
+            [{"associationTypeId": 4}], [{"associationTypeId": 3}], [{"associationTypeId": 4}]
+        ])
+
+
+    def test_delete_archives_every_object_pair(self):
+        self.table.delete(parse_sql(
+            "DELETE FROM associations WHERE from_object_type = 'contacts' AND from_object_id IN ('1', '2') "
+            "AND to_object_type = 'companies' AND to_object_id = '10'"
+        ))
+
+        archive = self.client.crm.associations.v4.batch_api.archive
+        archive.assert_called_once()
+        self.assertEqual(archive.call_args.kwargs["from_object_type"], "contacts")
+        self.assertEqual(archive.call_args.kwargs["batch_input_public_association"]["inputs"], [
+            {"from": {"id": "1"}, "to": {"id": "10"}}, {"from": {"id": "2"}, "to": {"id": "10"}}
+        ])
+
+    def test_delete_builds_object_pairs_a_window_at_a_time(self):
+        to_ids = [str(i) for i in range(500)]
+
+        with patch(
+            "mindsdb.integrations.handlers.hubspot_handler.tables.crm.associations_table.DELETE_WINDOW_SIZE", 300
+        ), patch.object(self.table, "_batch_delete_with_chunking") as delete_with_chunking:
+            self.table.delete_associations("contacts", ["1", "2"], "companies", to_ids)
+
+        windows = [call.args[0] for call in delete_with_chunking.call_args_list]
+        self.assertEqual([len(window) for window in windows], [300, 300, 300, 100])
+        self.assertEqual(windows[0][0], {"from": {"id": "1"}, "to": {"id": "0"}})
+        self.assertEqual(windows[-1][-1], {"from": {"id": "2"}, "to": {"id": "499"}})
+
+    def test_associations_are_cached_per_object(self):
+        self.handler.row_cache_ttl = 60
+        def read(from_object_type, to_object_type, batch_input_public_fetch_associations_batch_request):
+            ids = [i.id for i in batch_input_public_fetch_associations_batch_request.inputs]
+            return make_associations_response([obj_id for obj_id in ids if obj_id != "2"], ["10"])
+
+        get_page = self.client.crm.associations.v4.batch_api.get_page
+        get_page.side_effect = read
+
+        self.table.get_associations("contacts", ["1", "2"], to_object_type="companies")
+        df = self.table.get_associations("contacts", ["1", "2", "3"], to_object_type="companies")
+
+        self.assertEqual(get_page.call_count, 2)
+        requested = get_page.call_args.kwargs["batch_input_public_fetch_associations_batch_request"].inputs
+        self.assertEqual([i.id for i in requested], ["3"])
+        self.assertEqual(df["from_object_id"].tolist(), ["1", "3"])
+
+        self.table.create_associations([
+            {"from_object_type": "companies", "from_object_id": "10", "to_object_type": "contacts", "to_object_id": "2"}
+        ])
+        self.assertEqual(
+            sorted(self.handler.association_cache), [("contacts", "1", "companies"), ("contacts", "3", "companies")]
+        )
+        self.table.delete_associations("contacts", ["1"], "companies", ["10"])
+        self.assertEqual(list(self.handler.association_cache), [("contacts", "3", "companies")])
+
+class TestClient(unittest.TestCase):
+    """Tests for the HubSpot client built by the handler."""
+
+    def test_api_instances_are_reused(self):
+        handler = HubspotHandler("hubspot", connection_data={"access_token": "test_token"})
+        with patch.object(HubspotHandler, "warm_properties_cache"):
+            client = handler.connect()
+
+        basic_api = client.crm.companies.basic_api
+
+        self.assertIs(client.crm.companies.basic_api, basic_api)
+        self.assertIsNot(client.crm.contacts.basic_api, basic_api)
+        self.assertEqual(basic_api.api_client.configuration.access_token, "test_token")
+        self.assertEqual(
+            basic_api.api_client.configuration.connection_pool_maxsize, HubspotHandler.CONNECTION_POOL_MAXSIZE
+        )
+
+    def test_client_is_rebuilt_when_its_token_expires(self):
+        handler = HubspotHandler("hubspot", connection_data={
+            "refresh_token": "refresh", "client_id": "id", "client_secret": "secret",
+        })
+        expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+        tokens = iter(["first", "second"])
+
+        def get_valid_token():
+            return {"access_token": next(tokens), "refresh_token": "refresh", "expires_at": expires_at}
+
+        with patch.object(HubspotHandler, "warm_properties_cache"), \
+                patch.object(handler, "_get_valid_token", side_effect=get_valid_token):
+            client = handler.connect()
+            self.assertIs(handler.connect(), client)
+
+            handler._token_expires_at = datetime.now(timezone.utc)
+            refreshed_client = handler.connect()
+
+        self.assertIsNot(refreshed_client, client)
+        self.assertEqual(refreshed_client.access_token, "second")
+
+
+class TestPropertiesCache(unittest.TestCase):
+    """Tests for the handler-level properties cache."""
+
+    def setUp(self):
+        self.client = MagicMock()
+        self.client.crm.properties.core_api.get_all.return_value = SimpleNamespace(results=[
+            SimpleNamespace(name="name", label="Name", type="string", field_type="text", group_name="info")
+        ])
+        self.handler = HubspotHandler("hubspot", connection_data={"access_token": "test_token"})
+        self.handler.connection = self.client
+        self.handler.is_connected = True
+
+    def test_fresh_entry_is_served_from_cache(self):
+        self.handler.get_properties_cache("companies")
+        self.handler.get_properties_cache("companies")
+
+        self.client.crm.properties.core_api.get_all.assert_called_once()
+
+    def test_entry_near_expiry_is_refreshed_in_background(self):
+        entry = self.handler.get_properties_cache("companies")
+        entry.timestamp = time.time() - self.handler._properties_cache_ttl * 0.9
+
+        served = self.handler.get_properties_cache("companies")
+        self.handler._properties_executor.shutdown(wait=True)
+
+        self.assertIs(served, entry)
+        self.assertEqual(self.client.crm.properties.core_api.get_all.call_count, 2)
+        self.assertIsNot(self.handler._properties_cache["companies"], entry)
+
+    def test_concurrent_misses_share_one_request(self):
+        release = threading.Event()
+        response = self.client.crm.properties.core_api.get_all.return_value
+        self.client.crm.properties.core_api.get_all.side_effect = lambda **kwargs: release.wait(5) and response
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(self.handler.get_properties_cache("companies")))
+            for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.1)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.client.crm.properties.core_api.get_all.assert_called_once()
+        self.assertEqual(len(results), 3)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_connect_warms_properties_cache(self):
+        self.handler.is_connected = False
+        handler_module = "mindsdb.integrations.handlers.hubspot_handler.hubspot_handler"
+        with patch.object(self.handler, "_get_valid_token", return_value={"access_token": "test_token"}), \
+                patch(f"{handler_module}.HubSpot", return_value=self.client):
+            self.handler.connect()
+        self.handler._properties_executor.shutdown(wait=True)
+
+        warmed = {call.kwargs["object_type"] for call in self.client.crm.properties.core_api.get_all.call_args_list}
+        self.assertEqual(warmed, set(HubspotHandler.PROPERTIES_OBJECT_TYPES))
+        self.assertEqual(set(self.handler._properties_cache), set(HubspotHandler.PROPERTIES_OBJECT_TYPES))
+
+    def test_ttl_is_configurable(self):
+        handler = HubspotHandler(
+            "hubspot", connection_data={"access_token": "test_token", "properties_cache_ttl": 60}
+        )
+
+        self.assertEqual(handler._properties_cache_ttl, 60)
+
+    def test_insert_with_unknown_column_refreshes_properties(self):
+        new_property = SimpleNamespace(name="tier", label="Tier", type="string", field_type="text", group_name="info")
+        self.handler.get_properties_cache("companies")
+        self.client.crm.properties.core_api.get_all.return_value.results.append(new_property)
+
+        query = parse_sql("INSERT INTO companies (name, tier) VALUES ('Acme', 'gold')")
+        query.values = [[value.value for value in row] for row in query.values]
+
+        self.handler._tables["companies"].insert(query)
+
+        self.assertEqual(self.client.crm.properties.core_api.get_all.call_count, 2)
+        batch_input = self.client.crm.companies.batch_api.create.call_args.args[0]
+        self.assertEqual(batch_input.inputs[0].properties, {"name": "Acme", "tier": "gold"})
+
+
+if __name__ == "__main__":
+    unittest.main()